@@ -1,3 +1,6 @@
+import decimal
+import string
+
 import numpy as np
 import pandas as pd
 
@@ -172,6 +175,11 @@ class PandasBackend:
 
         self.simple_sort = t.sort_by([t.key])
 
+        self.selective_filter_projection = t[t.low_card_key == 0][
+            t.key,
+            t.timestamp_strings.re_extract('(\\d+):', 1).name('hour'),
+        ]
+
         self.simple_sort_projection = t[['key', 'value']].sort_by(['key'])
 
         self.multikey_sort = t.sort_by(['low_card_key', 'key'])
@@ -206,6 +214,9 @@ class PandasBackend:
     def time_multikey_group_by_with_mutate(self):
         self.multikey_group_by_with_mutate.execute()
 
+    def time_selective_filter_projection(self):
+        self.selective_filter_projection.execute()
+
     def time_simple_sort(self):
         self.simple_sort.execute()
 
@@ -223,3 +234,294 @@ class PandasBackend:
 
     def time_high_card_grouped_rolling(self):
         self.high_card_grouped_rolling.execute()
+
+
+class PandasLargeExpression:
+    def setup(self):
+        n = int(1e3)
+        data = pd.DataFrame(
+            {
+                'key': np.random.choice(100, size=n),
+                'value': np.random.rand(n),
+            }
+        )
+        t = ibis.pandas.connect({'df': data}).table('df')
+
+        # about 5,000 small operations, most of them distinct literals,
+        # combined pairwise to keep the expression shallow
+        terms = [(t.value + i) * (1 + 1 / (i + 2)) for i in range(900)]
+        case = ibis.case()
+        for i in range(100):
+            case = case.when(t.key == i, t.value * i)
+        terms.append(case.else_(0).end())
+        while len(terms) > 1:
+            terms = [
+                terms[i] + terms[i + 1] if i + 1 < len(terms) else terms[i]
+                for i in range(0, len(terms), 2)
+            ]
+        (self.large_expr,) = terms
+
+    def time_large_expr_execution(self):
+        self.large_expr.execute()
+
+
+class PandasDictionaryEncoding:
+    params = [0.0, 0.5]
+    param_names = ['dictionary_encoding_ratio']
+
+    def setup(self, ratio):
+        n = int(5e6)
+        strings = np.array(['value_{:d}'.format(i) for i in range(1000)])
+        data = pd.DataFrame(
+            {
+                'key': strings[np.random.choice(1000, size=n)],
+                'other_key': strings[np.random.choice(10, size=n)],
+                'value': np.random.rand(n),
+            }
+        )
+        lookup = pd.DataFrame({'key': strings, 'id': np.arange(1000)})
+        client = ibis.pandas.connect({'df': data, 'lookup': lookup})
+        t = client.table('df')
+        lookup = client.table('lookup')
+
+        self.group_by = t.groupby(['key', 'other_key']).aggregate(
+            total=t.value.sum()
+        )
+        self.filter = t[t.key == 'value_1'].value.sum()
+        self.join = t.join(lookup, t.key == lookup.key)[t.value, lookup.id]
+
+        ibis.options.pandas.dictionary_encoding_ratio = ratio
+        # read the table once, so that it is encoded before timing
+        t.value.sum().execute()
+
+    def teardown(self, ratio):
+        ibis.options.pandas.dictionary_encoding_ratio = 0.0
+
+    def time_string_group_by(self, ratio):
+        self.group_by.execute()
+
+    def time_string_filter(self, ratio):
+        self.filter.execute()
+
+    def time_string_join(self, ratio):
+        self.join.execute()
+
+
+class PandasStringOperations:
+    def setup(self):
+        n = int(1e6)
+        words = np.array(
+            ['{}_{:d} word'.format(w, i) for i in range(100) for w in 'abc']
+        )
+        data = pd.DataFrame(
+            {
+                'strings': words[np.random.choice(len(words), size=n)],
+                'other': words[np.random.choice(len(words), size=n)],
+            }
+        )
+        client = ibis.pandas.connect({'df': data})
+        t = client.table('df')
+        s = t.strings
+
+        self.like_prefix = s.like('a_1%')
+        self.like_suffix = s.like('%word')
+        self.like_contains = s.like('%_1%')
+        self.like_pattern = s.like('a%1_ w%')
+        self.re_search = s.re_search(r'_\d+ ')
+        self.re_extract = s.re_extract(r'(\w)_(\d+)', 2)
+        self.re_replace = s.re_replace(r'\d+', 'N')
+        self.translate = s.translate(t.other.substr(0, 2), 'xy')
+        self.find_in_set = s.find_in_set(['a_1 word', 'b_2 word', 'c_3 word'])
+
+    def time_like_prefix(self):
+        self.like_prefix.execute()
+
+    def time_like_suffix(self):
+        self.like_suffix.execute()
+
+    def time_like_contains(self):
+        self.like_contains.execute()
+
+    def time_like_pattern(self):
+        self.like_pattern.execute()
+
+    def time_re_search(self):
+        self.re_search.execute()
+
+    def time_re_extract(self):
+        self.re_extract.execute()
+
+    def time_re_replace(self):
+        self.re_replace.execute()
+
+    def time_translate(self):
+        self.translate.execute()
+
+    def time_find_in_set(self):
+        self.find_in_set.execute()
+
+
+class PandasNestedOperations:
+    def setup(self):
+        n = int(1e6)
+        lengths = np.random.randint(0, 8, size=n)
+        data = pd.DataFrame(
+            {
+                'array': [list(range(length)) for length in lengths],
+                'map': [
+                    {'a': length, 'b': 1} if length else None
+                    for length in lengths
+                ],
+                'struct': [{'a': length, 'b': 'b'} for length in lengths],
+            }
+        )
+        client = ibis.pandas.connect({'df': data})
+        t = client.table(
+            'df',
+            schema={
+                'array': 'array<int64>',
+                'map': 'map<string, int64>',
+                'struct': 'struct<a: int64, b: string>',
+            },
+        )
+
+        self.array_expr = t[
+            t.array.length().name('length'),
+            t.array[0].name('first'),
+            t.array[-1].name('last'),
+        ]
+        self.map_expr = t[
+            t.map.length().name('length'),
+            t.map['a'].name('a'),
+            t.map.get('c', 0).name('c'),
+        ]
+        self.struct_expr = t[t.struct.a, t.struct.b]
+
+    def time_array_operations(self):
+        self.array_expr.execute()
+
+    def time_map_operations(self):
+        self.map_expr.execute()
+
+    def time_struct_fields(self):
+        self.struct_expr.execute()
+
+
+class PandasCalendarIntervals:
+    params = ['Y', 'Q', 'M']
+    param_names = ['unit']
+
+    def setup(self, unit):
+        n = int(1e6)
+        data = pd.DataFrame(
+            {
+                'timestamp': pd.to_datetime(
+                    np.random.randint(0, 2 ** 31, size=n), unit='s'
+                ),
+                'count': np.random.randint(-120, 120, size=n),
+            }
+        )
+        client = ibis.pandas.connect({'df': data})
+        t = client.table('df')
+        interval = t['count'].to_interval(unit=unit)
+        self.timestamp_add = t.timestamp + interval
+        self.date_sub = t.timestamp.date() - interval
+
+    def time_timestamp_add_interval(self, unit):
+        self.timestamp_add.execute()
+
+    def time_date_subtract_interval(self, unit):
+        self.date_sub.execute()
+
+
+class PandasDecimal:
+    params = [True, False]
+    param_names = ['fixed_point']
+
+    def setup(self, fixed_point):
+        n = int(1e6)
+        cents = np.random.randint(-10 ** 8, 10 ** 8, size=n)
+        data = pd.DataFrame(
+            {
+                'key': np.random.choice(list(string.ascii_letters), n),
+                'amount': [decimal.Decimal(int(x)).scaleb(-2) for x in cents],
+                'count': np.random.randint(0, 100, size=n),
+            }
+        )
+        self.client = ibis.pandas.connect({'df': data})
+        t = self.client.table(
+            'df',
+            schema={
+                'key': 'string',
+                'amount': 'decimal(12, 2)',
+                'count': 'int64',
+            },
+        )
+        self.sum = t.amount.sum()
+        self.grouped_sum = t.group_by('key').aggregate(total=t.amount.sum())
+        self.arithmetic = (t.amount * t['count'] + 1).sum()
+        self.compare = t.amount > 100
+        self.cast = t['count'].cast('decimal(12, 2)').sum()
+        self.option = ibis.config.option_context(
+            'pandas.fixed_point_decimals', fixed_point
+        )
+        self.option.__enter__()
+        # columns are scaled once per table
+        self.client.table_data('df', t.schema())
+
+    def teardown(self, fixed_point):
+        self.option.__exit__(None, None, None)
+
+    def time_sum(self, fixed_point):
+        self.sum.execute()
+
+    def time_grouped_sum(self, fixed_point):
+        self.grouped_sum.execute()
+
+    def time_multiply_add_sum(self, fixed_point):
+        self.arithmetic.execute()
+
+    def time_compare(self, fixed_point):
+        self.compare.execute()
+
+    def time_cast_integers(self, fixed_point):
+        self.cast.execute()
+
+
+class PandasSchemaApplyTo:
+    params = ['conforming', 'converted']
+    param_names = ['columns']
+
+    def setup(self, columns):
+        n = 1000
+        types = [
+            ('int64', np.arange(n), dt.int64, dt.int32),
+            ('float64', np.random.randn(n), dt.float64, dt.float32),
+            (
+                'string',
+                np.random.choice(list(string.ascii_letters), n).astype(object),
+                dt.string,
+                dt.string,
+            ),
+            (
+                'timestamp',
+                pd.date_range('2000-01-01', periods=n, freq='s').values,
+                dt.timestamp,
+                dt.Timestamp('UTC'),
+            ),
+            ('boolean', np.random.rand(n) > 0.5, dt.boolean, dt.boolean),
+        ]
+        data = {}
+        pairs = []
+        for i in range(500):
+            name, values, conforming, converted = types[i % len(types)]
+            column = '{}_{:d}'.format(name, i)
+            data[column] = values
+            pairs.append(
+                (column, conforming if columns == 'conforming' else converted)
+            )
+        self.df = pd.DataFrame(data)
+        self.schema = ibis.schema(pairs)
+
+    def time_apply_to(self, columns):
+        self.schema.apply_to(self.df.copy(deep=False))
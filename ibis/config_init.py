@@ -66,3 +66,82 @@ with cf.config_prefix('clickhouse'):
 
 with cf.config_prefix('bigquery'):
     cf.register_option('partition_col', 'PARTITIONTIME')
+
+
+pandas_num_threads_doc = """
+Number of threads used to execute independent branches of an expression with
+the pandas backend. The default of 1 executes every operation in the calling
+thread.
+"""
+
+pandas_join_index_cache_size_doc = """
+Number of bytes each pandas client may spend on caching the hash indexes that
+joins build over its tables, so that later joins against the same table and
+key columns reuse them. The least recently used indexes are evicted first.
+The default of 0 disables the cache.
+"""
+
+pandas_num_processes_doc = """
+Number of processes used to compute grouped aggregations with the pandas
+backend. Rows are hash partitioned by their grouping keys and every partition
+is aggregated in a separate process. The default of 1 aggregates in the
+calling process. Requires the fork start method of multiprocessing. When
+``num_threads`` is greater than 1, partitions are aggregated by the threads
+of the execution instead, because forking a process that runs other threads
+is unsafe.
+"""
+
+pandas_partition_min_rows_doc = """
+Smallest number of rows that a grouped aggregation must have for the pandas
+backend to partition it across processes.
+"""
+
+pandas_dictionary_encoding_ratio_doc = """
+Largest ratio of distinct values to rows of a string column of a pandas
+client table for the pandas backend to dictionary encode it as a pandas
+Categorical when reading the table. Encoded columns are grouped, joined and
+compared by their integer codes, and decoded in the results of execution.
+Columns of category type are always encoded. The default of 0.0 disables the
+encoding of string columns.
+"""
+
+pandas_fixed_point_decimals_doc = """
+Whether the pandas backend computes columns of decimal types of at most 18
+digits as their values scaled to 64-bit integers, so that arithmetic,
+comparisons, rounding, casts and sums don't compute with one Python object
+per value. Values are converted to decimal.Decimal objects, with as many
+digits after the decimal point as the scale of their type, in the results of
+execution.
+"""
+
+with cf.config_prefix('pandas'):
+    cf.register_option(
+        'num_threads', 1, pandas_num_threads_doc, validator=cf.is_int
+    )
+    cf.register_option(
+        'join_index_cache_size',
+        0,
+        pandas_join_index_cache_size_doc,
+        validator=cf.is_int,
+    )
+    cf.register_option(
+        'num_processes', 1, pandas_num_processes_doc, validator=cf.is_int
+    )
+    cf.register_option(
+        'partition_min_rows',
+        100000,
+        pandas_partition_min_rows_doc,
+        validator=cf.is_int,
+    )
+    cf.register_option(
+        'dictionary_encoding_ratio',
+        0.0,
+        pandas_dictionary_encoding_ratio_doc,
+        validator=cf.is_float,
+    )
+    cf.register_option(
+        'fixed_point_decimals',
+        True,
+        pandas_fixed_point_decimals_doc,
+        validator=cf.is_bool,
+    )
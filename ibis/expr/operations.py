@@ -2918,7 +2918,9 @@ class Literal(ValueOp):
         aren't eminently hashable like an ``array<array<int64>>``.
 
         """
-        return hash(self.dtype._literal_value_hash_key(self.value))
+        if not hasattr(self, '_hash'):
+            self._hash = hash(self.dtype._literal_value_hash_key(self.value))
+        return self._hash
 
 
 class NullLiteral(Literal):
@@ -3,6 +3,7 @@ from pathlib import Path
 import ibis
 import ibis.expr.types as ir
 from ibis.pandas.core import execute_and_reset
+from ibis.pandas.streaming import execute_chunked
 
 
 class FileClient(ibis.client.Client):
@@ -33,8 +34,10 @@ class FileClient(ibis.client.Client):
 
         return FileDatabase(name, self, path=path)
 
-    def execute(self, expr, params=None, **kwargs):  # noqa
+    def execute(self, expr, params=None, chunksize=None, **kwargs):  # noqa
         assert isinstance(expr, ir.Expr)
+        if chunksize is not None:
+            return execute_chunked(expr, chunksize, params=params, **kwargs)
         return execute_and_reset(expr, params=params, **kwargs)
 
     def list_tables(self, path=None):
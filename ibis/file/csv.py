@@ -6,14 +6,17 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 from ibis.file.client import FileClient
 from ibis.pandas.api import PandasDialect
-from ibis.pandas.core import execute, execute_node, pre_execute
-from ibis.pandas.execution.selection import physical_tables
+from ibis.pandas.core import execute, execute_node, execute_table_columns
+from ibis.pandas.dispatch import execute_table_chunks
 
 dialect = PandasDialect
 
 
 def _read_csv(path, schema, **kwargs):
     dtypes = dict(schema.to_pandas())
+    usecols = kwargs.get('usecols')
+    if usecols is not None:
+        dtypes = toolz.keyfilter(frozenset(usecols).__contains__, dtypes)
 
     dates = list(toolz.valfilter(lambda s: s == 'datetime64[ns]', dtypes))
     dtypes = toolz.dissoc(dtypes, *dates)
@@ -97,26 +100,21 @@ def csv_read_table(op, client, scope, **kwargs):
     return df
 
 
-@pre_execute.register(ops.Selection, CSVClient)
-def csv_pre_execute_selection(op, client, scope, **kwargs):
-    tables = filter(lambda t: t not in scope, physical_tables(op.table.op()))
-
-    ops = {}
-    for table in tables:
-        path = client.dictionary[table.name]
-        usecols = None
-
-        if op.selections:
-            header = _read_csv(path, schema=table.schema, header=0, nrows=1)
-            usecols = [
-                getattr(s.op(), 'name', None) or s.get_name()
-                for s in op.selections
-            ]
-
-            # we cannot read all the columns that we would like
-            if len(pd.Index(usecols) & header.columns) != len(usecols):
-                usecols = None
+@execute_table_columns.register(CSVClient.table_class, CSVClient, tuple)
+def csv_read_table_columns(op, client, columns):
+    path = client.dictionary[op.name]
+    kwargs = toolz.merge({'usecols': list(columns)}, op.read_csv_kwargs)
+    return _read_csv(path, schema=op.schema, header=0, **kwargs)
 
-        ops[table] = _read_csv(path, table.schema, usecols=usecols, header=0)
 
-    return ops
+@execute_table_chunks.register(
+    CSVClient.table_class, CSVClient, (tuple, type(None)), int
+)
+def csv_read_table_chunks(op, client, columns, chunksize):
+    path = client.dictionary[op.name]
+    kwargs = op.read_csv_kwargs
+    if columns is not None:
+        kwargs = toolz.merge({'usecols': list(columns)}, kwargs)
+    return _read_csv(
+        path, schema=op.schema, header=0, chunksize=chunksize, **kwargs
+    )
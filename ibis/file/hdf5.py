@@ -3,7 +3,7 @@ import pandas as pd
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 from ibis.file.client import FileClient
-from ibis.pandas.core import execute, execute_node
+from ibis.pandas.core import execute, execute_node, execute_table_columns
 
 
 def connect(path):
@@ -75,3 +75,15 @@ def hdf_read_table(op, client, scope, **kwargs):
     path = client.dictionary[key]
     df = pd.read_hdf(str(path), key, mode='r')
     return df
+
+
+@execute_table_columns.register(HDFClient.table_class, HDFClient, tuple)
+def hdf_read_table_columns(op, client, columns):
+    key = op.name
+    path = str(client.dictionary[key])
+    try:
+        return pd.read_hdf(path, key, mode='r', columns=list(columns))
+    except TypeError:
+        # stores written in the fixed format can only be read in their
+        # entirety
+        return pd.read_hdf(path, key, mode='r')
@@ -8,7 +8,8 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 from ibis.file.client import FileClient
 from ibis.pandas.api import PandasDialect
-from ibis.pandas.core import execute, execute_node
+from ibis.pandas.core import execute, execute_node, execute_table_columns
+from ibis.pandas.dispatch import execute_table_chunks
 
 dialect = PandasDialect
 
@@ -107,9 +108,35 @@ class ParquetClient(FileClient):
         return parse_version(pa.__version__)
 
 
+def _read_parquet(path, columns=None):
+    table = pq.read_table(str(path), columns=columns, use_pandas_metadata=True)
+    return table.to_pandas()
+
+
 @execute_node.register(ParquetClient.table_class, ParquetClient)
 def parquet_read_table(op, client, scope, **kwargs):
     path = client.dictionary[op.name]
-    table = pq.read_table(str(path))
-    df = table.to_pandas()
-    return df
+    return _read_parquet(path)
+
+
+@execute_table_columns.register(
+    ParquetClient.table_class, ParquetClient, tuple
+)
+def parquet_read_table_columns(op, client, columns):
+    path = client.dictionary[op.name]
+    return _read_parquet(path, columns=list(columns))
+
+
+@execute_table_chunks.register(
+    ParquetClient.table_class, ParquetClient, (tuple, type(None)), int
+)
+def parquet_read_table_chunks(op, client, columns, chunksize):
+    path = client.dictionary[op.name]
+    parquet_file = pq.ParquetFile(str(path))
+    batches = parquet_file.iter_batches(
+        batch_size=chunksize,
+        columns=None if columns is None else list(columns),
+        use_pandas_metadata=True,
+    )
+    for batch in batches:
+        yield batch.to_pandas()
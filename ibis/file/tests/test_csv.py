@@ -1,7 +1,9 @@
+import pandas as pd
 import pytest
 from pandas.util import testing as tm
 
 import ibis
+import ibis.expr.operations as ops
 from ibis.file.client import FileDatabase
 from ibis.file.csv import CSVClient, CSVTable
 
@@ -91,6 +93,27 @@ def test_read_with_projection(csv2, data):
     assert 'open' not in result.columns
 
 
+def test_read_only_used_columns(csv2, monkeypatch):
+    read_csv = pd.read_csv
+    usecols = []
+
+    def spy(*args, **kwargs):
+        usecols.append(kwargs.get('usecols'))
+        return read_csv(*args, **kwargs)
+
+    t = csv2.csv_dir2.df
+    monkeypatch.setattr(pd, 'read_csv', spy)
+    result = t[t.ticker == 'FB'][['time', 'close']].execute()
+    assert list(result.columns) == ['time', 'close']
+    assert usecols == [['time', 'ticker', 'close']]
+
+    del usecols[:]
+    selection = ops.Selection(t, [t.time, t.close], [], [t.close])
+    result = selection.to_expr().limit(3).execute()
+    assert list(result.columns) == ['time', 'close']
+    assert usecols == [['time', 'close']]
+
+
 def test_insert(transformed, tmpdir):
     t = transformed
 
@@ -114,3 +137,20 @@ def test_insert(transformed, tmpdir):
 
     result = t.foo.execute()
     tm.assert_frame_equal(result, expected)
+
+
+def test_execute_with_chunksize(transformed):
+    t = transformed
+    expected = t.execute()
+
+    result = t.execute(chunksize=7)
+    tm.assert_frame_equal(result, expected)
+
+    expr = t.group_by('ticker').aggregate(
+        mean=t.avg.mean(), std=t.avg.std(), count=t.count()
+    )
+    result = expr.execute(chunksize=7).sort_values('ticker')
+    expected = expr.execute().sort_values('ticker')
+    tm.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
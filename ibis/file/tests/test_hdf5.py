@@ -94,6 +94,22 @@ def test_read(hdf, data):
     tm.assert_frame_equal(result, expected)
 
 
+def test_read_only_used_columns(hdf, monkeypatch):
+    read_hdf = pd.read_hdf
+    columns = []
+
+    def spy(*args, **kwargs):
+        columns.append(kwargs.get('columns'))
+        return read_hdf(*args, **kwargs)
+
+    monkeypatch.setattr(pd, 'read_hdf', spy)
+
+    closes = hdf.hdf_dir.prices.close
+    result = closes[closes.ticker == 'FB'][['time', 'close']].execute()
+    assert list(result.columns) == ['time', 'close']
+    assert columns == [['time', 'ticker', 'close']]
+
+
 def test_insert(transformed, tmpdir):
 
     t = transformed
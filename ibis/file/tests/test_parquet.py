@@ -5,6 +5,7 @@ from pandas.util import testing as tm
 
 import ibis
 from ibis.file.client import FileDatabase
+from ibis.pandas.core import required_columns
 
 pa = pytest.importorskip('pyarrow')  # isort:skip
 pq = pytest.importorskip('pyarrow.parquet')  # isort:skip
@@ -90,6 +91,54 @@ def test_read(parquet, data):
     tm.assert_frame_equal(result, expected)
 
 
+def test_read_with_projection(parquet, data):
+    closes = parquet.pq.close
+    expr = closes[closes.ticker == 'FB'][['time', 'close']]
+
+    assert required_columns(expr) == {closes.op(): ('time', 'ticker', 'close')}
+
+    result = expr.execute()
+    df = data['close']
+    expected = df.loc[df.ticker == 'FB', ['time', 'close']].reset_index(
+        drop=True
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_only_used_columns(parquet, monkeypatch):
+    read_table = pq.read_table
+    columns = []
+
+    def spy(*args, **kwargs):
+        columns.append(kwargs.get('columns'))
+        return read_table(*args, **kwargs)
+
+    monkeypatch.setattr(pq, 'read_table', spy)
+
+    closes = parquet.pq.close
+    result = closes[closes.ticker == 'FB'][['time', 'close']].execute()
+    assert list(result.columns) == ['time', 'close']
+    assert columns == [['time', 'ticker', 'close']]
+
+
+def test_read_with_chunksize(parquet, data):
+    closes = parquet.pq.close
+    expr = closes[closes.ticker == 'FB'][['time', 'close']]
+
+    result = expr.execute(chunksize=7)
+    expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+    expr = closes.group_by('ticker').aggregate(
+        total=closes.close.sum(), high=closes.close.max()
+    )
+    result = expr.execute(chunksize=7).sort_values('ticker')
+    expected = expr.execute().sort_values('ticker')
+    tm.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
 def test_write(transformed, tmpdir):
     t = transformed
     expected = t.execute()
@@ -216,9 +216,11 @@ Ibis
 
 import abc
 import functools
+import numbers
 import operator
 import warnings
 
+import numpy as np
 import pandas as pd
 
 import ibis
@@ -286,6 +288,222 @@ class Transform(AggregationContext):
         return grouped_data.transform(function, *args, **kwargs)
 
 
+# Reductions that windows compute from merged blocks of rows and sparse tables
+# instead of pandas' per-group rolling implementation
+_NATIVE_ROLLING_REDUCTIONS = frozenset(
+    {'sum', 'mean', 'count', 'min', 'max', 'var', 'std'}
+)
+
+
+def _group_starts(frame, group_by):
+    """Compute the position of the first row of each row's group.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        A frame sorted by `group_by`
+    group_by : List[str]
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        None if the groups are not contiguous and in ascending key order, as
+        produced by ``groupby(..., sort=True)``, or if a key is NULL
+    """
+    nrows = len(frame.index)
+    ordering = np.zeros(max(nrows - 1, 0), dtype=np.int8)
+    for key in group_by:
+        codes, _ = pd.factorize(frame[key], sort=True)
+        if (codes < 0).any():
+            return None
+        ordering = np.where(ordering == 0, np.sign(np.diff(codes)), ordering)
+    if (ordering < 0).any():
+        return None
+    new_group = np.concatenate([[True], ordering > 0])
+    positions = np.arange(nrows)
+    return np.maximum.accumulate(np.where(new_group, positions, 0))
+
+
+def _range_starts(values, width, group_starts):
+    """Compute the first row of every trailing window of `width` over the
+    sorted `values`.
+
+    Parameters
+    ----------
+    values : np.ndarray[int64]
+        The ordering key, ascending within every group
+    width : int
+    group_starts : np.ndarray[int64]
+
+    Returns
+    -------
+    np.ndarray[int64]
+    """
+    # rank the bounds against every distinct value so that the (group,
+    # value) pairs can be searched in one sorted integer array
+    distinct = np.unique(values)
+    ranks = np.searchsorted(distinct, values)
+    bound_ranks = np.searchsorted(distinct, values - width)
+    group_ids = np.cumsum(group_starts == np.arange(len(values))) - 1
+    stride = len(distinct) + 1
+    keys = group_ids * stride + ranks
+    return np.searchsorted(keys, group_ids * stride + bound_ranks)
+
+
+def _sliding_extremum(values, starts, ends, reduce):
+    """Compute `reduce` (:func:`numpy.fmin` or :func:`numpy.fmax`) over
+    ``values[starts[i]:ends[i]]`` for every i using a sparse table.
+    """
+    result = np.full(len(starts), np.nan)
+    lengths = ends - starts
+    nonempty = lengths > 0
+    levels = np.zeros(len(starts), dtype=np.int64)
+    levels[nonempty] = np.log2(lengths[nonempty]).astype(np.int64)
+
+    # table holds reduce(values[j:j + 2 ** level])
+    table = values
+    level = 0
+    while True:
+        selected = nonempty & (levels == level)
+        if selected.any():
+            width = 1 << level
+            result[selected] = reduce(
+                table[starts[selected]], table[ends[selected] - width]
+            )
+        width = 1 << level
+        if not (levels > level).any():
+            return result
+        table = reduce(table[:-width], table[width:])
+        level += 1
+
+
+def _sliding_merge(table, starts, ends, merge, identity):
+    """Merge the states of the rows ``starts[i]:ends[i]`` for every i.
+
+    Every window is split into blocks of a power of two rows, whose states
+    are merged pairwise from the states of single rows. Unlike differences
+    of prefix sums, the result only depends on the values inside the window.
+
+    Parameters
+    ----------
+    table : Tuple[np.ndarray, ...]
+        The state of every row, one array per component
+    starts : np.ndarray[int64]
+    ends : np.ndarray[int64]
+    merge : Callable
+        Merges two states, from the rows before and after each other
+    identity : Tuple[float, ...]
+        The state of an empty window
+
+    Returns
+    -------
+    Tuple[np.ndarray, ...]
+    """
+    lengths = ends - starts
+    result = tuple(np.full(len(starts), value) for value in identity)
+    positions = starts.copy()
+    level = 0
+    while True:
+        width = 1 << level
+        selected = (lengths & width) != 0
+        if selected.any():
+            rows = positions[selected]
+            merged = merge(
+                tuple(component[selected] for component in result),
+                tuple(component[rows] for component in table),
+            )
+            for component, values in zip(result, merged):
+                component[selected] = values
+            positions[selected] += width
+        if not (lengths >> (level + 1)).any():
+            return result
+        # table holds the states of the blocks of 2 * width rows
+        table = merge(
+            tuple(component[:-width] for component in table),
+            tuple(component[width:] for component in table),
+        )
+        level += 1
+
+
+def _merge_sums(left, right):
+    return (left[0] + right[0],)
+
+
+def _merge_moments(left, right):
+    # the update of Chan et al. for the count, mean and sum of squared
+    # deviations of two sets of values
+    left_count, left_mean, left_squares = left
+    right_count, right_mean, right_squares = right
+    count = left_count + right_count
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(count > 0, right_count / count, 0.0)
+    delta = right_mean - left_mean
+    return (
+        count,
+        left_mean + delta * ratio,
+        left_squares + right_squares + delta * delta * left_count * ratio,
+    )
+
+
+def _rolling_reduction(values, starts, how, ddof=1, full_starts=None):
+    """Compute the reduction `how` over the trailing windows ending at every
+    row and starting at `starts`.
+
+    Parameters
+    ----------
+    values : np.ndarray[float64]
+    starts : np.ndarray[int64]
+        The first row of each (possibly truncated) window
+    how : str
+    ddof : int
+    full_starts : Optional[np.ndarray[int64]]
+        The first row of each untruncated window. If given, windows without a
+        single non-NULL value are NULL.
+
+    Returns
+    -------
+    np.ndarray[float64]
+    """
+    ends = np.arange(1, len(values) + 1)
+    valid = ~np.isnan(values)
+    counts = np.concatenate([[0], np.cumsum(valid)])
+    count = (counts[ends] - counts[starts]).astype(np.float64)
+
+    if how in {'min', 'max'}:
+        reduce = np.fmin if how == 'min' else np.fmax
+        result = _sliding_extremum(values, starts, ends, reduce)
+    elif how == 'count':
+        result = count
+    elif how in {'sum', 'mean'}:
+        (result,) = _sliding_merge(
+            (np.where(valid, values, 0.0),), starts, ends, _merge_sums, (0.0,)
+        )
+        if how == 'mean':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result /= count
+    else:
+        _, _, squares = _sliding_merge(
+            (
+                valid.astype(np.float64),
+                np.where(valid, values, 0.0),
+                np.zeros(len(values)),
+            ),
+            starts,
+            ends,
+            _merge_moments,
+            (0.0, 0.0, 0.0),
+        )
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = squares / (count - ddof)
+        result[count - ddof <= 0] = np.nan
+        if how == 'std':
+            result = np.sqrt(result)
+
+    if full_starts is not None:
+        result[counts[ends] == counts[full_starts]] = np.nan
+    return result
+
+
 @functools.singledispatch
 def compute_window_spec(dtype, obj):
     raise com.IbisTypeError(
@@ -326,6 +544,96 @@ class Window(AggregationContext):
         )
         self.construct_window = operator.methodcaller(kind, *args, **kwargs)
 
+    def window_starts(self, frame):
+        """Compute the first row of the window ending at every row of `frame`.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            The parent frame, sorted by the grouping and ordering keys
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, np.ndarray]]
+            The first row of every window after and before truncating it to
+            ``max_lookback`` rows, or None if the windows cannot be computed
+            without pandas
+        """
+        return None
+
+    def native_agg(self, frame, name, function, ddof=1):
+        """Compute a windowed reduction over the column `name` of `frame`
+        without calling into pandas' per-group rolling machinery.
+
+        Returns
+        -------
+        Optional[pd.Series]
+            None if the reduction must be computed by pandas
+        """
+        if function not in _NATIVE_ROLLING_REDUCTIONS:
+            return None
+
+        values = frame[name]
+        if values.dtype.kind not in 'iuf':
+            return None
+
+        window_starts = self.window_starts(frame)
+        if window_starts is None:
+            return None
+
+        starts, full_starts = window_starts
+        if function == 'count' and self.max_lookback is None:
+            # pandas counts empty windows as zero rather than NULL
+            full_starts = None
+        result = _rolling_reduction(
+            values.values.astype(np.float64),
+            starts,
+            function,
+            ddof=ddof,
+            full_starts=full_starts,
+        )
+        keys = self.group_by + self.order_by
+        index = pd.MultiIndex.from_arrays(
+            [frame.index] + [frame[key] for key in keys],
+            names=[frame.index.name] + keys,
+        )
+        return pd.Series(result, index=index, name=name)
+
+    def _rolling_agg(self, frame, name, method):
+        group_by = self.group_by
+        order_by = self.order_by
+
+        # set the index to our order_by keys and append it to the existing
+        # index
+        # TODO: see if we can do this in the caller, when the context
+        # is constructed rather than pulling out the data
+        columns = group_by + order_by + [name]
+        indexed_by_ordering = frame.loc[:, columns].set_index(order_by)
+
+        # regroup if needed
+        if group_by:
+            grouped_frame = indexed_by_ordering.groupby(
+                group_by, observed=True
+            )
+        else:
+            grouped_frame = indexed_by_ordering
+        grouped = grouped_frame[name]
+
+        # perform the per-group rolling operation
+        windowed = self.construct_window(grouped)
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", message=".+raw=True.+", category=FutureWarning
+            )
+            result = method(windowed)
+        index = result.index
+        result.index = pd.MultiIndex.from_arrays(
+            [frame.index]
+            + list(map(index.get_level_values, range(index.nlevels))),
+            names=[frame.index.name] + index.names,
+        )
+        return result
+
     def agg(self, grouped_data, function, *args, **kwargs):
         # avoid a pandas warning about numpy arrays being passed through
         # directly
@@ -384,38 +692,21 @@ class Window(AggregationContext):
         frame = getattr(parent, 'obj', parent)
         obj = getattr(grouped_data, 'obj', grouped_data)
 
+        # the parent frame may be shared with other window functions, so
+        # add the operand to a copy of the columns we need
         name = obj.name
         if frame[name] is not obj:
             name = "{}_{}".format(name, ibis.util.guid())
+            frame = frame.loc[:, group_by + order_by]
             frame[name] = obj
 
-        # set the index to our order_by keys and append it to the existing
-        # index
-        # TODO: see if we can do this in the caller, when the context
-        # is constructed rather than pulling out the data
-        columns = group_by + order_by + [name]
-        indexed_by_ordering = frame.loc[:, columns].set_index(order_by)
+        result = None
+        if isinstance(function, str) and not args and set(kwargs) <= {'ddof'}:
+            result = self.native_agg(frame, name, function, **kwargs)
 
-        # regroup if needed
-        if group_by:
-            grouped_frame = indexed_by_ordering.groupby(group_by)
-        else:
-            grouped_frame = indexed_by_ordering
-        grouped = grouped_frame[name]
+        if result is None:
+            result = self._rolling_agg(frame, name, method)
 
-        # perform the per-group rolling operation
-        windowed = self.construct_window(grouped)
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore", message=".+raw=True.+", category=FutureWarning
-            )
-            result = method(windowed)
-        index = result.index
-        result.index = pd.MultiIndex.from_arrays(
-            [frame.index]
-            + list(map(index.get_level_values, range(index.nlevels))),
-            names=[frame.index.name] + index.names,
-        )
         try:
             return result.astype(self.dtype, copy=False)
         except (TypeError, ValueError):
@@ -428,9 +719,15 @@ class Cumulative(Window):
     def __init__(self, *args, **kwargs):
         super().__init__('expanding', *args, **kwargs)
 
+    def window_starts(self, frame):
+        starts = _group_starts(frame, self.group_by)
+        if starts is None:
+            return None
+        return starts, starts
+
 
 class Moving(Window):
-    __slots__ = ()
+    __slots__ = ('preceding',)
 
     def __init__(self, preceding, max_lookback, *args, **kwargs):
         from ibis.pandas.core import timedelta_types
@@ -453,6 +750,44 @@ class Moving(Window):
             min_periods=1,
             **kwargs,
         )
+        self.preceding = preceding
+
+    def window_starts(self, frame):
+        group_starts = _group_starts(frame, self.group_by)
+        if group_starts is None:
+            return None
+
+        preceding = self.preceding
+        positions = np.arange(len(frame.index))
+        if isinstance(preceding, numbers.Integral):
+            full_starts = np.maximum(positions - preceding + 1, group_starts)
+        else:
+            if len(self.order_by) != 1:
+                return None
+            (order_by,) = self.order_by
+            ordering = frame[order_by]
+            if not pd.api.types.is_datetime64_any_dtype(ordering):
+                return None
+            if ordering.isnull().any():
+                return None
+            try:
+                width = preceding.nanos
+            except (AttributeError, ValueError):
+                # not a fixed frequency
+                return None
+
+            values = np.asarray(ordering.values).view(np.int64)
+            descending = np.diff(values) < 0
+            if (descending & (group_starts[1:] != positions[1:])).any():
+                return None
+            full_starts = _range_starts(values, width, group_starts)
+
+        max_lookback = self.max_lookback
+        if max_lookback is None:
+            starts = full_starts
+        else:
+            starts = np.maximum(full_starts, positions - max_lookback + 1)
+        return starts, full_starts
 
     def short_circuit_method(self, grouped_data, function):
         raise AttributeError('No short circuit method for rolling operations')
@@ -5,9 +5,18 @@ import toolz
 import ibis
 from ibis.pandas.client import PandasClient
 from ibis.pandas.execution import execute, execute_node
+from ibis.pandas.profile import profile
+from ibis.pandas.streaming import execute_streaming
 from ibis.pandas.udf import udf
 
-__all__ = ('connect', 'dialect', 'execute', 'udf')
+__all__ = (
+    'connect',
+    'dialect',
+    'execute',
+    'execute_streaming',
+    'profile',
+    'udf',
+)
 
 
 def connect(dictionary):
@@ -2,7 +2,9 @@
 
 from __future__ import absolute_import
 
+import collections
 import re
+import threading
 from functools import partial
 
 import dateutil.parser
@@ -13,14 +15,18 @@ import toolz
 from multipledispatch import Dispatcher
 from pkg_resources import parse_version
 
+import ibis
 import ibis.client as client
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
+import ibis.pandas.fixed_point as fixed_point
 from ibis.compat import CategoricalDtype, DatetimeTZDtype
 from ibis.pandas.core import execute_and_reset
+from ibis.pandas.encoding import encode_frame
+from ibis.pandas.streaming import execute_chunked
 
 try:
     infer_pandas_dtype = pd.api.types.infer_dtype
@@ -296,11 +302,56 @@ def convert_boolean_to_series(in_dtype, out_dtype, column):
     return column
 
 
+@convert.register(CategoricalDtype, (dt.String, dt.Category), pd.Series)
+def convert_categorical_to_string(_, out_dtype, column):
+    # dictionary encoded strings are decoded in the results of execution
+    return column
+
+
 @convert.register(object, dt.DataType, pd.Series)
 def convert_any_to_any(_, out_dtype, column):
     return column.astype(out_dtype.to_pandas(), errors='ignore')
 
 
+# whether columns of a pandas dtype are changed by `convert` for an ibis type,
+# keyed by the pair of them
+_conversions = {}
+
+
+def _plan_conversion(in_dtype, out_dtype):
+    if isinstance(out_dtype, dt.String):
+        # strings are stored as objects, and dictionary encoded strings are
+        # decoded in the results of execution
+        return not (
+            in_dtype == np.object_ or isinstance(in_dtype, CategoricalDtype)
+        )
+    if isinstance(out_dtype, dt.Boolean) and in_dtype == np.object_:
+        # booleans with NULL values are left as objects
+        return False
+    try:
+        return out_dtype.to_pandas() != in_dtype
+    except TypeError:
+        # ugh, we can't compare dtypes coming from pandas, assume not equal
+        return True
+
+
+def needs_conversion(in_dtype, out_dtype):
+    """Return whether columns of the pandas dtype `in_dtype` have to be
+    converted to the ibis type `out_dtype`.
+
+    The answer is computed once for every pair of types.
+    """
+    key = in_dtype, out_dtype
+    try:
+        return _conversions[key]
+    except KeyError:
+        result = _conversions[key] = _plan_conversion(in_dtype, out_dtype)
+        return result
+    except TypeError:
+        # unhashable dtypes aren't cached
+        return _plan_conversion(in_dtype, out_dtype)
+
+
 def ibis_schema_apply_to(schema, df):
     """Applies the Ibis schema to a pandas DataFrame
 
@@ -315,23 +366,15 @@ def ibis_schema_apply_to(schema, df):
 
     Notes
     -----
-    Mutates `df`
+    Mutates `df`. Only the columns whose dtype doesn't already conform to
+    their type in `schema` are converted and replaced; the others are left
+    untouched, without being copied.
     """
-
+    dtypes = dict(zip(df.columns, df.dtypes))
     for column, dtype in schema.items():
-        pandas_dtype = dtype.to_pandas()
-        col = df[column]
-        col_dtype = col.dtype
-
-        try:
-            not_equal = pandas_dtype != col_dtype
-        except TypeError:
-            # ugh, we can't compare dtypes coming from pandas, assume not equal
-            not_equal = True
-
-        if not_equal or isinstance(dtype, dt.String):
-            df[column] = convert(col_dtype, dtype, col)
-
+        col_dtype = dtypes[column]
+        if needs_conversion(col_dtype, dtype):
+            df[column] = convert(col_dtype, dtype, df[column])
     return df
 
 
@@ -344,19 +387,120 @@ class PandasTable(ops.DatabaseTable):
     pass
 
 
+class JoinIndexCache:
+    """A least recently used cache of the join indexes built over the tables
+    of a :class:`PandasClient`.
+
+    Entries are keyed by table name and key columns, and remember the
+    DataFrame they were built from, so that an index is never used once its
+    table refers to another DataFrame. Modifying a DataFrame in place is not
+    detected.
+
+    The cache holds at most ``ibis.options.pandas.join_index_cache_size``
+    bytes of indexes.
+
+    Attributes
+    ----------
+    nbytes : int
+        The number of bytes used by the cached indexes
+    """
+
+    __slots__ = '_entries', '_lock', 'nbytes'
+
+    def __init__(self):
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name, columns, data):
+        """Return the index of the `columns` of table `name`, or None if no
+        index of `data` is cached.
+        """
+        key = name, tuple(columns)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] is not data:
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, name, columns, data, index):
+        """Cache the `index` built from the `columns` of `data`, the current
+        data of table `name`.
+
+        `index` must have an ``nbytes`` attribute. Indexes larger than the
+        cache are not cached.
+        """
+        budget = ibis.options.pandas.join_index_cache_size
+        if index.nbytes > budget:
+            return
+
+        key = name, tuple(columns)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = data, index
+            self.nbytes += index.nbytes
+            while self.nbytes > budget:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, name):
+        """Remove every index of table `name`."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == name]:
+                self._remove(key)
+
+    def _remove(self, key):
+        _, index = self._entries.pop(key)
+        self.nbytes -= index.nbytes
+
+
 class PandasClient(client.Client):
 
     dialect = None  # defined in ibis.pandas.api
 
     def __init__(self, dictionary):
         self.dictionary = dictionary
+        self.join_indexes = JoinIndexCache()
+        self._encoded = {}
+
+    def table_data(self, name, schema):
+        """Return the DataFrame of table `name`, with the columns that
+        :func:`ibis.pandas.encoding.encode_frame` encodes for `schema`
+        dictionary encoded, and the decimal columns that
+        :func:`ibis.pandas.fixed_point.encode_frame` scales for `schema` as
+        scaled integers.
+
+        The encoded DataFrame is cached until the table refers to another
+        DataFrame. Modifying a DataFrame in place is not detected.
+        """
+        df = self.dictionary[name]
+        ratio = ibis.options.pandas.dictionary_encoding_ratio
+        key = schema, ratio, fixed_point.enabled()
+        entry = self._encoded.get(name)
+        if entry is not None and entry[0] is df and entry[1] == key:
+            return entry[2]
+        result = fixed_point.encode_frame(
+            encode_frame(df, schema, ratio), schema
+        )
+        if result is not df:
+            self._encoded[name] = df, key, result
+        return result
 
     def table(self, name, schema=None):
         df = self.dictionary[name]
         schema = sch.infer(df, schema=schema)
         return PandasTable(name, schema, self).to_expr()
 
-    def execute(self, query, params=None, limit='default', **kwargs):
+    def execute(
+        self, query, params=None, limit='default', chunksize=None, **kwargs
+    ):
         if limit != 'default':
             raise ValueError(
                 'limit parameter to execute is not yet implemented in the '
@@ -369,6 +513,8 @@ class PandasClient(client.Client):
                     type(query).__name__
                 )
             )
+        if chunksize is not None:
+            return execute_chunked(query, chunksize, params=params, **kwargs)
         return execute_and_reset(query, params=params, **kwargs)
 
     def compile(self, expr, *args, **kwargs):
@@ -404,6 +550,7 @@ class PandasClient(client.Client):
         """
         # kwargs is a catch all for any options required by other backends.
         self.dictionary[table_name] = pd.DataFrame(obj)
+        self.join_indexes.invalidate(table_name)
 
     def create_table(self, table_name, obj=None, schema=None):
         """Create a table."""
@@ -419,6 +566,7 @@ class PandasClient(client.Client):
             )
 
         self.dictionary[table_name] = df
+        self.join_indexes.invalidate(table_name)
 
     def get_schema(self, table_name, database=None):
         """Return a Schema object for the indicated table and database.
@@ -30,9 +30,16 @@ The general flow of execution is:
        If the current operation is in scope:
            return it
        Else:
-           execute the arguments of the current node
+           sort the operations it depends on (stopping at operations that
+           are in scope) so that every operation comes after its arguments
 
-       execute the current node with its executed arguments
+       For each operation in that order:
+           execute the operation with its already executed arguments
+           release the results of arguments no other operation needs
+
+Every distinct operation is executed once, no matter how many other
+operations use it, and the loop does not recurse into arguments, so deeply
+nested expressions do not exhaust the Python stack.
 
 Specifically, execute is comprised of a series of steps that happen at
 different times during the loop.
@@ -78,6 +85,7 @@ passed to ``post_execute`` would be the bound values passed in at the time the
 
 from __future__ import absolute_import
 
+import collections
 import datetime
 import functools
 import numbers
@@ -88,19 +96,24 @@ import toolz
 from multipledispatch import Dispatcher
 
 import ibis
-import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 import ibis.expr.window as win
 import ibis.pandas.aggcontext as agg_ctx
+import ibis.pandas.encoding as encoding
+import ibis.pandas.fixed_point as fixed_point
+import ibis.pandas.intervals as intervals
 from ibis.client import find_backends
 from ibis.pandas.dispatch import (
     execute_literal,
     execute_node,
+    execute_table_columns,
     post_execute,
     pre_execute,
 )
+from ibis.pandas.profile import current_profile
+from ibis.pandas.threads import current_pool, execution_pool, parallel_map
 
 integer_types = np.integer, int
 floating_types = (numbers.Real,)
@@ -141,6 +154,25 @@ ibis.util.consume(
 )
 
 
+class ExecutionMemo(dict):
+    """A mapping from :class:`~ibis.expr.operations.Node` instances to their
+    computed results, shared by every branch of a single call to
+    :func:`~ibis.pandas.core.execute_with_scope`.
+
+    Attributes
+    ----------
+    hits : int
+        The number of times a node's result was reused by another parent
+        instead of being recomputed.
+    """
+
+    __slots__ = ('hits',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hits = 0
+
+
 def execute_with_scope(expr, scope, aggcontext=None, clients=None, **kwargs):
     """Execute an expression `expr`, with data provided in `scope`.
 
@@ -156,9 +188,32 @@ def execute_with_scope(expr, scope, aggcontext=None, clients=None, **kwargs):
     Returns
     -------
     result : scalar, pd.Series, pd.DataFrame
+
+    Notes
+    -----
+    Every distinct node is computed at most once per call. When
+    ``ibis.options.verbose`` is set, the number of results served from the
+    memo is logged once execution finishes, and inside
+    :func:`ibis.pandas.profile` it is added to the profile's
+    :attr:`~ibis.pandas.profile.Profile.memo_hits`.
+
+    Physical tables that `expr` only partially uses are read with
+    :func:`~ibis.pandas.dispatch.execute_table_columns` before anything else
+    is computed, so that unused columns are never loaded.
+
+    Filters of joins are computed by
+    :func:`~ibis.pandas.core.execute_pushed_down_selections` next, so that
+    joins run on already filtered inputs wherever possible.
+
+    Inside :func:`ibis.pandas.profile`, every computed operation and every
+    operation served from scope is recorded.
     """
     op = expr.op()
 
+    profile = current_profile()
+    if profile is not None:
+        profile.add_root(expr)
+
     # Call pre_execute, to allow clients to intercept the expression before
     # computing anything *and* before associating leaf nodes with data. This
     # allows clients to provide their own data for each leaf.
@@ -172,11 +227,19 @@ def execute_with_scope(expr, scope, aggcontext=None, clients=None, **kwargs):
         op, *clients, scope=scope, aggcontext=aggcontext, **kwargs
     )
     new_scope = toolz.merge(scope, pre_executed_scope)
+    new_scope.update(execute_required_columns(expr, new_scope))
+    new_scope.update(
+        execute_pushed_down_selections(
+            expr, new_scope, aggcontext=aggcontext, clients=clients, **kwargs
+        )
+    )
+    memo = ExecutionMemo()
     result = execute_until_in_scope(
         expr,
         new_scope,
         aggcontext=aggcontext,
         clients=clients,
+        memo=memo,
         # XXX: we *explicitly* pass in scope and not new_scope here so that
         # post_execute sees the scope of execute_with_scope, not the scope of
         # execute_until_in_scope
@@ -190,11 +253,25 @@ def execute_with_scope(expr, scope, aggcontext=None, clients=None, **kwargs):
         **kwargs,
     )
 
+    if memo.hits:
+        ibis.util.log(
+            'pandas execution of {}: {:d} memo hit(s)'.format(
+                type(op).__name__, memo.hits
+            )
+        )
+        if profile is not None:
+            profile.add_memo_hits(memo.hits)
     return result
 
 
 def execute_until_in_scope(
-    expr, scope, aggcontext=None, clients=None, post_execute_=None, **kwargs
+    expr,
+    scope,
+    aggcontext=None,
+    clients=None,
+    post_execute_=None,
+    memo=None,
+    **kwargs,
 ):
     """Execute until our op is in `scope`.
 
@@ -204,6 +281,8 @@ def execute_until_in_scope(
     scope : Mapping
     aggcontext : Optional[AggregationContext]
     clients : List[ibis.client.Client]
+    memo : Optional[ExecutionMemo]
+        Results of nodes that have already been computed against `scope`
     kwargs : Mapping
     """
     # these should never be None
@@ -211,6 +290,9 @@ def execute_until_in_scope(
     assert clients is not None, 'clients is None'
     assert post_execute_ is not None, 'post_execute_ is None'
 
+    if memo is None:
+        memo = ExecutionMemo()
+
     # base case: our op has been computed (or is a leaf data node), so
     # return the corresponding value
     op = expr.op()
@@ -223,6 +305,7 @@ def execute_until_in_scope(
         aggcontext=aggcontext,
         post_execute_=post_execute_,
         clients=clients,
+        memo=memo,
         **kwargs,
     )
     new_scope = toolz.merge(
@@ -234,12 +317,565 @@ def execute_until_in_scope(
         aggcontext=aggcontext,
         clients=clients,
         post_execute_=post_execute_,
+        memo=memo,
         **kwargs,
     )
 
 
+def computable_args(op):
+    """Return the arguments of `op` that are passed to ``execute_node``.
+
+    Things like expressions, None, and scalar types are computable whereas
+    ``list``s are not.
+
+    Parameters
+    ----------
+    op : ibis.expr.operations.Node
+
+    Returns
+    -------
+    List[object]
+    """
+    return [arg for arg in op.inputs if is_computable_input(arg)]
+
+
+def _child_ops(args):
+    return list(toolz.unique(arg.op() for arg in args if hasattr(arg, 'op')))
+
+
+def schedule(expr, scope, memo=None, arguments=None):
+    """Topologically sort the operations that must run to compute `expr`.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    scope : Mapping[ibis.expr.operations.Node, object]
+        Operations found in `scope` are treated as already computed and are
+        not scheduled, and neither are their arguments.
+    memo : Optional[ExecutionMemo]
+        If given, its ``hits`` counter is incremented for every reference to
+        an operation after the first one.
+    arguments : Optional[Dict[ibis.expr.operations.Node, List[object]]]
+        If given, the :func:`computable_args` of every scheduled operation
+        are stored in it, so that they are not computed again.
+
+    Returns
+    -------
+    order : List[ibis.expr.types.Expr]
+        Every expression that needs to be computed, such that each
+        expression appears after all of its arguments
+    refcounts : collections.Counter
+        A mapping from each scheduled operation to the number of distinct
+        scheduled operations that consume it
+    """
+    order = []
+    refcounts = collections.Counter()
+    seen = set()
+    referenced = set()
+
+    # iterative post-order depth-first traversal: an entry is pushed once to
+    # expand its arguments and once more to be emitted after them
+    stack = [(expr, False)]
+    while stack:
+        node_expr, expanded = stack.pop()
+        op = node_expr.op()
+        if expanded:
+            order.append(node_expr)
+            continue
+
+        if op in seen:
+            continue
+        seen.add(op)
+        stack.append((node_expr, True))
+
+        if isinstance(op, ops.Literal):
+            # literals are computed from their value alone
+            if arguments is not None:
+                arguments[op] = ()
+            continue
+
+        args = computable_args(op)
+        if arguments is not None:
+            arguments[op] = args
+        child_ops = [arg.op() for arg in args if hasattr(arg, 'op')]
+        for child in child_ops:
+            if child in scope:
+                continue
+            if memo is not None and child in referenced:
+                memo.hits += 1
+            referenced.add(child)
+
+        for child in toolz.unique(child_ops):
+            if child not in scope:
+                refcounts[child] += 1
+
+        stack.extend(
+            (arg, False)
+            for arg in reversed(args)
+            if hasattr(arg, 'op') and arg.op() not in scope
+        )
+    return order, refcounts
+
+
+def _passes_columns_through(op, table):
+    """Return whether `op` only needs the columns of `table` that are needed
+    from `op` itself.
+    """
+    if isinstance(op, ops.Join):
+        return True
+    return (
+        isinstance(op, ops.Selection)
+        and not op.selections
+        and table.equals(op.table.op())
+    )
+
+
+def required_columns(expr, scope=None):
+    """Compute the columns of each physical table that `expr` uses.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    scope : Optional[Mapping[ibis.expr.operations.Node, object]]
+        Operations in `scope` are already computed, so nothing they depend on
+        is read.
+
+    Returns
+    -------
+    columns : Dict[ibis.expr.operations.PhysicalTable, Tuple[str, ...]]
+        A mapping from each physical table that can be read partially to the
+        names of the columns that `expr` references, in schema order. Tables
+        that are missing from the result must be read in their entirety.
+
+    Notes
+    -----
+    A table can be read partially if every operation that uses it either
+    refers to one of its columns by name, selects or aggregates explicit
+    expressions from it, or is a join or filter whose own columns are only
+    used in those ways.
+    """
+    if scope is None:
+        scope = {}
+
+    # iterative post-order traversal of every operation not in scope, along
+    # with the table operations that each of them takes as an argument
+    order = []
+    table_args = {}
+    stack = [(expr.op(), False)]
+    while stack:
+        op, expanded = stack.pop()
+        if expanded:
+            order.append(op)
+            continue
+        if op in table_args or op in scope:
+            continue
+
+        args = []
+        for arg in op.flat_args():
+            if isinstance(arg, win.Window):
+                keys = list(toolz.concatv(arg._group_by, arg._order_by))
+                if not all(isinstance(key, ir.Expr) for key in keys):
+                    # keys that are not bound to a table could refer to any
+                    # column
+                    return {}
+                args.extend(keys)
+            elif isinstance(arg, ir.Expr):
+                args.append(arg)
+
+        table_args[op] = [
+            arg.op() for arg in args if isinstance(arg, ir.TableExpr)
+        ]
+        stack.append((op, True))
+        stack.extend(
+            (arg.op(), False) for arg in args if arg.op() not in scope
+        )
+
+    columns = collections.defaultdict(set)
+    needs_all = set()
+
+    root = expr.op()
+    if isinstance(root, ops.TableNode):
+        needs_all.add(root)
+
+    # every consumer of an operation comes before it in reversed post-order,
+    # so the columns needed from a join or filter are known before visiting
+    # its inputs
+    for op in reversed(order):
+        for table in table_args[op]:
+            if isinstance(op, ops.TableColumn):
+                columns[table].add(op.name)
+            elif _passes_columns_through(op, table):
+                if op in needs_all:
+                    needs_all.add(table)
+                else:
+                    columns[table].update(columns[op])
+            elif isinstance(op, ops.Selection):
+                if any(
+                    isinstance(selection, ir.TableExpr)
+                    and selection.op().equals(table)
+                    for selection in op.selections
+                ):
+                    needs_all.add(table)
+            elif not (
+                isinstance(op, ops.Aggregation)
+                and table.equals(op.table.op())
+            ):
+                needs_all.add(table)
+
+    result = {}
+    for op in order:
+        if isinstance(op, ops.PhysicalTable) and op not in needs_all:
+            names = tuple(
+                name for name in op.schema.names if name in columns[op]
+            )
+            if names:
+                result[op] = names
+    return result
+
+
+def execute_required_columns(expr, scope):
+    """Read the physical tables that `expr` only partially uses.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    scope : Mapping[ibis.expr.operations.Node, object]
+
+    Returns
+    -------
+    scope : Dict[ibis.expr.operations.PhysicalTable, pandas.DataFrame]
+        The data of every table whose backend registers an
+        :func:`~ibis.pandas.dispatch.execute_table_columns` rule
+    """
+    new_scope = {}
+    for table, columns in required_columns(expr, scope).items():
+        client = getattr(table, 'source', None)
+        reader = execute_table_columns.dispatch(
+            type(table), type(client), tuple
+        )
+        if reader is not None:
+            new_scope[table] = reader(table, client, columns)
+    return new_scope
+
+
+_ROW_DEPENDENT_OPS = ops.Reduction, ops.AnalyticOp, ops.WindowOp
+
+
+def is_elementwise(expr):
+    """Return whether every row of `expr` depends only on the same row of
+    its parent table.
+
+    Parameters
+    ----------
+    expr : ir.Expr
+
+    Returns
+    -------
+    bool
+    """
+    if isinstance(expr, ir.TableExpr):
+        return True
+
+    stack = [expr]
+    seen = set()
+    while stack:
+        op = stack.pop().op()
+        if op in seen:
+            continue
+        seen.add(op)
+        # Any and All are reductions but not instances of ops.Reduction
+        if isinstance(op, _ROW_DEPENDENT_OPS) or getattr(
+            op, '_reduction', False
+        ):
+            return False
+        stack.extend(
+            arg
+            for arg in op.flat_args()
+            if isinstance(arg, ir.Expr) and not isinstance(arg, ir.TableExpr)
+        )
+    return True
+
+
+# The inputs of each kind of join whose rows can be filtered before joining
+# without changing the result: filtering the side of an outer join that is
+# padded with nulls would turn its unmatched rows into null-padded ones
+# instead of removing them
+_FILTERABLE_JOIN_SIDES = {
+    ops.InnerJoin: ('left', 'right'),
+    ops.CrossJoin: ('left', 'right'),
+    ops.LeftJoin: ('left',),
+    ops.RightJoin: ('right',),
+}
+
+
+def _joined_tables(table):
+    """Return the table operations whose columns `table` passes through,
+    including `table` itself.
+    """
+    tables = set()
+    stack = [table]
+    while stack:
+        op = stack.pop()
+        tables.add(op)
+        if isinstance(op, ops.Join):
+            stack.extend((op.left.op(), op.right.op()))
+    return tables
+
+
+def _predicate_tables(predicate):
+    """Return the tables whose columns `predicate` references, or None if it
+    is not computed row by row from those columns.
+    """
+    if not is_elementwise(predicate):
+        return None
+
+    tables = set()
+    stack = [predicate.op()]
+    while stack:
+        op = stack.pop()
+        if isinstance(op, ops.TableColumn):
+            tables.add(op.table.op())
+        elif isinstance(op, ops.TableNode):
+            return None
+        else:
+            stack.extend(
+                arg.op() for arg in op.flat_args() if isinstance(arg, ir.Expr)
+            )
+    return tables
+
+
+def _execute_pushed_down_selection(op, scope, **kwargs):
+    """Execute the selection `op` of a join, filtering the inputs of the join
+    with the predicates of `op` that only reference one of them.
+
+    Returns
+    -------
+    result : Optional[pandas.DataFrame]
+        None if none of the predicates of `op` can be pushed below its join
+    """
+    join = op.table.op()
+    sides = {
+        name: getattr(join, name)
+        for name in _FILTERABLE_JOIN_SIDES.get(type(join), ())
+    }
+    if (
+        not sides
+        or join in scope
+        or join.left.equals(join.right)
+        or not all(map(is_elementwise, op.selections))
+    ):
+        return None
+
+    left_tables = _joined_tables(join.left.op())
+    right_tables = _joined_tables(join.right.op())
+    side_tables = {
+        'left': left_tables - right_tables,
+        'right': right_tables - left_tables,
+    }
+
+    pushed = collections.defaultdict(list)
+    remaining = []
+    for predicate in op.predicates:
+        tables = _predicate_tables(predicate)
+        name = next(
+            (
+                name
+                for name in sides
+                if tables and tables <= side_tables[name]
+            ),
+            None,
+        )
+        if name is None:
+            remaining.append(predicate)
+        else:
+            pushed[name].append(predicate)
+
+    if not pushed:
+        return None
+
+    left, right = parallel_map(
+        lambda name: execute_with_scope(
+            getattr(join, name).filter(pushed[name])
+            if name in pushed
+            else getattr(join, name),
+            scope,
+            **kwargs,
+        ),
+        ('left', 'right'),
+    )
+    join_scope = toolz.merge(
+        scope, {join.left.op(): left, join.right.op(): right}
+    )
+    result = execute_node(join, left, right, scope=join_scope, **kwargs)
+
+    if not (remaining or op.selections or op.sort_keys):
+        return result
+
+    selection = ops.Selection(
+        op.table, op.selections, remaining, op.sort_keys
+    ).to_expr()
+    return execute_with_scope(
+        selection, toolz.merge(scope, {join: result}), **kwargs
+    )
+
+
+def execute_pushed_down_selections(expr, scope, **kwargs):
+    """Execute the filters of joins in `expr` whose predicates can be
+    computed on the inputs of the join instead of its result.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    scope : Mapping[ibis.expr.operations.Node, object]
+    kwargs : Mapping
+        Arguments passed on to
+        :func:`~ibis.pandas.core.execute_with_scope`
+
+    Returns
+    -------
+    scope : Dict[ibis.expr.operations.Selection, pandas.DataFrame]
+        The result of every selection of an inner, left or right join that
+        has at least one predicate referencing only the columns of an input
+        whose rows the join does not pad with nulls. Those predicates are
+        applied to that input before the join is computed, and the remaining
+        ones to the join's result.
+    """
+    new_scope = {}
+    stack = [expr.op()]
+    seen = set()
+    while stack:
+        op = stack.pop()
+        if op in seen or op in scope:
+            continue
+        seen.add(op)
+
+        if (
+            isinstance(op, ops.Selection)
+            and op.predicates
+            and isinstance(op.table.op(), ops.Join)
+        ):
+            result = _execute_pushed_down_selection(op, scope, **kwargs)
+            if result is not None:
+                new_scope[op] = result
+                continue
+
+        stack.extend(
+            arg.op() for arg in op.flat_args() if isinstance(arg, ir.Expr)
+        )
+    return new_scope
+
+
+def _execute_scheduled(
+    node_expr,
+    args,
+    scope=None,
+    aggcontext=None,
+    clients=None,
+    post_execute_=None,
+    **kwargs,
+):
+    """Compute a single scheduled expression from its computed `args`."""
+    node = node_expr.op()
+
+    def compute():
+        if isinstance(node, ops.Literal):
+            # special case literals to avoid the overhead of dispatching
+            # execute_node
+            return execute_literal(
+                node,
+                node.value,
+                node_expr.type(),
+                aggcontext=aggcontext,
+                **kwargs,
+            )
+
+        # pass our computed arguments to this node's execute_node
+        # implementation
+        result = execute_node(
+            node,
+            *args,
+            scope=scope,
+            aggcontext=aggcontext,
+            clients=clients,
+            **kwargs,
+        )
+        return post_execute_(node, result)
+
+    profile = current_profile()
+    if profile is None:
+        return compute()
+    return profile.execute(node, args, compute)
+
+
+def _execute_parallel(
+    order, children, memo, node_args, release, execute_one, pool
+):
+    """Run the expressions in `order` on the threads of `pool`.
+
+    An expression runs as soon as all of its scheduled arguments have been
+    computed: one of the expressions that become ready at the same time runs
+    in the calling thread and the others are submitted to `pool`. Results are
+    stored in `memo` and released by the calling thread, so tasks never
+    mutate shared state.
+    """
+    position = {}
+    waiting = {}
+    consumers = collections.defaultdict(list)
+    for i, node_expr in enumerate(order):
+        node = node_expr.op()
+        position[node] = i
+        waiting[node] = len(children[node])
+        for child in children[node]:
+            consumers[child].append(node_expr)
+
+    ready = [node_expr for node_expr in order if not waiting[node_expr.op()]]
+    pending = {}
+
+    def complete(node_expr, result):
+        node = node_expr.op()
+        memo[node] = result
+        release(node)
+        for consumer in consumers.pop(node, ()):
+            consumer_op = consumer.op()
+            waiting[consumer_op] -= 1
+            if not waiting[consumer_op]:
+                ready.append(consumer)
+
+    try:
+        while ready or pending:
+            if ready:
+                ready.sort(key=lambda node_expr: position[node_expr.op()])
+                first, *rest = ready
+                del ready[:]
+                for node_expr in rest:
+                    task = pool.submit(
+                        execute_one, node_expr, node_args(node_expr.op())
+                    )
+                    pending[task] = node_expr
+                complete(first, execute_one(first, node_args(first.op())))
+                continue
+
+            # handle completions in schedule order so that the order in
+            # which consumers become ready doesn't depend on timing
+            for task in sorted(
+                pool.wait(pending),
+                key=lambda task: position[pending[task].op()],
+            ):
+                complete(pending.pop(task), task.result())
+    except BaseException:
+        for task in pending:
+            task.cancel()
+        raise
+
+
 def execute_bottom_up(
-    expr, scope, aggcontext=None, post_execute_=None, clients=None, **kwargs
+    expr,
+    scope,
+    aggcontext=None,
+    post_execute_=None,
+    clients=None,
+    memo=None,
+    **kwargs,
 ):
     """Execute `expr` bottom-up.
 
@@ -248,6 +884,10 @@ def execute_bottom_up(
     expr : ibis.expr.types.Expr
     scope : Mapping[ibis.expr.operations.Node, object]
     aggcontext : Optional[ibis.pandas.aggcontext.AggregationContext]
+    memo : Optional[ExecutionMemo]
+        Storage for the results of intermediate nodes. Every distinct node is
+        computed once, and its result is dropped from `memo` as soon as the
+        last node consuming it has been computed.
     kwargs : Dict[str, object]
 
     Returns
@@ -257,6 +897,19 @@ def execute_bottom_up(
         Union[pandas.Series, pandas.DataFrame, scalar_types]
     ]
         A mapping from node to the computed result of that Node
+
+    Notes
+    -----
+    The operations are computed in the order produced by
+    :func:`~ibis.pandas.core.schedule` using a work list rather than by
+    recursing into each argument, so the depth of an expression is not
+    limited by the Python stack.
+
+    When ``ibis.options.pandas.num_threads`` is greater than one, operations
+    whose arguments have all been computed run concurrently on the
+    :class:`~ibis.pandas.threads.ExecutionPool` of the execution. Each
+    operation still sees exactly the same arguments, so the result doesn't
+    depend on the number of threads.
     """
     assert post_execute_ is not None, 'post_execute_ is None'
     op = expr.op()
@@ -265,61 +918,73 @@ def execute_bottom_up(
     # into execute_bottom_up, which will then terminate
     if op in scope:
         return scope
-    elif isinstance(op, ops.Literal):
-        # special case literals to avoid the overhead of dispatching
-        # execute_node
-        return {
-            op: execute_literal(
-                op, op.value, expr.type(), aggcontext=aggcontext, **kwargs
-            )
-        }
-
-    # figure out what arguments we're able to compute on based on the
-    # expressions inputs. things like expressions, None, and scalar types are
-    # computable whereas ``list``s are not
-    computable_args = [arg for arg in op.inputs if is_computable_input(arg)]
 
-    # recursively compute each node's arguments until we've changed type
-    scopes = [
-        execute_bottom_up(
-            arg,
-            scope,
-            aggcontext=aggcontext,
-            post_execute_=post_execute_,
-            clients=clients,
-            **kwargs,
-        )
-        if hasattr(arg, 'op')
-        else {arg: arg}
-        for arg in computable_args
-    ]
-
-    # if we're unable to find data then raise an exception
-    if not scopes and computable_args:
-        raise com.UnboundExpressionError(
-            'Unable to find data for expression:\n{}'.format(repr(expr))
+    if memo is None:
+        memo = ExecutionMemo()
+
+    arguments = {}
+    order, refcounts = schedule(expr, scope, memo=memo, arguments=arguments)
+
+    # the scheduled operations that each operation consumes; the others are
+    # in scope
+    children = {}
+    for node, args in arguments.items():
+        child_ops = _child_ops(args)
+        children[node] = [child for child in child_ops if child in refcounts]
+
+    profile = current_profile()
+    if profile is not None:
+        for child in toolz.unique(
+            child
+            for args in arguments.values()
+            for child in _child_ops(args)
+            if child in scope
+        ):
+            profile.served_from_scope(child)
+
+    def lookup(arg):
+        if not hasattr(arg, 'op'):
+            return arg
+        arg_op = arg.op()
+        return scope[arg_op] if arg_op in scope else memo[arg_op]
+
+    def node_args(node):
+        args = arguments[node]
+        values = tuple(map(lookup, args))
+        values = encoding.decode_arguments(node, args, values)
+        values = fixed_point.decode_arguments(
+            node, args, values, aggcontext=aggcontext
         )
+        return intervals.decode_arguments(node, args, values)
 
-    # there should be exactly one dictionary per computable argument
-    assert len(computable_args) == len(scopes)
+    def release(node):
+        # release intermediate results that no other node needs
+        for child in children[node]:
+            refcounts[child] -= 1
+            if not refcounts[child]:
+                del memo[child]
 
-    new_scope = toolz.merge(scopes)
-
-    # pass our computed arguments to this node's execute_node implementation
-    data = [
-        new_scope[arg.op()] if hasattr(arg, 'op') else arg
-        for arg in computable_args
-    ]
-    result = execute_node(
-        op,
-        *data,
+    execute_one = functools.partial(
+        _execute_scheduled,
         scope=scope,
         aggcontext=aggcontext,
         clients=clients,
+        post_execute_=post_execute_,
         **kwargs,
     )
-    computed = post_execute_(op, result)
-    return {op: computed}
+
+    pool = current_pool()
+    if pool is not None and len(order) > 1:
+        _execute_parallel(
+            order, children, memo, node_args, release, execute_one, pool
+        )
+    else:
+        for node_expr in order:
+            node = node_expr.op()
+            memo[node] = execute_one(node_expr, node_args(node))
+            release(node)
+
+    return {op: memo[op]}
 
 
 execute = Dispatcher('execute')
@@ -368,7 +1033,10 @@ def main_execute(expr, params=None, scope=None, aggcontext=None, **kwargs):
     params = {k.op() if hasattr(k, 'op') else k: v for k, v in params.items()}
 
     new_scope = toolz.merge(scope, params)
-    return execute_with_scope(expr, new_scope, aggcontext=aggcontext, **kwargs)
+    with execution_pool():
+        return execute_with_scope(
+            expr, new_scope, aggcontext=aggcontext, **kwargs
+        )
 
 
 def execute_and_reset(
@@ -413,10 +1081,35 @@ def execute_and_reset(
     result = execute(
         expr, params=params, scope=scope, aggcontext=aggcontext, **kwargs
     )
+    return reset_result(expr, result)
+
+
+def reset_result(expr, result):
+    """Reset the index of the `result` of `expr`, if it has an index, and
+    decode its dictionary encoded string columns, its scaled decimal columns
+    and the month counts of its calendar intervals.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    result : Union[
+        pandas.Series, pandas.DataFrame, ibis.pandas.core.simple_types
+    ]
+
+    Returns
+    -------
+    result : Union[
+        pandas.Series, pandas.DataFrame, ibis.pandas.core.simple_types
+    ]
+        A DataFrame has the columns of the schema of `expr`, in order
+    """
     if isinstance(result, pd.DataFrame):
         schema = expr.schema()
-        df = result.reset_index()
-        return df.loc[:, schema.names]
+        result = result.reset_index().loc[:, schema.names]
     elif isinstance(result, pd.Series):
-        return result.reset_index(drop=True)
-    return result
+        result = result.reset_index(drop=True)
+    else:
+        return result
+    result = encoding.decode_result(expr, result)
+    result = fixed_point.decode_result(expr, result)
+    return intervals.decode_result(expr, result)
@@ -1,14 +1,79 @@
 from __future__ import absolute_import
 
+import collections
 from functools import partial
 
+import multipledispatch
 import toolz
-from multipledispatch import Dispatcher
+from multipledispatch.conflict import edge, supercedes
 
 import ibis
 import ibis.common.exceptions as com
 import ibis.expr.operations as ops
 
+
+class DispatchCache(collections.OrderedDict):
+    """A mapping from argument types to the implementation they dispatch to,
+    which forgets its oldest entries once it holds more than `maxsize`.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, types, func):
+        super().__setitem__(types, func)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+class Dispatcher(multipledispatch.Dispatcher):
+    """A :class:`multipledispatch.Dispatcher` that resolves the
+    implementation for the types of a call from the signatures matching
+    them.
+
+    :class:`multipledispatch.Dispatcher` sorts every registered signature by
+    specificity before resolving a call, and again after every registration,
+    which takes seconds for the hundreds of ``execute_node`` rules.
+    Resolutions are cached per tuple of argument types in a
+    :class:`DispatchCache` of `cache_size` entries.
+    """
+
+    def __init__(self, name, doc=None, cache_size=4096):
+        super().__init__(name, doc=doc)
+        self._cache = DispatchCache(cache_size)
+
+    def dispatch(self, *types):
+        """Return the implementation of the most specific signature matching
+        `types`, or None if none matches.
+        """
+        try:
+            return self.funcs[types]
+        except KeyError:
+            pass
+
+        candidates = [
+            signature
+            for signature in self.funcs
+            if supercedes(types, signature)
+        ]
+        best = [
+            candidate
+            for candidate in candidates
+            if not any(
+                edge(other, candidate)
+                for other in candidates
+                if other is not candidate
+            )
+        ]
+        if len(best) == 1:
+            return self.funcs[best[0]]
+        if not candidates:
+            return None
+        # break ties between ambiguous signatures like multipledispatch does
+        return super().dispatch(*types)
+
+
 # Individual operation execution
 execute_node = Dispatcher(
     'execute_node',
@@ -78,6 +143,49 @@ datatype : ibis.expr.datatypes.DataType
 )
 
 
+execute_table_columns = Dispatcher(
+    'execute_table_columns',
+    doc="""\
+Read only some of the columns of a physical table.
+
+Parameters
+----------
+op : ibis.expr.operations.PhysicalTable
+client : ibis.client.Client
+    The client that `op` belongs to
+columns : Tuple[str, ...]
+    The names of the columns to read, in the order of the table's schema
+
+Returns
+-------
+data : pandas.DataFrame
+""",
+)
+
+
+execute_table_chunks = Dispatcher(
+    'execute_table_chunks',
+    doc="""\
+Read a physical table in batches of rows.
+
+Parameters
+----------
+op : ibis.expr.operations.PhysicalTable
+client : ibis.client.Client
+    The client that `op` belongs to
+columns : Optional[Tuple[str, ...]]
+    The names of the columns to read, in the order of the table's schema, or
+    None to read every column
+chunksize : int
+    The largest number of rows in a batch
+
+Returns
+-------
+chunks : Iterator[pandas.DataFrame]
+""",
+)
+
+
 post_execute = Dispatcher(
     'post_execute',
     doc="""\
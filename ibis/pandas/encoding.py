@@ -0,0 +1,257 @@
+"""Dictionary encoding of low-cardinality string columns.
+
+Columns of category type, and string columns of pandas client tables with few
+distinct values relative to their number of rows, are read as pandas
+Categoricals whose categories are sorted, so that filters, joins, group keys
+and comparisons to scalars work on their integer codes. Operations that don't
+support encoded columns receive them decoded, and the results of
+:func:`ibis.pandas.core.execute_and_reset` are decoded, so encoding never
+changes the result of an expression.
+
+See Also
+--------
+ibis.options.pandas.dictionary_encoding_ratio
+"""
+
+from __future__ import absolute_import
+
+import numpy as np
+import pandas as pd
+from pandas.core.groupby import SeriesGroupBy
+
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+from ibis.compat import CategoricalDtype
+
+# operations that compute the same result from encoded string columns
+_ENCODED_OPS = frozenset(
+    {
+        ops.TableColumn,
+        ops.Contains,
+        ops.NotContains,
+        ops.IsNull,
+        ops.NotNull,
+        ops.Count,
+        ops.CountDistinct,
+        ops.HLLCardinality,
+    }
+)
+
+
+def is_encoded(values):
+    """Return whether `values` is a dictionary encoded column."""
+    return isinstance(values, pd.Series) and isinstance(
+        values.dtype, CategoricalDtype
+    )
+
+
+def encode_column(column, ratio):
+    """Encode the string `column` if it has at most `ratio` distinct values
+    per row.
+
+    Columns with missing values other than None, such as NaN, are not
+    encoded, because they are decoded as None.
+
+    Returns
+    -------
+    pd.Series
+        The encoded column, or `column` itself if it is not encoded
+    """
+    if column.dtype != np.object_ or not len(column.index):
+        return column
+    missing = column.values[column.isnull().values]
+    if any(value is not None for value in missing):
+        return column
+    try:
+        codes, categories = pd.factorize(column, sort=True)
+    except TypeError:
+        # values that cannot be sorted, such as strings mixed with bytes
+        return column
+    if len(categories) > ratio * len(column.index):
+        return column
+    return pd.Series(
+        pd.Categorical.from_codes(codes, categories=categories),
+        index=column.index,
+        name=column.name,
+    )
+
+
+def encode_frame(df, schema, ratio):
+    """Encode the columns of `df` that have category type in `schema`, and
+    its string columns that have at most `ratio` distinct values per row.
+
+    Returns
+    -------
+    pd.DataFrame
+        `df` itself if no column is encoded, otherwise a shallow copy of it
+        that shares its index and other columns
+    """
+    encoded = {}
+    for name, dtype in schema.items():
+        if name not in df.columns:
+            continue
+        column = df[name]
+        if isinstance(dtype, dt.Category):
+            if not is_encoded(column):
+                encoded[name] = column.astype(CategoricalDtype())
+        elif isinstance(dtype, dt.String) and ratio > 0:
+            result = encode_column(column, ratio)
+            if result is not column:
+                encoded[name] = result
+
+    if not encoded:
+        return df
+    result = df.copy(deep=False)
+    for name, column in encoded.items():
+        result[name] = column
+    return result
+
+
+def decode(values):
+    """Decode the dictionary encoded column `values`, whose missing values
+    are None.
+    """
+    return values.astype(np.object_).where(values.notnull(), None)
+
+
+def _has_encoded(value):
+    if isinstance(value, SeriesGroupBy):
+        return is_encoded(value.obj)
+    if isinstance(value, list):
+        # the values of a ValueList
+        return any(map(_has_encoded, value))
+    return is_encoded(value)
+
+
+def _decode_argument(expr, value):
+    if isinstance(value, list) and isinstance(expr, ir.ListExpr):
+        return list(map(_decode_argument, expr.op().values, value))
+    if not isinstance(expr, ir.StringValue):
+        return value
+    if is_encoded(value):
+        return decode(value)
+    if isinstance(value, SeriesGroupBy) and is_encoded(value.obj):
+        return decode(value.obj).groupby(value.grouper.groupings)
+    return value
+
+
+def _shared_categories(values):
+    encoded = [value for value in values if is_encoded(value)]
+    return all(
+        value.cat.categories.equals(encoded[0].cat.categories)
+        for value in encoded[1:]
+    )
+
+
+def decode_arguments(op, exprs, values):
+    """Decode the encoded string columns among the computed arguments
+    `values` of `op` if it does not support them.
+
+    Parameters
+    ----------
+    op : ibis.expr.operations.Node
+    exprs : Sequence[object]
+        The arguments of `op` that were computed
+    values : Tuple[object, ...]
+        The computed value of every argument in `exprs`
+
+    Returns
+    -------
+    Tuple[object, ...]
+    """
+    if type(op) in _ENCODED_OPS or not any(map(_has_encoded, values)):
+        return values
+    if isinstance(op, (ops.Equals, ops.NotEquals)) and _shared_categories(
+        values
+    ):
+        # categoricals compare to scalars and to other columns, except to
+        # categoricals with other categories
+        return values
+    return tuple(map(_decode_argument, exprs, values))
+
+
+def unify_categories(left, right):
+    """Encode the encoded columns `left` and `right` with the sorted union of
+    their categories, so that they are compared by their codes.
+
+    Returns
+    -------
+    Tuple[pd.Series, pd.Series]
+    """
+    if left.cat.categories.equals(right.cat.categories):
+        return left, right
+    categories = left.cat.categories.union(right.cat.categories)
+    return (
+        left.cat.set_categories(categories),
+        right.cat.set_categories(categories),
+    )
+
+
+def observed_groups(by):
+    """Return whether grouping by the expressions `by` computes only the
+    groups that occur.
+
+    Columns of category type have a group for every category, occurring or
+    not. Encoded string columns only have the groups that occur.
+    """
+    return not any(isinstance(key.type(), dt.Category) for key in by)
+
+
+def decode_grouping_keys(by, data, keys):
+    """Decode the encoded string columns among the grouping `keys` of `data`,
+    which are column names or Series, if grouping by the expressions `by`
+    also computes the groups that don't occur.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, List[Union[str, pd.Series]]]
+    """
+    if observed_groups(by):
+        return data, keys
+    copied = False
+    decoded = []
+    for expr, key in zip(by, keys):
+        column = data[key] if isinstance(key, str) else key
+        if isinstance(expr.type(), dt.Category) or not is_encoded(column):
+            decoded.append(key)
+        elif isinstance(key, str):
+            if not copied:
+                data = data.copy(deep=False)
+                copied = True
+            data[key] = decode(column)
+            decoded.append(key)
+        else:
+            decoded.append(decode(column))
+    return data, decoded
+
+
+def sort_groups(result):
+    """Sort the `result` of a grouped aggregation by its encoded grouping
+    keys, which pandas leaves in order of appearance when it only computes the
+    groups that occur.
+    """
+    index = result.index
+    levels = index.levels if isinstance(index, pd.MultiIndex) else [index]
+    if any(isinstance(level, pd.CategoricalIndex) for level in levels):
+        return result.sort_index()
+    return result
+
+
+def decode_result(expr, result):
+    """Decode the encoded string columns of the `result` of `expr`."""
+    if isinstance(result, pd.DataFrame):
+        encoded = [
+            name
+            for name, dtype in expr.schema().items()
+            if not isinstance(dtype, dt.Category) and is_encoded(result[name])
+        ]
+        if not encoded:
+            return result
+        result = result.copy(deep=False)
+        for name in encoded:
+            result[name] = decode(result[name])
+        return result
+    if is_encoded(result) and not isinstance(expr.type(), dt.Category):
+        return decode(result)
+    return result
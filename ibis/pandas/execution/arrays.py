@@ -4,12 +4,16 @@ import pandas as pd
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.operations as ops
+import ibis.pandas.execution.nested_kernels as kernels
 from ibis.pandas.dispatch import execute_node
 
 
 @execute_node.register(ops.ArrayLength, pd.Series)
 def execute_array_length(op, data, **kwargs):
-    return data.apply(len)
+    result = kernels.array_length(data, op.arg.type())
+    if result is None:
+        return data.apply(len)
+    return result
 
 
 @execute_node.register(ops.ArrayLength, list)
@@ -29,6 +33,9 @@ def execute_array_slice_scalar(op, data, start, stop, **kwargs):
 
 @execute_node.register(ops.ArrayIndex, pd.Series, int)
 def execute_array_index(op, data, index, **kwargs):
+    result = kernels.array_index(data, op.arg.type(), index)
+    if result is not None:
+        return result
     return data.apply(
         lambda array, index=index: (
             array[index] if -len(array) <= index < len(array) else None
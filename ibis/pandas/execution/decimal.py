@@ -9,6 +9,7 @@ import pandas as pd
 
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+import ibis.pandas.fixed_point as fixed_point
 from ibis.pandas.dispatch import execute_node
 
 
@@ -108,6 +109,13 @@ def execute_round_decimal_no_places(op, data, _, **kwargs):
 
 @execute_node.register(ops.Cast, pd.Series, dt.Decimal)
 def execute_cast_series_to_decimal(op, data, type, **kwargs):
+    from_type = op.arg.type()
+    result = fixed_point.cast(data, from_type, type)
+    if result is not None:
+        return result
+    if fixed_point.is_scaled(op.arg, data):
+        data = fixed_point.decode(data, from_type.scale)
+
     precision = type.precision
     scale = type.scale
     context = decimal.Context(prec=precision)
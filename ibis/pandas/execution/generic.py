@@ -20,7 +20,12 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 import ibis.pandas.aggcontext as agg_ctx
+import ibis.pandas.encoding as encoding
+import ibis.pandas.fixed_point as fixed_point
+import ibis.pandas.intervals as intervals
+import ibis.pandas.partition as partition
 from ibis.compat import DatetimeTZDtype
+from ibis.pandas.client import PandasClient, PandasTable
 from ibis.pandas.core import (
     boolean_types,
     execute,
@@ -32,8 +37,14 @@ from ibis.pandas.core import (
     simple_types,
     timedelta_types,
 )
-from ibis.pandas.dispatch import execute_literal, execute_node
+from ibis.pandas.dispatch import (
+    execute_literal,
+    execute_node,
+    execute_table_chunks,
+    execute_table_columns,
+)
 from ibis.pandas.execution import constants
+from ibis.pandas.threads import parallel_map
 
 
 # By default return the literal value
@@ -70,6 +81,8 @@ def execute_node_literal_datatype(op, datatype, **kwargs):
     ops.Literal, timedelta_types + (str,) + integer_types, dt.Interval
 )
 def execute_interval_literal(op, value, dtype, **kwargs):
+    if dtype.unit in intervals.CALENDAR_UNITS:
+        return intervals.from_integer(value, dtype.unit)
     return pd.Timedelta(value, dtype.unit)
 
 
@@ -368,6 +381,12 @@ def execute_round_scalars(op, data, places, **kwargs):
     ops.Round, pd.Series, (pd.Series, np.integer, type(None), int)
 )
 def execute_round_series(op, data, places, **kwargs):
+    if fixed_point.is_scaled(op.arg, data):
+        scale = op.arg.type().scale
+        result = fixed_point.round_half_even(data, scale, places)
+        if result is not None:
+            return result
+        data = fixed_point.decode(data, scale)
     if data.dtype == np.dtype(np.object_):
         return vectorize_object(op, data, places, **kwargs)
     result = data.round(places or 0)
@@ -379,6 +398,130 @@ def execute_table_column_df_or_df_groupby(op, data, **kwargs):
     return data[op.name]
 
 
+# Reductions that map directly onto a pandas groupby aggregation method
+_FUSABLE_REDUCTIONS = {
+    ops.Sum: 'sum',
+    ops.Mean: 'mean',
+    ops.Min: 'min',
+    ops.Max: 'max',
+    ops.Count: 'count',
+    ops.CountDistinct: 'nunique',
+    ops.HLLCardinality: 'nunique',
+    ops.StandardDev: 'std',
+    ops.Variance: 'var',
+}
+
+
+def _fusable_masked_column(how, column):
+    """Return whether `how` gives the same answer on `column` when the rows
+    excluded by a ``where`` mask are replaced with NULL.
+    """
+    if how in {'count', 'nunique'}:
+        return True
+    kind = column.dtype.kind
+    if how in {'sum', 'min', 'max'}:
+        # masking introduces NaN, which would upcast other types
+        return kind == 'f'
+    return kind in 'iuf'
+
+
+def _execute_fused_metrics(op, data, grouping_keys, scope=None, **kwargs):
+    """Compute the plain column reductions of an aggregation in a single
+    ``groupby(...).agg(...)`` call.
+
+    Parameters
+    ----------
+    op : ops.Aggregation
+    data : pd.DataFrame
+        The (already filtered) input to the aggregation
+    grouping_keys : List[Union[str, pd.Series]]
+    scope : Mapping
+
+    Returns
+    -------
+    Dict[int, pd.Series]
+        Results keyed by the position of the metric in ``op.metrics``. Metrics
+        that cannot be fused are absent and must be computed individually.
+    """
+    table_op = op.table.op()
+    data_scope = None
+    columns = []
+    masked = {}
+    specs = {}
+    for i, metric in enumerate(op.metrics):
+        metric_op = metric.op()
+        how = _FUSABLE_REDUCTIONS.get(type(metric_op))
+        if how is None:
+            continue
+        if isinstance(metric_op, ops.VarianceBase) and metric_op.how == 'pop':
+            continue
+
+        arg = metric_op.arg
+        if not isinstance(arg, ir.ColumnExpr):
+            continue
+        arg_op = arg.op()
+        if not isinstance(arg_op, ops.TableColumn):
+            continue
+        if not arg_op.table.op().equals(table_op):
+            continue
+
+        name = arg_op.name
+        if fixed_point.is_scaled(arg, data[name]) and not (
+            fixed_point.can_reduce(how, data[name])
+        ):
+            continue
+        where = metric_op.where
+        if where is None:
+            if name not in columns:
+                columns.append(name)
+        else:
+            column = data[name]
+            if not _fusable_masked_column(how, column):
+                continue
+            if data_scope is None:
+                data_scope = toolz.merge(scope, {table_op: data})
+            mask = execute(where, scope=data_scope, **kwargs)
+            if not isinstance(mask, pd.Series) or len(mask) != len(data):
+                continue
+            name = ibis.util.guid()
+            masked[name] = column.where(mask.values)
+
+        specs[i] = name, how, metric.get_name()
+
+    if not specs:
+        return {}
+
+    frame = data.loc[:, columns]
+    for name, column in masked.items():
+        frame[name] = column
+    for name, how, _ in specs.values():
+        if how in {'min', 'max'} and encoding.is_encoded(frame[name]):
+            # encoded columns have no order
+            frame[name] = encoding.decode(frame[name])
+    keys = [
+        data[key] if isinstance(key, str) else key for key in grouping_keys
+    ]
+    aggregations = collections.defaultdict(list)
+    for name, how, _ in specs.values():
+        if how not in aggregations[name]:
+            aggregations[name].append(how)
+    result = frame.groupby(
+        keys, observed=encoding.observed_groups(op.by)
+    ).agg(dict(aggregations))
+    return {
+        i: result[name, how].rename(metric_name)
+        for i, (name, how, metric_name) in specs.items()
+    }
+
+
+def _metric_series(value, name):
+    # a reduction without grouping keys computes a single value, which can be
+    # a list, set or tuple
+    if not isinstance(value, pd.Series):
+        value = [value]
+    return pd.Series(value, name=name)
+
+
 @execute_node.register(ops.Aggregation, pd.DataFrame)
 def execute_aggregation_dataframe(op, data, scope=None, **kwargs):
     assert op.metrics, 'no metrics found during aggregation execution'
@@ -413,20 +556,125 @@ def execute_aggregation_dataframe(op, data, scope=None, **kwargs):
             for by, by_op in grouping_key_pairs
             if hasattr(by_op, 'name')
         )
-        source = data.groupby(grouping_keys)
+        data, grouping_keys = encoding.decode_grouping_keys(
+            op.by, data, grouping_keys
+        )
     else:
-        source = data
+        grouping_keys = []
+
+    num_processes = ibis.options.pandas.num_processes
+    # every partition would compute the groups of categories that don't occur
+    if (
+        grouping_keys
+        and encoding.observed_groups(op.by)
+        and num_processes > 1
+        and len(data.index) >= ibis.options.pandas.partition_min_rows
+        and not partition.in_worker_process()
+        and isinstance(kwargs.get('aggcontext'), agg_ctx.Summarize)
+    ):
+        return _execute_partitioned_aggregation(
+            op, data, grouping_keys, columns, num_processes, scope, **kwargs
+        )
+    return _aggregate(op, data, grouping_keys, columns, scope, **kwargs)
 
+
+def _execute_partitioned_aggregation(
+    op, data, grouping_keys, columns, num_processes, scope, **kwargs
+):
+    """Aggregate the partitions of `data` by the hash of their grouping keys
+    in `num_processes` processes.
+
+    Every group is in exactly one partition, so the results of the
+    partitions are concatenated and sorted by group like those of a single
+    aggregation.
+    """
+    if not data.index.is_unique:
+        # grouping keys cannot be aligned with the rows of data
+        return _aggregate(op, data, grouping_keys, columns, scope, **kwargs)
+
+    # computed grouping keys are aligned with the rows of data by index,
+    # but partitions are taken by position
+    grouping_keys = [
+        key
+        if isinstance(key, str) or key.index.equals(data.index)
+        else key.reindex(data.index)
+        for key in grouping_keys
+    ]
+    keys = [
+        data[key] if isinstance(key, str) else key for key in grouping_keys
+    ]
+    partitions = partition.hash_partitions(keys, num_processes)
+
+    def aggregate_partition(i):
+        positions = partitions[i]
+        return _aggregate(
+            op,
+            data.take(positions),
+            [
+                key if isinstance(key, str) else key.take(positions)
+                for key in grouping_keys
+            ],
+            columns,
+            scope,
+            **kwargs,
+        )
+
+    results = partition.map_partitions(
+        aggregate_partition, len(partitions), num_processes
+    )
+    key_names = [columns.get(key.name, key.name) for key in keys]
+    return (
+        pd.concat(results, ignore_index=True)
+        .sort_values(key_names, kind='mergesort')
+        .reset_index(drop=True)
+    )
+
+
+def _compute_groups(grouped):
+    """Compute the groups of the GroupBy `grouped`, which pandas computes
+    the first time they are used, and return their number.
+    """
+    return grouped.ngroups
+
+
+def _aggregate(op, data, grouping_keys, columns, scope, **kwargs):
+    """Compute the metrics of the aggregation `op` over `data`, grouped by
+    `grouping_keys` if there are any, and filter them by its having clauses.
+    """
+    source = (
+        data.groupby(grouping_keys, observed=encoding.observed_groups(op.by))
+        if grouping_keys
+        else data
+    )
     new_scope = toolz.merge(scope, {op.table.op(): source})
-    pieces = [
-        pd.Series(
-            execute(metric, scope=new_scope, **kwargs), name=metric.get_name()
+
+    fused = {}
+    if grouping_keys and isinstance(
+        kwargs.get('aggcontext'), agg_ctx.Summarize
+    ):
+        fused = _execute_fused_metrics(
+            op, data, grouping_keys, scope=scope, **kwargs
         )
-        for metric in op.metrics
-    ]
+    if grouping_keys:
+        # compute the groups before the metrics share them across threads
+        _compute_groups(source)
+
+    def compute_metric(i):
+        metric = op.metrics[i]
+        return _metric_series(
+            execute(metric, scope=new_scope, **kwargs), metric.get_name()
+        )
+
+    remaining = [i for i in range(len(op.metrics)) if i not in fused]
+    fused.update(zip(remaining, parallel_map(compute_metric, remaining)))
+    pieces = [fused[i] for i in range(len(op.metrics))]
+
+    result = pd.concat(pieces, axis=1)
+    if grouping_keys:
+        result = encoding.sort_groups(result)
 
     # group by always needs a reset to get the grouping key back as a column
-    result = pd.concat(pieces, axis=1).reset_index()
+    result = result.reset_index()
     result.columns = [columns.get(c, c) for c in result.columns]
 
     if op.having:
@@ -449,6 +697,7 @@ def execute_aggregation_dataframe(op, data, scope=None, **kwargs):
         assert len(predicate) == len(
             result
         ), 'length of predicate does not match length of DataFrame'
+        predicate = encoding.sort_groups(predicate)
         result = result.loc[predicate.values]
     return result
 
@@ -556,7 +805,12 @@ def execute_count_frame_groupby(op, data, _, **kwargs):
 @execute_node.register(ops.Reduction, pd.Series, (pd.Series, type(None)))
 def execute_reduction_series_mask(op, data, mask, aggcontext=None, **kwargs):
     operand = data[mask] if mask is not None else data
-    return aggcontext.agg(operand, type(op).__name__.lower())
+    result = aggcontext.agg(operand, type(op).__name__.lower())
+    if isinstance(op, (ops.Sum, ops.Min, ops.Max)) and fixed_point.is_scaled(
+        op.arg, operand
+    ):
+        return fixed_point.to_decimal(result, op.arg.type().scale)
+    return result
 
 
 @execute_node.register(
@@ -761,6 +1015,7 @@ def execute_series_distinct(op, data, **kwargs):
 
 @execute_node.register(ops.Union, pd.DataFrame, pd.DataFrame, bool)
 def execute_union_dataframe_dataframe(op, left, right, distinct, **kwargs):
+    left, right = fixed_point.decode_frames([left, right], op.left.schema())
     result = pd.concat([left, right], axis=0)
     return result.drop_duplicates() if distinct else result
 
@@ -872,11 +1127,26 @@ def execute_node_where_scalar_scalar_series(op, cond, true, false, **kwargs):
     return pd.Series(np.repeat(true, len(false))) if cond else false
 
 
-@execute_node.register(
-    ibis.pandas.client.PandasTable, ibis.pandas.client.PandasClient
-)
+@execute_node.register(PandasTable, PandasClient)
 def execute_database_table_client(op, client, **kwargs):
-    return client.dictionary[op.name]
+    return client.table_data(op.name, op.schema)
+
+
+@execute_table_columns.register(PandasTable, PandasClient, tuple)
+def execute_database_table_client_columns(op, client, columns):
+    df = client.table_data(op.name, op.schema)
+    return df.loc[:, df.columns.isin(columns)]
+
+
+@execute_table_chunks.register(
+    PandasTable, PandasClient, (tuple, type(None)), int
+)
+def execute_database_table_client_chunks(op, client, columns, chunksize):
+    df = client.table_data(op.name, op.schema)
+    if columns is not None:
+        df = df.loc[:, df.columns.isin(columns)]
+    for start in range(0, len(df.index), chunksize):
+        yield df.iloc[start : start + chunksize]
 
 
 MATH_FUNCTIONS = {
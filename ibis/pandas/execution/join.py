@@ -1,9 +1,17 @@
+import functools
 import operator
+from collections import OrderedDict
 
+import numpy as np
 import pandas as pd
+import toolz
 
+import ibis
 import ibis.expr.operations as ops
+import ibis.pandas.encoding as encoding
+import ibis.pandas.fixed_point as fixed_point
 import ibis.util
+from ibis.pandas.client import PandasClient, PandasTable
 from ibis.pandas.core import execute
 from ibis.pandas.dispatch import execute_node
 from ibis.pandas.execution import constants
@@ -20,36 +28,624 @@ def _compute_join_column(column_expr, **kwargs):
     return new_column, root_table
 
 
+def _joined_frame(left, right, left_values, right_values, shared=()):
+    """Build the result of a join of `left` and `right` from the values of
+    their joined rows.
+
+    Parameters
+    ----------
+    left, right : pd.DataFrame
+    left_values, right_values : Callable[[ArrayLike], ArrayLike]
+        Compute the values of a column of the join from the values of the
+        column of `left` or `right`
+    shared : Collection[str]
+        The key columns that `left` and `right` are joined on by name, whose
+        values are taken from `left` only
+
+    Returns
+    -------
+    pd.DataFrame
+        The join, with the same columns as :func:`pandas.merge`
+    """
+    overlapping = (
+        frozenset(left.columns) & frozenset(right.columns)
+    ) - frozenset(shared)
+    left_suffix, right_suffix = constants.JOIN_SUFFIXES
+
+    columns = OrderedDict()
+    for name, column in left.items():
+        new_name = name + left_suffix if name in overlapping else name
+        columns[new_name] = left_values(_column_values(column))
+    for name, column in right.items():
+        if name not in shared:
+            new_name = name + right_suffix if name in overlapping else name
+            columns[new_name] = right_values(_column_values(column))
+    return pd.DataFrame(columns)
+
+
+def _column_values(column):
+    # numpy arrays, or extension arrays for other dtypes such as timestamps
+    # with a time zone, which numpy would lose
+    if isinstance(column.dtype, np.dtype):
+        return column.values
+    return column.array
+
+
+def _tile(values, reps):
+    """Concatenate `reps` copies of an array of column values."""
+    if isinstance(values, np.ndarray):
+        return np.tile(values, reps)
+    return values.take(np.tile(np.arange(len(values)), reps))
+
+
 @execute_node.register(ops.CrossJoin, pd.DataFrame, pd.DataFrame)
 def execute_cross_join(op, left, right, **kwargs):
     """Execute a cross join in pandas.
 
     Notes
     -----
-    We create a dummy column of all :data:`True` instances and use that as the
-    join key. This results in the desired Cartesian product behavior guaranteed
-    by cross join.
+    Every column of the result is computed directly from a column of one of
+    the inputs, by repeating each left value once for every right row and
+    concatenating a copy of the right values for every left row, so that
+    the inputs are neither copied nor hashed.
+
+    """
+    nleft = len(left.index)
+    nright = len(right.index)
+    return _joined_frame(
+        left,
+        right,
+        lambda values: values.repeat(nright),
+        lambda values: _tile(values, nleft),
+    )
+
+
+# Comparisons a range join can probe for, keyed by the operation and read as
+# ``left <op> right``
+_RANGE_JOIN_COMPARISONS = {
+    ops.Less: operator.lt,
+    ops.LessEqual: operator.le,
+    ops.Greater: operator.gt,
+    ops.GreaterEqual: operator.ge,
+}
+
+_FLIPPED_COMPARISONS = {
+    operator.lt: operator.gt,
+    operator.le: operator.ge,
+    operator.gt: operator.lt,
+    operator.ge: operator.le,
+}
+
+
+def _join_column_values(column_expr, tables, **kwargs):
+    """Compute a join column and return its name or values, its values and
+    the input of the join (the key of `tables`) it comes from.
+    """
+    roots = column_expr.op().root_tables()
+    if len(roots) != 1 or roots[0] not in tables:
+        raise TypeError(
+            'Join predicates must compare columns of the left table with '
+            'columns of the right table'
+        )
+    column, root = _compute_join_column(column_expr, **kwargs)
+    values = tables[root][column] if isinstance(column, str) else column
+    return column, values, root
+
+
+def _range_join_comparisons(predicate, left_op, tables, **kwargs):
+    """Convert a comparison or between predicate to a list of
+    ``(left_column, left_values, comparison, right_values)`` tuples that
+    together mean the same thing.
+    """
+    if type(predicate) is ops.Between:
+        arg = predicate.arg
+        return [
+            comparison
+            for bound, op_type in (
+                (predicate.lower_bound, ops.GreaterEqual),
+                (predicate.upper_bound, ops.LessEqual),
+            )
+            for comparison in _range_join_comparisons(
+                op_type(arg, bound), left_op, tables, **kwargs
+            )
+        ]
+
+    try:
+        comparison = _RANGE_JOIN_COMPARISONS[type(predicate)]
+    except KeyError:
+        raise TypeError(
+            'Only equality, comparison and between join predicates supported '
+            'with pandas'
+        )
+
+    lhs, lhs_values, lhs_root = _join_column_values(
+        predicate.left, tables, **kwargs
+    )
+    rhs, rhs_values, rhs_root = _join_column_values(
+        predicate.right, tables, **kwargs
+    )
+    if lhs_root == rhs_root:
+        raise TypeError(
+            'Join predicates must compare columns of the left table with '
+            'columns of the right table'
+        )
+    if lhs_root != left_op:
+        lhs, lhs_values, rhs_values = rhs, rhs_values, lhs_values
+        comparison = _FLIPPED_COMPARISONS[comparison]
+    return [(lhs, lhs_values, comparison, rhs_values)]
+
+
+def _column_key(column):
+    # columns are identified by name, computed columns by identity
+    return column if isinstance(column, str) else id(column)
+
+
+def _factorize_keys(left_keys, right_keys):
+    """Assign every row of both inputs an integer identifying its combination
+    of equality key values, or -1 if any of its keys is NULL.
+    """
+    nleft = len(left_keys[0]) if left_keys else 0
+    codes = None
+    for left_key, right_key in zip(left_keys, right_keys):
+        key_codes, uniques = pd.factorize(
+            np.concatenate([np.asarray(left_key), np.asarray(right_key)])
+        )
+        if codes is None:
+            codes = key_codes
+        else:
+            combined = codes * len(uniques) + key_codes
+            combined[(codes < 0) | (key_codes < 0)] = -1
+            codes = np.where(combined < 0, -1, pd.factorize(combined)[0])
+    return codes[:nleft], codes[nleft:]
+
+
+def _range_join_positions(nleft, nright, equalities, comparisons):
+    """Compute the positions of the matching rows of an inner join whose
+    predicates are the `equalities` and range `comparisons`.
+
+    The left rows are sorted by their equality keys and by the left operand of
+    the first comparison, so that the rows matching each right row are found
+    by binary search. The cost is driven by the number of candidate pairs
+    rather than by the size of the Cartesian product.
+
+    Parameters
+    ----------
+    nleft, nright : int
+    equalities : List[Tuple[pd.Series, pd.Series]]
+    comparisons : List[Tuple[object, pd.Series, callable, pd.Series]]
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Left and right positions of every matching pair, ordered by the
+        position of the left row
+    """
+    if equalities:
+        left_groups, right_groups = _factorize_keys(*zip(*equalities))
+    else:
+        left_groups = np.zeros(nleft, dtype=np.int64)
+        right_groups = np.zeros(nright, dtype=np.int64)
+
+    # probe with the first comparison, and with a comparison in the opposite
+    # direction on the same left column if there is one (e.g., BETWEEN)
+    (column, left_values, comparison, right_values), *rest = comparisons
+    lower = comparison in {operator.gt, operator.ge}
+    probes = [(comparison, right_values)]
+    filters = []
+    for other in rest:
+        other_column, _, other_comparison, other_values = other
+        other_lower = other_comparison in {operator.gt, operator.ge}
+        if (
+            len(probes) == 1
+            and other_lower != lower
+            and _column_key(other_column) == _column_key(column)
+        ):
+            probes.append((other_comparison, other_values))
+        else:
+            filters.append(other)
+
+    left_values = np.asarray(left_values)
+    left_valid = (left_groups >= 0) & pd.notnull(left_values)
+    right_valid = right_groups >= 0
+    probe_values = []
+    for _, values in probes:
+        values = np.asarray(values)
+        right_valid &= pd.notnull(values)
+        probe_values.append(values)
+
+    # rank the values so that (group, value) pairs become sortable integers
+    left_positions = np.flatnonzero(left_valid)
+    right_positions = np.flatnonzero(right_valid)
+    distinct, ranks = np.unique(
+        np.concatenate(
+            [left_values[left_positions]]
+            + [values[right_positions] for values in probe_values]
+        ),
+        return_inverse=True,
+    )
+    stride = len(distinct) + 1
+    left_ranks, *probe_ranks = np.split(
+        ranks,
+        len(left_positions)
+        + len(right_positions) * np.arange(len(probe_values)),
+    )
+    left_keys = left_groups[left_positions] * stride + left_ranks
+    order = np.argsort(left_keys, kind='mergesort')
+    left_positions = left_positions[order]
+    left_keys = left_keys[order]
+
+    groups = right_groups[right_positions] * stride
+    starts = np.searchsorted(left_keys, groups)
+    stops = np.searchsorted(left_keys, groups + stride)
+    for (comparison, _), ranks in zip(probes, probe_ranks):
+        keys = groups + ranks
+        side = 'left' if comparison in {operator.lt, operator.ge} else 'right'
+        bound = np.searchsorted(left_keys, keys, side=side)
+        if comparison in {operator.gt, operator.ge}:
+            starts = np.maximum(starts, bound)
+        else:
+            stops = np.minimum(stops, bound)
+
+    counts = np.maximum(stops - starts, 0)
+    total = counts.sum()
+    offsets = np.cumsum(counts) - counts
+    sorted_positions = np.repeat(starts, counts) + (
+        np.arange(total) - np.repeat(offsets, counts)
+    )
+    left_result = left_positions[sorted_positions]
+    right_result = np.repeat(right_positions, counts)
+
+    for _, lhs, comparison, rhs in filters:
+        lhs = np.asarray(lhs)[left_result]
+        rhs = np.asarray(rhs)[right_result]
+        keep = pd.notnull(lhs) & pd.notnull(rhs)
+        keep[keep] = comparison(lhs[keep], rhs[keep])
+        left_result = left_result[keep]
+        right_result = right_result[keep]
+
+    order = np.argsort(left_result, kind='mergesort')
+    return left_result[order], right_result[order]
+
+
+def _execute_range_join(
+    op, left, right, how, equalities, comparisons, on, **kwargs
+):
+    """Join `left` and `right` on equality and range predicates.
 
+    The matching pairs are found by :func:`_range_join_positions` and then
+    lined up with :func:`pandas.merge` on a key unique to each pair, so that
+    the output columns are the same as those of an equality join.
     """
-    # generate a unique name for the temporary join key
-    key = "cross_join_{}".format(ibis.util.guid())
-    join_key = {key: True}
-    new_left = left.assign(**join_key)
-    new_right = right.assign(**join_key)
+    left_op = op.left.op()
+    right_op = op.right.op()
+    nleft = len(left.index)
+    nright = len(right.index)
+    left_positions, right_positions = _range_join_positions(
+        nleft, nright, equalities, comparisons
+    )
+    npairs = len(left_positions)
+    left_pairs = np.arange(npairs)
+    right_pairs = np.arange(npairs)
+
+    if how in {'left', 'outer'}:
+        unmatched = np.setdiff1d(np.arange(nleft), left_positions)
+        left_positions = np.concatenate([left_positions, unmatched])
+        left_pairs = np.arange(len(left_positions))
+
+        # keep the rows in the order of the left table
+        order = np.argsort(left_positions, kind='mergesort')
+        left_positions = left_positions[order]
+        left_pairs = left_pairs[order]
+    if how in {'right', 'outer'}:
+        unmatched = np.setdiff1d(np.arange(nright), right_positions)
+        right_positions = np.concatenate([right_positions, unmatched])
+        right_pairs = np.concatenate(
+            [
+                right_pairs,
+                np.arange(len(unmatched)) + len(left_pairs),
+            ]
+        )
+
+    key = 'range_join_{}'.format(ibis.util.guid())
+
+    def take(df, positions, pairs, columns):
+        result = df.iloc[positions].reset_index(drop=True)
+        result[key] = pairs
+        return result, [
+            column
+            if isinstance(column, str)
+            else np.asarray(column)[positions]
+            for column in columns
+        ] + [key]
 
-    # inner/outer doesn't matter because every row matches every other row
+    new_left, left_on = take(left, left_positions, left_pairs, on[left_op])
+    new_right, right_on = take(
+        right, right_positions, right_pairs, on[right_op]
+    )
     result = pd.merge(
         new_left,
         new_right,
-        how='inner',
-        on=key,
-        copy=False,
+        how=how,
+        left_on=left_on,
+        right_on=right_on,
         suffixes=constants.JOIN_SUFFIXES,
     )
-
-    # remove the generated key
     del result[key]
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _merge_groups_inner_joins():
+    """Return whether :func:`pandas.merge` groups the rows of inner joins by
+    key, in the order in which keys first occur in the left table, rather
+    than keeping the order of the left rows, as some versions of pandas do.
+    """
+    left = pd.DataFrame({'key': [1, 0, 1]})
+    right = pd.DataFrame({'key': [0, 1]})
+    return pd.merge(left, right, on='key').key.tolist() == [1, 1, 0]
+
+
+class JoinIndex:
+    """The row positions of a table grouped by the values of its join keys.
+
+    Rows whose keys are equal, including rows whose keys are all NULL, are in
+    the same group, as they are for :func:`pandas.merge`.
+
+    Attributes
+    ----------
+    uniques : List[pd.Index]
+        The distinct values of each key column
+    keys : Optional[pd.Index]
+        The combinations of key value positions that occur in the table if
+        there is more than one key column, otherwise None
+    order : np.ndarray
+        The row positions of the table, grouped by their keys
+    offsets : np.ndarray
+        The start of every group in `order`, followed by its length
+    """
+
+    __slots__ = 'uniques', 'keys', 'order', 'offsets', 'unique'
+
+    def __init__(self, uniques, keys, order, offsets):
+        self.uniques = uniques
+        self.keys = keys
+        self.order = order
+        self.offsets = offsets
+        self.unique = len(order) == len(offsets) - 1
+
+    @classmethod
+    def from_frame(cls, df, columns):
+        """Build the index of the `columns` of `df`, or return None if their
+        combinations of values cannot be numbered with 64 bit integers.
+        """
+        uniques = [pd.Index(df[column]).unique() for column in columns]
+        codes = [
+            values.get_indexer(df[column])
+            for values, column in zip(uniques, columns)
+        ]
+        if len(codes) == 1:
+            (groups,) = codes
+            keys = None
+            ngroups = len(uniques[0])
+        else:
+            try:
+                combined = np.ravel_multi_index(
+                    codes, tuple(map(len, uniques))
+                )
+            except ValueError:
+                return None
+            groups, keys = pd.factorize(combined)
+            keys = pd.Index(keys)
+            ngroups = len(keys)
+
+        offsets = np.zeros(ngroups + 1, dtype=np.int64)
+        np.cumsum(np.bincount(groups, minlength=ngroups), out=offsets[1:])
+        order = np.argsort(groups, kind='mergesort')
+        return cls(uniques, keys, order, offsets)
+
+    @property
+    def nbytes(self):
+        indexes = self.uniques if self.keys is None else self.uniques + [
+            self.keys
+        ]
+        return (
+            sum(index.memory_usage() for index in indexes)
+            + self.order.nbytes
+            + self.offsets.nbytes
+        )
+
+    def groups(self, keys):
+        """Return the group of each row of the key columns `keys`, or -1 for
+        rows whose keys are not in the table.
+        """
+        codes = [
+            values.get_indexer(key) for values, key in zip(self.uniques, keys)
+        ]
+        if self.keys is None:
+            (groups,) = codes
+            return groups
+
+        missing = np.logical_or.reduce([code < 0 for code in codes])
+        combined = np.ravel_multi_index(
+            [np.where(missing, 0, code) for code in codes],
+            tuple(map(len, self.uniques)),
+        )
+        combined[missing] = -1
+        return self.keys.get_indexer(combined)
+
+    def positions(self, keys, how):
+        """Compute the positions of the rows of an inner or left join of the
+        key columns `keys` with the table.
+
+        The rows are in the order of those of :func:`pandas.merge`.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The positions of the rows of `keys`, and of the matching rows of
+            the table, which are -1 for unmatched rows of a left join
+        """
+        groups = self.groups(keys)
+        left_positions, right_positions = self._positions(groups, how)
+        if how != 'left' and _merge_groups_inner_joins():
+            codes, _ = pd.factorize(groups[left_positions])
+            order = np.argsort(codes, kind='mergesort')
+            left_positions = left_positions[order]
+            right_positions = right_positions[order]
+        return left_positions, right_positions
+
+    def _positions(self, groups, how):
+        """Compute the positions of the rows of a join of keys in `groups`,
+        in ascending order of the rows of the keys.
+        """
+        found = groups >= 0
+        if self.unique:
+            # every key matches at most one row
+            if how == 'left':
+                left_positions = np.arange(len(groups))
+                right_positions = np.where(found, self.order[groups], -1)
+            else:
+                left_positions = np.flatnonzero(found)
+                right_positions = self.order[groups[left_positions]]
+            return left_positions, right_positions
+
+        starts = self.offsets[groups]
+        counts = np.where(found, self.offsets[groups + 1] - starts, 0)
+        if how == 'left':
+            counts = np.maximum(counts, 1)
+
+        total = counts.sum()
+        left_positions = np.repeat(np.arange(len(groups)), counts)
+        offsets = np.cumsum(counts) - counts
+        within = np.arange(total) - np.repeat(offsets, counts)
+        right_positions = self.order[
+            np.repeat(np.where(found, starts, 0), counts) + within
+        ]
+        if how == 'left':
+            right_positions[~np.repeat(found, counts)] = -1
+        return left_positions, right_positions
+
+
+def _cached_join_index(table_op, data, columns):
+    """Return the index of the `columns` of the pandas table `table_op`
+    whose rows are `data`, from the join index cache of its client.
+
+    Returns None if join indexes are not cached, or if `data` does not have
+    the rows of the table.
+    """
+    if (
+        ibis.options.pandas.join_index_cache_size <= 0
+        or not isinstance(table_op, PandasTable)
+        or not isinstance(table_op.source, PandasClient)
+    ):
+        return None
+
+    client = table_op.source
+    if table_op.name not in client.dictionary:
+        return None
+    df = client.table_data(table_op.name, table_op.schema)
+    if data.index is not df.index:
+        return None
 
+    index = client.join_indexes.get(table_op.name, columns, df)
+    if index is None:
+        index = JoinIndex.from_frame(df, columns)
+        if index is not None:
+            client.join_indexes.put(table_op.name, columns, df, index)
+    return index
+
+
+def _execute_indexed_join(left, right, how, left_on, right_on, index):
+    """Join `left` and `right` on equal columns, finding the rows of `right`
+    that match every row of `left` with its `index`.
+
+    The columns and the order of the rows of the result are those of
+    :func:`pandas.merge`.
+    """
+    left_positions, right_positions = index.positions(
+        [left[column] for column in left_on], how
+    )
+
+    allow_fill = bool((right_positions < 0).any())
+    return _joined_frame(
+        left,
+        right,
+        lambda values: pd.api.extensions.take(values, left_positions),
+        lambda values: pd.api.extensions.take(
+            values, right_positions, allow_fill=allow_fill
+        ),
+        shared={lhs for lhs, rhs in zip(left_on, right_on) if lhs == rhs},
+    )
+
+
+def _with_columns(df, columns):
+    if not columns:
+        return df
+    result = df.copy(deep=False)
+    for name, column in columns.items():
+        result[name] = column
+    return result
+
+
+def _unify_key_categories(left, right, left_on, right_on):
+    """Encode the dictionary encoded key columns that `left` and `right`
+    are joined on with the same categories, so that they are joined by their
+    codes rather than by their decoded values.
+    """
+    left_columns = {}
+    right_columns = {}
+    for lhs, rhs in zip(left_on, right_on):
+        if not (isinstance(lhs, str) and isinstance(rhs, str)):
+            continue
+        left_column = left_columns.get(lhs, left[lhs])
+        right_column = right_columns.get(rhs, right[rhs])
+        if encoding.is_encoded(left_column) and encoding.is_encoded(
+            right_column
+        ):
+            (
+                left_columns[lhs],
+                right_columns[rhs],
+            ) = encoding.unify_categories(left_column, right_column)
+    return (
+        _with_columns(left, left_columns),
+        _with_columns(right, right_columns),
+    )
+
+
+def _decode_decimal_keys(predicate, tables, keys):
+    """Decode the scaled decimal key of an equality `predicate` if the other
+    key is not scaled, so that they are joined by their values.
+
+    Parameters
+    ----------
+    predicate : ops.Equals
+    tables : Dict[ops.TableNode, pd.DataFrame]
+        The tables that are joined, whose columns are replaced by their
+        decoded values
+    keys : List[Tuple[Union[str, pd.Series], ops.TableNode]]
+        The name or values of the left and the right key, and the table that
+        each of them belongs to
+
+    Returns
+    -------
+    List[Union[str, pd.Series]]
+    """
+    exprs = predicate.left, predicate.right
+    values = [
+        tables[root][column] if isinstance(column, str) else column
+        for column, root in keys
+    ]
+    scaled = [fixed_point.is_scaled(*pair) for pair in zip(exprs, values)]
+    result = [column for column, _ in keys]
+    if scaled[0] == scaled[1]:
+        return result
+    i = scaled.index(True)
+    column, root = keys[i]
+    decoded = fixed_point.decode(values[i], exprs[i].type().scale)
+    if isinstance(column, str):
+        tables[root] = _with_columns(tables[root], {column: decoded})
+    else:
+        result[i] = decoded
     return result
 
 
@@ -64,24 +660,60 @@ def execute_materialized_join(op, left, right, **kwargs):
 
     left_op = op.left.op()
     right_op = op.right.op()
+    tables = {left_op: left, right_op: right}
 
     on = {left_op: [], right_op: []}
+    comparisons = []
 
     for predicate in map(operator.methodcaller('op'), op.predicates):
         if not isinstance(predicate, ops.Equals):
-            raise TypeError(
-                'Only equality join predicates supported with pandas'
+            comparisons.extend(
+                _range_join_comparisons(predicate, left_op, tables, **kwargs)
             )
+            continue
         new_left_column, left_pred_root = _compute_join_column(
             predicate.left, **kwargs
         )
-        on[left_pred_root].append(new_left_column)
-
         new_right_column, right_pred_root = _compute_join_column(
             predicate.right, **kwargs
         )
+        new_left_column, new_right_column = _decode_decimal_keys(
+            predicate,
+            tables,
+            [
+                (new_left_column, left_pred_root),
+                (new_right_column, right_pred_root),
+            ],
+        )
+        on[left_pred_root].append(new_left_column)
         on[right_pred_root].append(new_right_column)
+    left, right = tables[left_op], tables[right_op]
+
+    if comparisons:
+        equalities = [
+            tuple(
+                tables[root][column] if isinstance(column, str) else column
+                for root, column in ((left_op, lhs), (right_op, rhs))
+            )
+            for lhs, rhs in zip(on[left_op], on[right_op])
+        ]
+        return _execute_range_join(
+            op, left, right, how, equalities, comparisons, on, **kwargs
+        )
+
+    if how in {'inner', 'left'} and all(
+        isinstance(column, str)
+        for column in toolz.concatv(on[left_op], on[right_op])
+    ):
+        index = _cached_join_index(right_op, right, on[right_op])
+        if index is not None:
+            return _execute_indexed_join(
+                left, right, how, on[left_op], on[right_op], index
+            )
 
+    left, right = _unify_key_categories(
+        left, right, on[left_op], on[right_op]
+    )
     df = pd.merge(
         left,
         right,
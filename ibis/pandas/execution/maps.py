@@ -5,13 +5,16 @@ import pandas as pd
 import toolz
 
 import ibis.expr.operations as ops
+import ibis.pandas.execution.nested_kernels as kernels
 from ibis.pandas.dispatch import execute_node
 
 
 @execute_node.register(ops.MapLength, pd.Series)
 def execute_map_length_series(op, data, **kwargs):
-    # TODO: investigate whether calling a lambda is faster
-    return data.dropna().map(len).reindex(data.index)
+    result = kernels.map_length(data, op.arg.type())
+    if result is None:
+        return data.dropna().map(len).reindex(data.index)
+    return result
 
 
 @execute_node.register(ops.MapLength, (collections.abc.Mapping, type(None)))
@@ -34,6 +37,9 @@ def execute_map_value_for_key_series_none(op, data, key, **kwargs):
 
 @execute_node.register(ops.MapValueForKey, pd.Series, object)
 def execute_map_value_for_key_series_scalar(op, data, key, **kwargs):
+    result = kernels.map_value_for_key(data, op.arg.type(), key)
+    if result is not None:
+        return result
     return data.map(functools.partial(safe_get, key=key))
 
 
@@ -49,6 +55,11 @@ def execute_map_value_for_key_dict_scalar(op, data, key, **kwargs):
 
 @execute_node.register(ops.MapValueOrDefaultForKey, pd.Series, object, object)
 def map_value_default_series_scalar_scalar(op, data, key, default, **kwargs):
+    result = kernels.map_value_for_key(
+        data, op.arg.type(), key, default=default
+    )
+    if result is not None:
+        return result
     return data.map(functools.partial(safe_get, key=key, default=default))
 
 
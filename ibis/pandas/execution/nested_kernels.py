@@ -0,0 +1,269 @@
+"""Columnar kernels for array, map and struct operations of the pandas
+backend.
+
+The pandas backend stores arrays, maps and structs as Python lists and dicts
+in object Series. When pyarrow is installed, kernels convert such a column to
+a pyarrow ``ListArray``, ``MapArray`` or ``StructArray`` of its ibis type,
+and compute lengths from its offsets, elements and map values by offset
+arithmetic over its flattened values, and struct fields as its child arrays.
+The values of a result are converted to Python objects only when the result
+Series is built.
+
+Conversions are cached for as long as the converted Series is alive, so that
+every operation on the same column, such as the projection of several struct
+fields, converts it only once. Columns are assumed not to be modified in
+place after they are converted.
+
+Kernels return None for columns that can't be converted to their ibis type
+and for results that are arrays, maps or structs, which are computed row by
+row by the execution rules: building Python lists and dicts from pyarrow
+arrays is slower than computing them from the values of the column.
+"""
+
+from __future__ import absolute_import
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+import ibis.expr.datatypes as dt
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    ARROW_KERNELS = True
+except ImportError:
+    ARROW_KERNELS = False
+
+
+if ARROW_KERNELS:
+    _ARROW_TYPES = {
+        dt.Boolean: pa.bool_(),
+        dt.Int8: pa.int8(),
+        dt.Int16: pa.int16(),
+        dt.Int32: pa.int32(),
+        dt.Int64: pa.int64(),
+        dt.UInt8: pa.uint8(),
+        dt.UInt16: pa.uint16(),
+        dt.UInt32: pa.uint32(),
+        dt.UInt64: pa.uint64(),
+        dt.Float32: pa.float32(),
+        dt.Float64: pa.float64(),
+        dt.String: pa.string(),
+        dt.Binary: pa.binary(),
+    }
+
+
+def arrow_type(dtype):
+    """Return the pyarrow type of the ibis type `dtype`, or None if it has
+    none.
+    """
+    if isinstance(dtype, dt.Array):
+        value_type = arrow_type(dtype.value_type)
+        return None if value_type is None else pa.list_(value_type)
+    if isinstance(dtype, dt.Map):
+        key_type = arrow_type(dtype.key_type)
+        value_type = arrow_type(dtype.value_type)
+        if key_type is None or value_type is None:
+            return None
+        return pa.map_(key_type, value_type)
+    if isinstance(dtype, dt.Struct):
+        fields = list(zip(dtype.names, map(arrow_type, dtype.types)))
+        if any(type is None for _, type in fields):
+            return None
+        return pa.struct(fields)
+    return _ARROW_TYPES.get(type(dtype))
+
+
+def _is_nested(dtype):
+    return isinstance(dtype, (dt.Array, dt.Map, dt.Struct))
+
+
+# the converted arrays of Series, keyed by the id of the Series
+_columns = {}
+
+
+def _forget(key, ref):
+    if key in _columns and _columns[key][0] is ref:
+        del _columns[key]
+
+
+def to_arrow(data, dtype):
+    """Convert the values of the object Series `data` to a pyarrow array of
+    the ibis type `dtype`.
+
+    Returns
+    -------
+    Optional[pyarrow.Array]
+        None if pyarrow is not installed, or if `data` can't be converted
+    """
+    if not ARROW_KERNELS or data.dtype != np.object_:
+        return None
+    key = id(data)
+    try:
+        ref, result = _columns[key]
+    except KeyError:
+        pass
+    else:
+        if ref() is data:
+            return result
+
+    type = arrow_type(dtype)
+    try:
+        result = (
+            None
+            if type is None
+            else pa.array(data.values, type=type, from_pandas=True)
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+        result = None
+    if isinstance(result, pa.ChunkedArray):
+        # only arrays with more than 2 GB of data are chunked
+        result = None
+
+    ref = weakref.ref(data, lambda ref, key=key: _forget(key, ref))
+    _columns[key] = ref, result
+    return result
+
+
+def _values_result(values, data, name=None):
+    return pd.Series(
+        values.to_pandas().values,
+        index=data.index,
+        name=data.name if name is None else name,
+    )
+
+
+def _lengths_result(arrow, data):
+    offsets = arrow.offsets.to_numpy()
+    lengths = np.diff(offsets).astype(np.int64)
+    if arrow.null_count:
+        lengths = np.where(
+            arrow.is_null().to_numpy(zero_copy_only=False), np.nan, lengths
+        )
+    return pd.Series(lengths, index=data.index, name=data.name)
+
+
+def _take(values, positions, found):
+    """Take the elements of `values` at `positions` where `found` is True,
+    and NULL elsewhere.
+    """
+    indices = pa.array(np.where(found, positions, 0), mask=~found)
+    return values.take(indices)
+
+
+# arrays
+
+
+def array_length(data, dtype):
+    """Compute the length of every array of `data`, whose ibis type is the
+    array type `dtype`.
+    """
+    arrow = to_arrow(data, dtype)
+    if arrow is None:
+        return None
+    return _lengths_result(arrow, data)
+
+
+def array_index(data, dtype, index):
+    """Get the element at `index` of every array of `data`, or NULL if it is
+    out of bounds.
+    """
+    if _is_nested(dtype.value_type):
+        return None
+    arrow = to_arrow(data, dtype)
+    if arrow is None:
+        return None
+
+    offsets = arrow.offsets.to_numpy()
+    lengths = np.diff(offsets)
+    positions = offsets[:-1].astype(np.int64) + (
+        index if index >= 0 else lengths + index
+    )
+    found = (-lengths <= index) & (index < lengths)
+    if arrow.null_count:
+        found &= arrow.is_valid().to_numpy(zero_copy_only=False)
+    return _values_result(_take(arrow.values, positions, found), data)
+
+
+# maps
+
+
+def map_length(data, dtype):
+    """Compute the number of keys of every map of `data`, or NULL for NULL
+    maps.
+    """
+    arrow = to_arrow(data, dtype)
+    if arrow is None:
+        return None
+    return _lengths_result(arrow, data)
+
+
+def _map_lookup(arrow, key):
+    """Find the position of `key` among the flattened keys of the maps of
+    `arrow`.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The position of the value of `key` in every map, and whether the map
+        has it
+    """
+    offsets = arrow.offsets.to_numpy()
+    equal = pc.fill_null(pc.equal(arrow.keys, key), False)
+    matches = np.flatnonzero(equal.to_numpy(zero_copy_only=False))
+
+    # keys are unique in every map, and NULL maps have no keys
+    rows = np.searchsorted(offsets, matches, side='right') - 1
+    positions = np.zeros(len(arrow), dtype=np.int64)
+    found = np.zeros(len(arrow), dtype=np.bool_)
+    positions[rows] = matches
+    found[rows] = True
+    return positions, found
+
+
+def map_value_for_key(data, dtype, key, default=None):
+    """Get the value of `key` in every map of `data`, `default` if a map
+    doesn't have it, and NULL for NULL maps.
+
+    The result has the dtype of the values of the maps, such as int64 for
+    integer values if it has no NULL values and float64 if it does.
+    """
+    if _is_nested(dtype.value_type):
+        return None
+    arrow = to_arrow(data, dtype)
+    if arrow is None:
+        return None
+    try:
+        key = pa.scalar(key, type=arrow.type.key_type)
+        if default is not None:
+            default = pa.scalar(default, type=arrow.type.item_type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+        return None
+
+    positions, found = _map_lookup(arrow, key)
+    values = _take(arrow.items, positions, found)
+    if default is not None:
+        missing = ~found
+        if arrow.null_count:
+            missing &= arrow.is_valid().to_numpy(zero_copy_only=False)
+        if missing.any():
+            values = pc.if_else(pa.array(missing), default, values)
+    return _values_result(values, data)
+
+
+# structs
+
+
+def struct_field(data, dtype, field):
+    """Get the `field` of every struct of `data`, or NULL for NULL structs."""
+    if _is_nested(dtype[field]):
+        return None
+    arrow = to_arrow(data, dtype)
+    if arrow is None:
+        return None
+    # flatten merges the validity of the structs into their fields
+    values = arrow.flatten()[arrow.type.get_field_index(field)]
+    return _values_result(values, data, name=field)
@@ -14,11 +14,13 @@ import toolz
 from multipledispatch import Dispatcher
 from toolz import compose, concat, concatv, first, unique
 
+import ibis
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
-from ibis.pandas.core import execute
-from ibis.pandas.dispatch import execute_node
+from ibis.pandas.core import execute, execute_required_columns, is_elementwise
+from ibis.pandas.dispatch import execute_node, post_execute, pre_execute
 from ibis.pandas.execution import constants, util
+from ibis.pandas.threads import parallel_map
 
 compute_projection = Dispatcher(
     'compute_projection',
@@ -277,20 +279,38 @@ def physical_tables_node(node):
 
 
 @execute_node.register(ops.Selection, pd.DataFrame)
-def execute_selection_dataframe(op, data, scope=None, **kwargs):
+def execute_selection_dataframe(op, data, scope=None, top_k=None, **kwargs):
     selections = op.selections
     predicates = op.predicates
     sort_keys = op.sort_keys
     result = data
 
+    # Filter first when no projection needs to see the rows the predicates
+    # discard, so that projections are computed on as little data as possible
+    if predicates and all(map(is_elementwise, selections)):
+        predicate = functools.reduce(
+            operator.and_,
+            _compute_predicates(
+                op.table.op(), predicates, data, scope, **kwargs
+            ),
+        )
+        assert len(predicate) == len(
+            data
+        ), 'Selection predicate length does not match underlying table'
+        data = result = data.loc[predicate]
+        predicates = ()
+
     # Build up the individual pandas structures from column expressions
     if selections:
-        data_pieces = []
-        for selection in selections:
-            pandas_object = compute_projection(
+        # window functions over the same window share one sorted frame while
+        # the projections are computed
+        kwargs['window_frames'] = {}
+        data_pieces = parallel_map(
+            lambda selection: compute_projection(
                 selection, op, data, scope=scope, **kwargs
-            )
-            data_pieces.append(pandas_object)
+            ),
+            selections,
+        )
 
         new_pieces = [
             piece.reset_index(
@@ -301,6 +321,7 @@ def execute_selection_dataframe(op, data, scope=None, **kwargs):
             for piece in data_pieces
         ]
         result = pd.concat(new_pieces, axis=1)
+        del kwargs['window_frames']
 
     if predicates:
         predicates = _compute_predicates(
@@ -314,10 +335,12 @@ def execute_selection_dataframe(op, data, scope=None, **kwargs):
 
     if sort_keys:
         result, grouping_keys, ordering_keys = util.compute_sorted_frame(
-            result, order_by=sort_keys, scope=scope, **kwargs
+            result, order_by=sort_keys, scope=scope, top_k=top_k, **kwargs
         )
     else:
         grouping_keys = ordering_keys = ()
+        if top_k is not None:
+            result = result.iloc[:top_k]
 
     # return early if we do not have any temporary grouping or ordering columns
     assert not grouping_keys, 'group by should never show up in Selection'
@@ -335,3 +358,57 @@ def execute_selection_dataframe(op, data, scope=None, **kwargs):
 
     # drop every temporary column we created for ordering or grouping
     return result.drop(temporary_columns, axis=1)
+
+
+@pre_execute.register(ops.Limit)
+@pre_execute.register(ops.Limit, ibis.client.Client)
+def pre_execute_limit_sorted_selection(op, *clients, scope=None, **kwargs):
+    """Compute ``table.sort_by(...).limit(n)`` without sorting all of
+    ``table``.
+
+    Only the rows that can end up in the first ``offset + n`` rows of the
+    sorted selection are sorted, see
+    :func:`~ibis.pandas.execution.util.compute_sorted_frame`.
+    """
+    selection = op.table.op()
+    if (
+        op in scope
+        or selection in scope
+        or not isinstance(selection, ops.Selection)
+        or not selection.sort_keys
+    ):
+        return {}
+
+    # read only the columns of physical tables that the limit uses, as
+    # execute_with_scope would
+    scope = toolz.merge(scope, execute_required_columns(op.to_expr(), scope))
+
+    table_op = selection.table.op()
+    data = execute(selection.table, scope=scope, **kwargs)
+    new_scope = {table_op: data}
+    if not isinstance(data, pd.DataFrame):
+        return new_scope
+
+    clients = list(clients)
+    scope = toolz.merge(scope, new_scope)
+    result = execute_node(
+        selection,
+        data,
+        scope=scope,
+        clients=clients,
+        top_k=op.offset + op.n,
+        **kwargs,
+    )
+    # the result only has the first rows of the selection, so it is not
+    # added to the scope
+    result = post_execute(
+        selection, result, scope=scope, clients=clients, **kwargs
+    )
+    new_scope[op] = post_execute(
+        op,
+        result.iloc[op.offset :],
+        scope=scope,
+        clients=clients,
+        **kwargs,
+    )
+    return new_scope
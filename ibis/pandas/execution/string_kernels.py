@@ -0,0 +1,418 @@
+"""Vectorized kernels for string operations of the pandas backend.
+
+Kernels compute over whole columns with the string kernels of
+:mod:`pyarrow.compute` when pyarrow is installed and the values of a column
+are all strings or NULL. Otherwise they fall back to the ``.str`` accessor of
+pandas, or to the :mod:`regex` module for regular expressions.
+
+Regular expressions are run by pyarrow with RE2, whose syntax and semantics
+differ from those of :mod:`regex` outside of ASCII and for constructs such as
+lookarounds and backreferences, and that replace empty matches differently.
+The pyarrow kernels are only used for ASCII patterns over ASCII strings that
+RE2 can compile, and only replace the matches of patterns that cannot match
+an empty string.
+
+Predicates are False and other results are NULL for NULL strings.
+"""
+
+from __future__ import absolute_import
+
+import numpy as np
+import pandas as pd
+import regex as re
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    ARROW_KERNELS = all(
+        hasattr(pc, name)
+        for name in (
+            'match_like',
+            'match_substring',
+            'match_substring_regex',
+            'replace_substring_regex',
+            'starts_with',
+            'ends_with',
+            'string_is_ascii',
+        )
+    )
+except ImportError:
+    ARROW_KERNELS = False
+
+
+def to_arrow(data):
+    """Convert the values of the Series `data` to a pyarrow string array.
+
+    Returns
+    -------
+    Optional[pyarrow.Array]
+        None if pyarrow kernels are not available, or if `data` has values
+        that are neither strings nor NULL
+    """
+    if not ARROW_KERNELS or data.dtype != np.object_:
+        return None
+    try:
+        return pa.array(data.values, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _predicate_result(result, data):
+    values = pc.fill_null(result, False).to_numpy(zero_copy_only=False)
+    return pd.Series(values, index=data.index, name=data.name)
+
+
+def _string_result(result, data):
+    return pd.Series(
+        result.to_pandas().values, index=data.index, name=data.name
+    )
+
+
+def _map_strings(func, data, na):
+    """Compute ``func(value)`` for every string of `data`, and `na` for
+    other values.
+    """
+    return pd.Series(
+        [func(value) if isinstance(value, str) else na for value in data],
+        index=data.index,
+        name=data.name,
+    )
+
+
+def _arrow_regex(arrow, pattern):
+    """Return whether RE2 gives the same results as :mod:`regex` for
+    `pattern` over the strings of `arrow`.
+    """
+    return (
+        all(ord(char) < 128 for char in pattern)
+        and pc.all(pc.string_is_ascii(arrow)).as_py() is not False
+    )
+
+
+# SQL LIKE patterns
+
+
+_WILDCARDS = {'%', '_'}
+
+
+def parse_like(pattern, escape=None):
+    """Split a SQL LIKE `pattern` into wildcards and literal strings.
+
+    Returns
+    -------
+    List[Tuple[bool, str]]
+        ``(True, wildcard)`` for every wildcard and ``(False, literal)``
+        for every string of literal characters between them
+
+    Examples
+    --------
+    >>> parse_like('a^%b%c_', escape='^')
+    [(False, 'a%b'), (True, '%'), (False, 'c'), (True, '_')]
+    """
+    tokens = []
+    literal = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if escape is not None and char == escape and i + 1 < len(pattern):
+            literal.append(pattern[i + 1])
+            i += 2
+            continue
+        if char in _WILDCARDS:
+            if literal:
+                tokens.append((False, ''.join(literal)))
+                literal = []
+            tokens.append((True, char))
+        else:
+            literal.append(char)
+        i += 1
+    if literal:
+        tokens.append((False, ''.join(literal)))
+    return tokens
+
+
+def _like_regex(tokens):
+    return ''.join(
+        ('.*' if value == '%' else '.') if wildcard else re.escape(value)
+        for wildcard, value in tokens
+    )
+
+
+def _arrow_like_pattern(tokens):
+    # pyarrow escapes wildcards with a backslash
+    return ''.join(
+        value
+        if wildcard
+        else ''.join(
+            '\\' + char if char in _WILDCARDS or char == '\\' else char
+            for char in value
+        )
+        for wildcard, value in tokens
+    )
+
+
+def _like_fast_path(tokens):
+    """Classify a LIKE pattern that has no ``_`` wildcard by the position of
+    its ``%`` wildcards.
+
+    Returns
+    -------
+    Optional[Tuple[str, str]]
+        ``(kind, literal)`` where kind is one of ``'equals'``,
+        ``'startswith'``, ``'endswith'``, ``'contains'`` or ``'notnull'``,
+        or None if the pattern has another shape
+    """
+    if any(wildcard and value == '_' for wildcard, value in tokens):
+        return None
+    # consecutive % match the same strings as a single one
+    shape = []
+    for wildcard, value in tokens:
+        if not (wildcard and shape and shape[-1] == (True, '%')):
+            shape.append((wildcard, value))
+
+    if not shape:
+        return 'equals', ''
+    if len(shape) == 1:
+        wildcard, value = shape[0]
+        return ('notnull', '') if wildcard else ('equals', value)
+
+    kinds = {
+        (False, True): 'startswith',
+        (True, False): 'endswith',
+    }
+    if len(shape) == 2:
+        (first, value), (second, other) = shape
+        kind = kinds.get((first, second))
+        if kind is not None:
+            return kind, other if first else value
+    elif len(shape) == 3 and [wildcard for wildcard, _ in shape] == [
+        True,
+        False,
+        True,
+    ]:
+        return 'contains', shape[1][1]
+    return None
+
+
+def like(data, pattern, escape=None):
+    """Compute whether every string of `data` matches the SQL LIKE
+    `pattern`.
+
+    Patterns without ``_`` wildcards whose ``%`` wildcards are only at their
+    start or end are computed as string equality, prefix, suffix or
+    substring tests.
+
+    Returns
+    -------
+    pd.Series
+        A boolean Series
+    """
+    tokens = parse_like(pattern, escape=escape)
+    fast_path = _like_fast_path(tokens)
+    if fast_path is not None and fast_path[0] == 'equals':
+        values = np.asarray(data.values == fast_path[1], dtype=np.bool_)
+        return pd.Series(values, index=data.index, name=data.name)
+    if fast_path is not None and fast_path[0] == 'notnull':
+        return data.notnull()
+
+    arrow = to_arrow(data)
+    if fast_path is not None:
+        kind, literal = fast_path
+        if arrow is not None:
+            func = {
+                'startswith': pc.starts_with,
+                'endswith': pc.ends_with,
+                'contains': pc.match_substring,
+            }[kind]
+            return _predicate_result(func(arrow, literal), data)
+        if kind == 'contains':
+            return data.str.contains(literal, regex=False, na=False)
+        return getattr(data.str, kind)(literal, na=False)
+
+    if arrow is not None:
+        return _predicate_result(
+            pc.match_like(arrow, _arrow_like_pattern(tokens)), data
+        )
+    compiled = re.compile(_like_regex(tokens), flags=re.DOTALL)
+    return _map_strings(
+        lambda value: compiled.fullmatch(value) is not None, data, False
+    ).astype(np.bool_)
+
+
+# regular expressions
+
+
+# assertions and anchors, which can match the empty string between
+# characters of a string even if the pattern doesn't match an empty string
+_ZERO_WIDTH = re.compile(r'\\[bBAZzG]|(?<!\[)\^|\$|\(\?<?[=!]')
+
+
+def _matches_empty(pattern):
+    """Return whether `pattern` can match the empty string somewhere in a
+    string.
+
+    Patterns with zero-width assertions are assumed to.
+    """
+    return (
+        re.compile(pattern).fullmatch('') is not None
+        or _ZERO_WIDTH.search(pattern) is not None
+    )
+
+
+def regex_search(data, pattern):
+    """Compute whether the regular expression `pattern` matches part of every
+    string of `data`.
+    """
+    arrow = to_arrow(data)
+    if arrow is not None and _arrow_regex(arrow, pattern):
+        try:
+            return _predicate_result(
+                pc.match_substring_regex(arrow, pattern), data
+            )
+        except pa.ArrowInvalid:
+            # a pattern that RE2 does not support
+            pass
+    compiled = re.compile(pattern)
+    return _map_strings(
+        lambda value: compiled.search(value) is not None, data, False
+    ).astype(np.bool_)
+
+
+def regex_extract(data, pattern, index):
+    """Extract the group `index` of the match of the regular expression
+    `pattern` at the start of every string of `data`.
+
+    Strings that don't match, and empty groups, give NULL.
+    """
+    arrow = to_arrow(data)
+    # RE2 substitutes at most 9 groups, and the whole match is group 1 here
+    if arrow is not None and index < 9 and _arrow_regex(arrow, pattern):
+        try:
+            matches = pc.match_substring_regex(
+                arrow, '^(?:{})'.format(pattern)
+            )
+            groups = pc.replace_substring_regex(
+                arrow,
+                pattern='^({})(?s:.*)$'.format(pattern),
+                replacement='\\{:d}'.format(index + 1),
+            )
+        except pa.ArrowInvalid:
+            pass
+        else:
+            result = _string_result(groups, data)
+            found = pc.fill_null(matches, False).to_numpy(
+                zero_copy_only=False
+            )
+            return result.where(found & (result != ''))
+
+    compiled = re.compile(pattern)
+
+    def extract(value):
+        match = compiled.match(value)
+        if match is not None:
+            return match.group(index) or np.nan
+        return np.nan
+
+    return _map_strings(extract, data, np.nan)
+
+
+def regex_replace(data, pattern, replacement):
+    """Replace every match of the regular expression `pattern` in every
+    string of `data` with `replacement`.
+    """
+    arrow = to_arrow(data)
+    # backslashes in replacements are escapes for regex and group references
+    # for RE2, and RE2 skips the empty matches next to a non-empty match that
+    # regex replaces
+    if (
+        arrow is not None
+        and '\\' not in replacement
+        and not _matches_empty(pattern)
+        and _arrow_regex(arrow, pattern)
+    ):
+        try:
+            return _string_result(
+                pc.replace_substring_regex(
+                    arrow, pattern=pattern, replacement=replacement
+                ),
+                data,
+            )
+        except pa.ArrowInvalid:
+            pass
+    compiled = re.compile(pattern)
+    # NULL like the results of pyarrow
+    return _map_strings(
+        lambda value: compiled.sub(replacement, value), data, None
+    )
+
+
+# character translation
+
+
+def translate(data, from_string, to_string):
+    """Replace every character of `from_string` in every string of `data`
+    with the character at the same position in `to_string`.
+
+    `from_string` and `to_string` are strings, or Series that give them for
+    every row of `data`. A translation table is built once for every
+    distinct pair of them.
+    """
+    if isinstance(from_string, str) and isinstance(to_string, str):
+        return data.str.translate(str.maketrans(from_string, to_string))
+
+    if isinstance(from_string, str):
+        from_string = pd.Series(from_string, index=data.index)
+    if isinstance(to_string, str):
+        to_string = pd.Series(to_string, index=data.index)
+    pairs = pd.MultiIndex.from_arrays(
+        [from_string.values, to_string.values]
+    )
+    codes, uniques = pd.factorize(pairs)
+
+    result = np.empty(len(data.index), dtype=np.object_)
+    result[:] = np.nan
+    order = np.argsort(codes, kind='mergesort')
+    offsets = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    values = data.values
+    for (from_chars, to_chars), start, stop in zip(
+        uniques, offsets[:-1], offsets[1:]
+    ):
+        positions = order[start:stop]
+        table = str.maketrans(from_chars, to_chars)
+        result[positions] = [
+            value.translate(table) if isinstance(value, str) else np.nan
+            for value in values[positions]
+        ]
+    return pd.Series(result, index=data.index, name=data.name)
+
+
+# set membership
+
+
+def find_in_set(needle, haystack, index):
+    """Find the position of `needle` in `haystack` for every row.
+
+    Parameters
+    ----------
+    needle : Union[str, pd.Series]
+    haystack : List[Union[str, pd.Series]]
+        The elements of the set, as values or as columns that give them for
+        every row
+    index : pd.Index
+        The index of the result
+
+    Returns
+    -------
+    pd.Series
+        The position of the first element of `haystack` that is equal to
+        `needle` in every row, or -1 if there isn't one
+    """
+    needle = getattr(needle, 'values', needle)
+    result = np.full(len(index), -1, dtype=np.int64)
+    # iterate from the end so that the first equal element wins
+    for position in reversed(range(len(haystack))):
+        element = getattr(haystack[position], 'values', haystack[position])
+        found = np.asarray(needle == element, dtype=np.bool_)
+        result[np.broadcast_to(found, result.shape)] = position
+    return pd.Series(result, index=index)
@@ -1,15 +1,13 @@
-import itertools
-import operator
 from functools import reduce
 
 import numpy as np
 import pandas as pd
-import regex as re
 import toolz
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis
 import ibis.expr.operations as ops
+import ibis.pandas.execution.string_kernels as kernels
 from ibis.pandas.core import integer_types, scalar_types
 from ibis.pandas.dispatch import execute_node
 
@@ -181,10 +179,7 @@ def sql_like_to_regex(pattern, escape=None):
 
 @execute_node.register(ops.StringSQLLike, pd.Series, str, (str, type(None)))
 def execute_string_like_series_string(op, data, pattern, escape, **kwargs):
-    new_pattern = re.compile(sql_like_to_regex(pattern, escape=escape))
-    return data.map(
-        lambda x, pattern=new_pattern: pattern.search(x) is not None
-    )
+    return kernels.like(data, pattern, escape=escape)
 
 
 @execute_node.register(ops.StringSQLLike, SeriesGroupBy, str, str)
@@ -246,9 +241,7 @@ def execute_string_ascii_group_by(op, data, **kwargs):
 
 @execute_node.register(ops.RegexSearch, pd.Series, str)
 def execute_series_regex_search(op, data, pattern, **kwargs):
-    return data.map(
-        lambda x, pattern=re.compile(pattern): pattern.search(x) is not None
-    )
+    return kernels.regex_search(data, pattern)
 
 
 @execute_node.register(ops.RegexSearch, SeriesGroupBy, str)
@@ -262,14 +255,7 @@ def execute_series_regex_search_gb(op, data, pattern, **kwargs):
     ops.RegexExtract, pd.Series, (pd.Series, str), integer_types
 )
 def execute_series_regex_extract(op, data, pattern, index, **kwargs):
-    def extract(x, pattern=re.compile(pattern), index=index):
-        match = pattern.match(x)
-        if match is not None:
-            return match.group(index) or np.nan
-        return np.nan
-
-    extracted = data.apply(extract)
-    return extracted
+    return kernels.regex_extract(data, pattern, index)
 
 
 @execute_node.register(ops.RegexExtract, SeriesGroupBy, str, integer_types)
@@ -281,51 +267,21 @@ def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
 
 @execute_node.register(ops.RegexReplace, pd.Series, str, str)
 def execute_series_regex_replace(op, data, pattern, replacement, **kwargs):
-    def replacer(x, pattern=re.compile(pattern)):
-        return pattern.sub(replacement, x)
-
-    return data.apply(replacer)
+    return kernels.regex_replace(data, pattern, replacement)
 
 
 @execute_node.register(ops.RegexReplace, SeriesGroupBy, str, str)
 def execute_series_regex_replace_gb(op, data, pattern, replacement, **kwargs):
     return execute_series_regex_replace(
-        data.obj, pattern, replacement, **kwargs
+        op, data.obj, pattern, replacement, **kwargs
     ).groupby(data.grouper.groupings)
 
 
-@execute_node.register(ops.Translate, pd.Series, pd.Series, pd.Series)
-def execute_series_translate_series_series(
-    op, data, from_string, to_string, **kwargs
-):
-    to_string_iter = iter(to_string)
-    table = from_string.apply(
-        lambda x, y: str.maketrans(x, y=next(y)), args=(to_string_iter,)
-    )
-    return data.str.translate(table)
-
-
-@execute_node.register(ops.Translate, pd.Series, pd.Series, str)
-def execute_series_translate_series_scalar(
-    op, data, from_string, to_string, **kwargs
-):
-    table = from_string.map(lambda x, y=to_string: str.maketrans(x=x, y=y))
-    return data.str.translate(table)
-
-
-@execute_node.register(ops.Translate, pd.Series, str, pd.Series)
-def execute_series_translate_scalar_series(
-    op, data, from_string, to_string, **kwargs
-):
-    table = to_string.map(lambda y, x=from_string: str.maketrans(x=x, y=y))
-    return data.str.translate(table)
-
-
-@execute_node.register(ops.Translate, pd.Series, str, str)
-def execute_series_translate_scalar_scalar(
-    op, data, from_string, to_string, **kwargs
-):
-    return data.str.translate(str.maketrans(from_string, to_string))
+@execute_node.register(
+    ops.Translate, pd.Series, (pd.Series, str), (pd.Series, str)
+)
+def execute_series_translate(op, data, from_string, to_string, **kwargs):
+    return kernels.translate(data, from_string, to_string)
 
 
 @execute_node.register(ops.StrRight, pd.Series, integer_types)
@@ -345,31 +301,9 @@ def execute_series_join_scalar_sep(op, sep, data, **kwargs):
     return reduce(lambda x, y: x + sep + y, data)
 
 
-def haystack_to_series_of_lists(haystack, index=None):
-    if index is None:
-        index = toolz.first(
-            piece.index for piece in haystack if hasattr(piece, 'index')
-        )
-    pieces = reduce(
-        operator.add,
-        (
-            pd.Series(getattr(piece, 'values', piece), index=index).map(
-                ibis.util.promote_list
-            )
-            for piece in haystack
-        ),
-    )
-    return pieces
-
-
 @execute_node.register(ops.FindInSet, pd.Series, list)
 def execute_series_find_in_set(op, needle, haystack, **kwargs):
-    pieces = haystack_to_series_of_lists(haystack, index=needle.index)
-    return pieces.map(
-        lambda elements, needle=needle, index=itertools.count(): (
-            ibis.util.safe_index(elements, needle.iat[next(index)])
-        )
-    )
+    return kernels.find_in_set(needle, haystack, needle.index)
 
 
 @execute_node.register(ops.FindInSet, SeriesGroupBy, list)
@@ -398,11 +332,11 @@ def execute_string_group_by_find_in_set(op, needle, haystack, **kwargs):
     except ValueError:
         raise ValueError('Mixing Series and SeriesGroupBy is not allowed')
 
-    pieces = haystack_to_series_of_lists(
-        [getattr(piece, 'obj', piece) for piece in haystack]
+    pieces = [getattr(piece, 'obj', piece) for piece in haystack]
+    index = toolz.first(
+        piece.index for piece in pieces if hasattr(piece, 'index')
     )
-
-    result = pieces.map(toolz.flip(ibis.util.safe_index)(needle))
+    result = kernels.find_in_set(needle, pieces, index)
     if issubclass(collection_type, pd.Series):
         return result
 
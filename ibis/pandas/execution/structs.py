@@ -7,6 +7,7 @@ import pandas as pd
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.operations as ops
+import ibis.pandas.execution.nested_kernels as kernels
 from ibis.pandas.dispatch import execute_node
 
 
@@ -18,14 +19,14 @@ def execute_node_struct_field_dict(op, data, **kwargs):
 @execute_node.register(ops.StructField, pd.Series)
 def execute_node_struct_field_series(op, data, **kwargs):
     field = op.field
-    return data.map(operator.itemgetter(field)).rename(field)
+    result = kernels.struct_field(data, op.arg.type(), field)
+    if result is None:
+        return data.map(operator.itemgetter(field)).rename(field)
+    return result
 
 
 @execute_node.register(ops.StructField, SeriesGroupBy)
 def execute_node_struct_field_series_group_by(op, data, **kwargs):
-    field = op.field
-    return (
-        data.obj.map(operator.itemgetter(field))
-        .rename(field)
-        .groupby(data.grouper.groupings)
+    return execute_node_struct_field_series(op, data.obj, **kwargs).groupby(
+        data.grouper.groupings
     )
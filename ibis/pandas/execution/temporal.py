@@ -7,6 +7,7 @@ from pandas.core.groupby import SeriesGroupBy
 import ibis
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+import ibis.pandas.intervals as intervals
 from ibis.pandas.core import (
     date_types,
     integer_types,
@@ -69,64 +70,76 @@ def execute_timestamp_truncate(op, data, **kwargs):
     return pd.Series(array, name=data.name)
 
 
-OFFSET_CLASS = {
-    "Y": pd.offsets.DateOffset,
-    "Q": pd.offsets.DateOffset,
-    "M": pd.offsets.DateOffset,
-    "W": pd.offsets.DateOffset,
-    # all other units are timedelta64s
-}
+def interval_from_integer_series(data, unit):
+    if unit in intervals.CALENDAR_UNITS:
+        return intervals.from_integers(data, unit)
+    if unit == 'W':
+        return pd.to_timedelta(data * 7, unit='D')
+    return data.astype("timedelta64[{}]".format(unit))
+
+
+def interval_from_integer(value, unit):
+    if unit in intervals.CALENDAR_UNITS:
+        return intervals.from_integer(value, unit)
+    return pd.Timedelta(value, unit=unit)
 
 
 @execute_node.register(ops.IntervalFromInteger, pd.Series)
 def execute_interval_from_integer_series(op, data, **kwargs):
-    unit = op.unit
-    resolution = "{}s".format(op.resolution)
-    cls = OFFSET_CLASS.get(unit, None)
-
-    # fast path for timedelta conversion
-    if cls is None:
-        return data.astype("timedelta64[{}]".format(unit))
-    return data.apply(
-        lambda n, cls=cls, resolution=resolution: cls(**{resolution: n})
-    )
+    return interval_from_integer_series(data, op.unit)
 
 
 @execute_node.register(ops.IntervalFromInteger, integer_types)
 def execute_interval_from_integer_integer_types(op, data, **kwargs):
-    unit = op.unit
-    resolution = "{}s".format(op.resolution)
-    cls = OFFSET_CLASS.get(unit, None)
-
-    if cls is None:
-        return pd.Timedelta(data, unit=unit)
-    return cls(**{resolution: data})
+    return interval_from_integer(data, op.unit)
 
 
 @execute_node.register(ops.Cast, pd.Series, dt.Interval)
 def execute_cast_integer_to_interval_series(op, data, type, **kwargs):
-    to = op.to
-    unit = to.unit
-    resolution = "{}s".format(to.resolution)
-    cls = OFFSET_CLASS.get(unit, None)
-
-    if cls is None:
-        return data.astype("timedelta64[{}]".format(unit))
-    return data.apply(
-        lambda n, cls=cls, resolution=resolution: cls(**{resolution: n})
-    )
+    return interval_from_integer_series(data, op.to.unit)
 
 
 @execute_node.register(ops.Cast, integer_types, dt.Interval)
 def execute_cast_integer_to_interval_integer_types(op, data, type, **kwargs):
-    to = op.to
-    unit = to.unit
-    resolution = "{}s".format(to.resolution)
-    cls = OFFSET_CLASS.get(unit, None)
+    return interval_from_integer(data, op.to.unit)
+
+
+@execute_node.register(
+    (ops.TimestampAdd, ops.DateAdd), (pd.Series,) + timestamp_types, pd.Series
+)
+@execute_node.register(ops.DateAdd, date_types, pd.Series)
+def execute_add_months(op, left, right, **kwargs):
+    if intervals.is_months(op.right, right):
+        return intervals.add_months(left, right)
+    if isinstance(left, pd.Series):
+        return left + right
+    return pd.Timestamp(left) + right
 
-    if cls is None:
-        return pd.Timedelta(data, unit=unit)
-    return cls(**{resolution: data})
+
+@execute_node.register(
+    (ops.TimestampSub, ops.DateSub), (pd.Series,) + timestamp_types, pd.Series
+)
+@execute_node.register(ops.DateSub, date_types, pd.Series)
+def execute_sub_months(op, left, right, **kwargs):
+    if intervals.is_months(op.right, right):
+        return intervals.add_months(left, -right)
+    if isinstance(left, pd.Series):
+        return left - right
+    return pd.Timestamp(left) - right
+
+
+@execute_node.register(
+    (ops.TimestampAdd, ops.DateAdd), pd.Series, pd.offsets.DateOffset
+)
+def execute_add_offset(op, left, right, **kwargs):
+    return left + right
+
+
+@execute_node.register(
+    (ops.TimestampSub, ops.DateSub), pd.Series, pd.offsets.DateOffset
+)
+def execute_sub_offset(op, left, right, **kwargs):
+    return left - right
 
 
 @execute_node.register(ops.TimestampAdd, timestamp_types, timedelta_types)
@@ -134,11 +147,6 @@ def execute_timestamp_add_datetime_timedelta(op, left, right, **kwargs):
     return pd.Timestamp(left) + pd.Timedelta(right)
 
 
-@execute_node.register(ops.TimestampAdd, timestamp_types, pd.Series)
-def execute_timestamp_add_datetime_series(op, left, right, **kwargs):
-    return pd.Timestamp(left) + right
-
-
 @execute_node.register(ops.IntervalAdd, timedelta_types, timedelta_types)
 def execute_interval_add_delta_delta(op, left, right, **kwargs):
     return op.op(pd.Timedelta(left), pd.Timedelta(right))
@@ -159,10 +167,8 @@ def execute_timestamp_interval_add_series_delta(op, left, right, **kwargs):
     return left + pd.Timedelta(right)
 
 
-@execute_node.register(
-    (ops.TimestampAdd, ops.IntervalAdd), pd.Series, pd.Series
-)
-def execute_timestamp_interval_add_series_series(op, left, right, **kwargs):
+@execute_node.register(ops.IntervalAdd, pd.Series, pd.Series)
+def execute_interval_add_series_series(op, left, right, **kwargs):
     return left + right
 
 
@@ -171,10 +177,8 @@ def execute_timestamp_sub_datetime_timedelta(op, left, right, **kwargs):
     return pd.Timestamp(left) - pd.Timedelta(right)
 
 
-@execute_node.register(
-    (ops.TimestampDiff, ops.TimestampSub), timestamp_types, pd.Series
-)
-def execute_timestamp_diff_sub_datetime_series(op, left, right, **kwargs):
+@execute_node.register(ops.TimestampDiff, timestamp_types, pd.Series)
+def execute_timestamp_diff_datetime_series(op, left, right, **kwargs):
     return pd.Timestamp(left) - right
 
 
@@ -184,11 +188,11 @@ def execute_timestamp_sub_series_timedelta(op, left, right, **kwargs):
 
 
 @execute_node.register(
-    (ops.TimestampDiff, ops.TimestampSub, ops.IntervalSubtract),
-    pd.Series,
-    pd.Series,
+    (ops.TimestampDiff, ops.IntervalSubtract), pd.Series, pd.Series
 )
-def execute_timestamp_diff_sub_series_series(op, left, right, **kwargs):
+def execute_timestamp_diff_interval_sub_series_series(
+    op, left, right, **kwargs
+):
     return left - right
 
 
@@ -275,9 +279,9 @@ def execute_day_of_week_name_series_group_by(op, data, **kwargs):
 
 
 @execute_node.register(ops.DateSub, date_types, timedelta_types)
-@execute_node.register((ops.DateDiff, ops.DateSub), date_types, pd.Series)
+@execute_node.register(ops.DateDiff, date_types, pd.Series)
 @execute_node.register(ops.DateSub, pd.Series, timedelta_types)
-@execute_node.register((ops.DateDiff, ops.DateSub), pd.Series, pd.Series)
+@execute_node.register(ops.DateDiff, pd.Series, pd.Series)
 @execute_node.register(ops.DateDiff, date_types, date_types)
 @execute_node.register(ops.DateDiff, pd.Series, date_types)
 def execute_date_sub_diff(op, left, right, **kwargs):
@@ -286,10 +290,8 @@ def execute_date_sub_diff(op, left, right, **kwargs):
 
 @execute_node.register(ops.DateAdd, pd.Series, timedelta_types)
 @execute_node.register(ops.DateAdd, timedelta_types, pd.Series)
-@execute_node.register(ops.DateAdd, pd.Series, pd.Series)
 @execute_node.register(ops.DateAdd, date_types, timedelta_types)
 @execute_node.register(ops.DateAdd, timedelta_types, date_types)
-@execute_node.register(ops.DateAdd, date_types, pd.Series)
 @execute_node.register(ops.DateAdd, pd.Series, date_types)
 def execute_date_add(op, left, right, **kwargs):
     return left + right
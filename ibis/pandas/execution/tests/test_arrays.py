@@ -177,7 +177,7 @@ def test_array_index(t, df, index):
         {
             'indexed': df.array_of_float64.apply(
                 lambda x: x[index] if -len(x) <= index < len(x) else None
-            )
+            ).astype('float64')
         }
     )
     tm.assert_frame_equal(result, expected)
@@ -235,3 +235,75 @@ def test_array_concat_scalar(client, op):
     expr = op(left, right)
     result = client.execute(expr)
     assert result == op(raw_left, raw_right)
+
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'no_arrow'])
+def kernels(request, monkeypatch):
+    from ibis.pandas.execution import nested_kernels as kernels
+
+    if request.param and not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow is not installed')
+    monkeypatch.setattr(kernels, 'ARROW_KERNELS', request.param)
+    return kernels
+
+
+@pytest.fixture
+def arrays_client():
+    df = pd.DataFrame(
+        {
+            'ints': [[1, 2, 3], [], [4, None], [5]],
+            'strings': [['a'], ['b', 'c', 'd'], [], ['e', None]],
+        }
+    )
+    return ibis.pandas.connect({'df': df})
+
+
+@pytest.fixture
+def arrays_table(arrays_client):
+    return arrays_client.table(
+        'df', schema={'ints': 'array<int64>', 'strings': 'array<string>'}
+    )
+
+
+@pytest.mark.parametrize('index', [0, 1, 2, -1, -2, -4])
+def test_array_index_kernel(kernels, arrays_client, arrays_table, index):
+    t = arrays_table
+    result = t[t.ints[index].name('i'), t.strings[index].name('s')].execute()
+
+    def get(array):
+        return array[index] if -len(array) <= index < len(array) else None
+
+    df = arrays_client.dictionary['df']
+    expected = pd.DataFrame(
+        {
+            'i': df.ints.apply(get).astype('float64'),
+            's': df.strings.apply(get).astype(object),
+        }
+    )
+    # rows of NULL elements are objects without pyarrow
+    tm.assert_frame_equal(
+        result, expected, check_dtype=kernels.ARROW_KERNELS
+    )
+
+
+def test_array_length_kernel(kernels, arrays_table):
+    t = arrays_table
+    result = t[t.ints.length().name('i'), t.strings.length().name('s')]
+    expected = pd.DataFrame({'i': [3, 0, 2, 1], 's': [1, 3, 0, 2]})
+    tm.assert_frame_equal(result.execute(), expected)
+
+
+def test_array_kernels_convert_columns_once(arrays_client, arrays_table):
+    from ibis.pandas.execution import nested_kernels as kernels
+
+    if not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow is not installed')
+    t = arrays_table
+    data = arrays_client.dictionary['df'].ints
+    arrow = kernels.to_arrow(data, t.ints.type())
+    assert arrow.to_pylist() == data.tolist()
+    assert kernels.to_arrow(data, t.ints.type()) is arrow
+
+    # values that don't have the type of the column aren't converted
+    assert kernels.to_arrow(data, t.strings.type()) is arrow
+    assert kernels.to_arrow(data.copy(), t.strings.type()) is None
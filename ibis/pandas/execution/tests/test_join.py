@@ -52,6 +52,30 @@ def test_cross_join(left, right, df1, df2):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+def test_cross_join_preserves_dtypes():
+    df1 = pd.DataFrame(
+        {
+            'time': pd.date_range('2018', periods=3, tz='US/Eastern'),
+            'value': [1, 2, 3],
+        }
+    )
+    df2 = pd.DataFrame(
+        {'scenario': pd.Categorical(list('ab')), 'value': [0.5, 1.5]}
+    )
+    client = ibis.pandas.connect({'df1': df1, 'df2': df2})
+    left = client.table('df1')
+    right = client.table('df2')
+    expr = left.cross_join(right)[
+        left, right.scenario, right.value.name('other_value')
+    ]
+    result = expr.execute()
+    expected = pd.merge(
+        df1.assign(dummy=1), df2.assign(dummy=1), how='inner', on='dummy'
+    ).rename(columns=dict(value_x='value', value_y='other_value'))
+    del expected['dummy']
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 @join_type
 def test_join_project_left_table(how, left, right, df1, df2):
     expr = left.join(right, left.key == right.key, how=how)[left, right.key3]
@@ -100,17 +124,92 @@ def test_join_with_multiple_predicates_written_as_one(
 
 @join_type
 def test_join_with_invalid_predicates(how, left, right):
-    predicate = (left.key == right.key) & (left.key2 <= right.key3)
+    predicate = (left.key == right.key) & (left.key2 != right.key3)
     expr = left.join(right, predicate, how=how)
     with pytest.raises(TypeError):
         expr.execute()
 
-    predicate = left.key >= right.key
+    predicate = left.key != right.key
     expr = left.join(right, predicate, how=how)
     with pytest.raises(TypeError):
         expr.execute()
 
 
+@pytest.mark.parametrize(
+    ('how', 'expected'),
+    [
+        (
+            'inner',
+            pd.DataFrame(
+                {'key': list('cd'), 'value': [5, 6], 'other_value': 4.0}
+            ),
+        ),
+        (
+            'left',
+            pd.DataFrame(
+                {
+                    'key': list('abcd'),
+                    'value': [3, 4, 5, 6],
+                    'other_value': [None, None, 4.0, 4.0],
+                }
+            ),
+        ),
+        (
+            'right',
+            pd.DataFrame(
+                {
+                    'key': ['c', 'd', None],
+                    'value': [5, 6, None],
+                    'other_value': [4.0, 4.0, 6.0],
+                }
+            ),
+        ),
+        (
+            'outer',
+            pd.DataFrame(
+                {
+                    'key': ['a', 'b', 'c', 'd', None],
+                    'value': [3, 4, 5, 6, None],
+                    'other_value': [None, None, 4.0, 4.0, 6.0],
+                }
+            ),
+        ),
+    ],
+)
+def test_join_with_range_predicate(how, expected, left, right):
+    expr = left.join(right, left.value > right.other_value, how=how)[
+        left.key, left.value, right.other_value
+    ]
+    result = (
+        expr.execute()
+        .sort_values(['value', 'other_value'])
+        .reset_index(drop=True)
+    )
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
+@join_type
+def test_join_with_equality_and_between_predicates(
+    how, left, right, df1, df2
+):
+    predicates = [
+        left.key == right.key,
+        left.value.between(right.other_value - 1, right.other_value + 1),
+    ]
+    expr = left.join(right, predicates, how=how)[left, right.other_value]
+    result = expr.execute().sort_values('key').reset_index(drop=True)
+
+    # every pair of rows with equal keys is in range
+    assert df1.merge(df2, on='key').eval('abs(value - other_value) <= 1').all()
+    expected = (
+        pd.merge(df1, df2, on='key', how=how)
+        .drop('key3', axis=1)
+        .sort_values('key')
+        .reset_index(drop=True)
+    )
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 @join_type
 @pytest.mark.xfail(reason='Hard to detect this case')
 def test_join_with_duplicate_non_key_columns(how, left, right, df1, df2):
@@ -144,6 +243,66 @@ def test_join_with_duplicate_non_key_columns_not_selected(
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+@pytest.mark.parametrize('how', ['inner', 'left'])
+@pytest.mark.parametrize(
+    'predicates',
+    [
+        lambda left, right: [left.key == right.key],
+        lambda left, right: [
+            left.key == right.key,
+            left.key2 == right.key3,
+        ],
+    ],
+)
+def test_join_with_index_cache(how, predicates, df1, df2):
+    # the right table has a duplicate key
+    df2 = pd.concat([df2, df2.iloc[:1]], ignore_index=True)
+    client = ibis.pandas.connect({'left': df1, 'right': df2})
+    left = client.table('left')
+    right = client.table('right')
+    expr = left.join(right, predicates(left, right), how=how)[
+        left, right.other_value, right.key3
+    ]
+    expected = expr.execute()
+
+    with ibis.config.option_context('pandas.join_index_cache_size', 1 << 20):
+        first = expr.execute()
+        assert len(client.join_indexes) == 1
+        second = expr.execute()
+        assert len(client.join_indexes) == 1
+
+        df2 = df2.assign(other_value=df2.other_value * 2)
+        client.load_data('right', df2)
+        assert not client.join_indexes
+        third = expr.execute()
+
+    tm.assert_frame_equal(first, expected)
+    tm.assert_frame_equal(second, expected)
+    tm.assert_frame_equal(
+        third,
+        expected.assign(other_value=expected.other_value * 2),
+    )
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+@pytest.mark.parametrize('cache_size', [0, 1 << 20])
+def test_join_with_index_cache_keeps_merge_order(how, cache_size):
+    df1 = pd.DataFrame({'key': list('babcad'), 'value': range(6)})
+    df2 = pd.DataFrame({'key': list('abab'), 'other_value': range(4)})
+    client = ibis.pandas.connect({'left': df1, 'right': df2})
+    left = client.table('left')
+    right = client.table('right')
+    expr = left.join(right, left.key == right.key, how=how)[
+        left, right.other_value
+    ]
+    with ibis.config.option_context(
+        'pandas.join_index_cache_size', cache_size
+    ):
+        result = expr.execute()
+    expected = pd.merge(df1, df2, on='key', how=how)
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 @join_type
 def test_join_with_post_expression_selection(how, left, right, df1, df2):
     join = left.join(right, left.key == right.key, how=how)
@@ -173,6 +332,32 @@ def test_join_with_post_expression_filter(how, left):
     tm.assert_frame_equal(result, expected)
 
 
+@join_type
+def test_join_with_single_side_filters(how, left, right, df1, df2):
+    joined = left.join(right, 'key', how=how)
+    projected = joined[left, right.other_value, right.key3]
+    expr = projected.filter(
+        [
+            projected.value > 3,
+            projected.key3 == 'e',
+            projected.value < projected.other_value + 1,
+        ]
+    )
+    result = expr.execute().sort_values('key').reset_index(drop=True)
+
+    expected = pd.merge(df1, df2, on='key', how=how)
+    expected = (
+        expected.loc[
+            (expected.value > 3)
+            & (expected.key3 == 'e')
+            & (expected.value < expected.other_value + 1)
+        ]
+        .sort_values('key')
+        .reset_index(drop=True)
+    )
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 @join_type
 def test_multi_join_with_post_expression_filter(how, left, df1):
     lhs = left[['key', 'key2']]
@@ -1,5 +1,6 @@
 import pandas as pd
 import pandas.util.testing as tm
+import pytest
 
 import ibis
 
@@ -72,3 +73,72 @@ def test_map_value_for_key_literal_broadcast(t):
     result = expr.execute()
     expected = pd.Series([4, 1, 4], name='dup_strings')
     tm.assert_series_equal(result, expected)
+
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'no_arrow'])
+def kernels(request, monkeypatch):
+    from ibis.pandas.execution import nested_kernels as kernels
+
+    if request.param and not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow is not installed')
+    monkeypatch.setattr(kernels, 'ARROW_KERNELS', request.param)
+    return kernels
+
+
+@pytest.fixture
+def maps_client():
+    df = pd.DataFrame(
+        {
+            'm': [
+                {'a': 1, 'b': 2},
+                None,
+                {},
+                {'b': 3, 'c': None},
+                {'a': 4},
+            ]
+        }
+    )
+    return ibis.pandas.connect({'df': df})
+
+
+@pytest.mark.parametrize('key', ['a', 'b', 'c', 'z'])
+def test_map_value_for_key_kernel(kernels, maps_client, key):
+    t = maps_client.table('df', schema={'m': 'map<string, int64>'})
+    m = maps_client.dictionary['df'].m
+    result = t.m[key].execute()
+    expected = m.map(
+        lambda mapping: None if mapping is None else mapping.get(key)
+    ).astype('float64')
+    # rows of NULL values are objects without pyarrow
+    tm.assert_series_equal(
+        result, expected, check_dtype=kernels.ARROW_KERNELS
+    )
+
+    result = t.m.get(key, -1).execute()
+    expected = m.map(
+        lambda mapping: None if mapping is None else mapping.get(key, -1)
+    )
+    tm.assert_series_equal(result.astype(object), expected.astype(object))
+
+
+@pytest.mark.parametrize(
+    ('key', 'default', 'expected'),
+    [('x', -1, [1, -1, 3, -1, -1]), ('q', 0, [0, 0, 0, 0, 0])],
+)
+def test_map_value_or_default_kernel_keeps_dtype(key, default, expected):
+    from ibis.pandas.execution import nested_kernels as kernels
+
+    if not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow is not installed')
+    df = pd.DataFrame({'m': [{'x': 1}, {'a': 2}, {'x': 3}, {}, {'b': 1}]})
+    client = ibis.pandas.connect({'df': df})
+    t = client.table('df', schema={'m': 'map<string, int64>'})
+    result = t.m.get(key, default).execute()
+    tm.assert_series_equal(result, pd.Series(expected, name='m'))
+
+
+def test_map_length_kernel(kernels, maps_client):
+    t = maps_client.table('df', schema={'m': 'map<string, int64>'})
+    result = t.m.length().execute()
+    expected = pd.Series([2, None, 0, 2, 1], name='m')
+    tm.assert_series_equal(result, expected)
@@ -9,6 +9,8 @@ import pytest
 
 import ibis
 import ibis.expr.datatypes as dt
+from ibis.pandas.core import execute_required_columns, required_columns
+from ibis.pandas.udf import udf
 
 pytestmark = pytest.mark.pandas
 
@@ -49,6 +51,62 @@ def test_mutate(t, df):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+def test_filter_before_projection(t, df):
+    seen = []
+
+    @udf.elementwise(input_type=[dt.int64], output_type=dt.int64)
+    def add_one(x):
+        seen.append(len(x))
+        return x + 1
+
+    expr = t[t.dup_strings == 'd'][
+        t.plain_int64, add_one(t.plain_int64).name('x')
+    ]
+    result = expr.execute()
+    expected = (
+        df.loc[df.dup_strings == 'd', ['plain_int64']]
+        .assign(x=lambda df: df.plain_int64 + 1)
+        .reset_index(drop=True)
+    )
+    tm.assert_frame_equal(result, expected)
+    assert seen == [len(expected)]
+
+
+def test_required_columns(t):
+    expr = t.group_by('dup_strings').aggregate(total=t.plain_int64.sum())
+    assert required_columns(expr) == {t.op(): ('plain_int64', 'dup_strings')}
+
+    expr = t[t.plain_int64 > 1]
+    assert required_columns(expr) == {}
+
+    expr = expr.mutate(x=expr.plain_float64 * 2)
+    assert required_columns(expr) == {}
+
+
+def test_execute_required_columns(t, df):
+    expr = t.group_by('dup_strings').aggregate(total=t.plain_int64.sum())
+    scope = execute_required_columns(expr, {})
+    assert list(scope) == [t.op()]
+    assert sorted(scope[t.op()].columns) == ['dup_strings', 'plain_int64']
+    tm.assert_frame_equal(
+        scope[t.op()], df.loc[:, ['plain_int64', 'dup_strings']]
+    )
+
+    assert not execute_required_columns(t[t.plain_int64 > 1], {})
+
+
+def test_execute_with_required_columns(t, df):
+    expr = t.group_by('dup_strings').aggregate(total=t.plain_int64.sum())
+    result = expr.execute()
+    expected = (
+        df.groupby('dup_strings')
+        .plain_int64.sum()
+        .rename('total')
+        .reset_index()
+    )
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
 def test_project_scope_does_not_override(t, df):
     col = t.plain_int64
     expr = t[
@@ -350,6 +408,43 @@ def test_frame_limit(t, df, offset):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+@pytest.mark.parametrize('offset', [0, 2])
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('n', [1, 4, 9])
+def test_sorted_frame_limit(n, ascending, offset):
+    df = pd.DataFrame(
+        {
+            'key': [3.0, 1.0, np.nan, 3.0, 2.0, 1.0, np.nan, 3.0],
+            'other': list('abcdefgh'),
+        }
+    )
+    t = ibis.pandas.connect({'df': df}).table('df')
+    key = t.key if ascending else ibis.desc(t.key)
+    expr = t.sort_by([key, t.other]).limit(n, offset=offset)
+    result = expr.execute()
+    expected = (
+        df.sort_values(
+            ['key', 'other'], ascending=[ascending, True], kind='mergesort'
+        )
+        .iloc[offset : offset + n]
+        .reset_index(drop=True)
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_topk_aggregation_limit(t, df):
+    expr = t.dup_strings.topk(1).to_aggregation()
+    result = expr.execute()
+    expected = (
+        df.dup_strings.value_counts()
+        .iloc[:1]
+        .rename_axis('dup_strings')
+        .rename('count')
+        .reset_index()
+    )
+    tm.assert_frame_equal(result, expected, check_dtype=False)
+
+
 @pytest.mark.xfail(
     raises=AttributeError, reason='TableColumn does not implement limit'
 )
@@ -471,6 +566,59 @@ def test_group_by_multiple_keys(t, df):
     tm.assert_frame_equal(result[expected.columns], expected)
 
 
+@pytest.mark.parametrize(
+    'where',
+    [
+        lambda t: None,
+        lambda t: t.dup_strings == 'd',
+        lambda t: (t.dup_strings == 'd') | (t.plain_int64 < 100),
+    ],
+)
+def test_fused_group_by_aggregation(t, df, where):
+    ibis_where = where(t)
+    expr = t.groupby([t.dup_strings, t.dup_ints]).aggregate(
+        sum_float64=t.plain_float64.sum(where=ibis_where),
+        sum_int64=t.plain_int64.sum(),
+        mean_int64=t.plain_int64.mean(where=ibis_where),
+        min_float64=t.plain_float64.min(where=ibis_where),
+        max_strings=t.strings_with_nulls.max(),
+        count_strings=t.strings_with_nulls.count(where=ibis_where),
+        nunique_strings=t.strings_with_nulls.nunique(where=ibis_where),
+        std_float64=t.plain_float64.std(where=ibis_where),
+        var_int64=t.plain_int64.var(),
+        pop_var_int64=t.plain_int64.var(how='pop'),
+        doubled_sum=t.plain_float64.sum() * 2,
+    )
+    result = expr.execute()
+
+    pandas_where = where(df)
+    mask = slice(None) if pandas_where is None else pandas_where
+    expected = (
+        df.groupby(['dup_strings', 'dup_ints'])
+        .apply(
+            lambda x, mask=mask: pd.Series(
+                {
+                    'sum_float64': x.plain_float64[mask].sum(),
+                    'sum_int64': x.plain_int64.sum(),
+                    'mean_int64': x.plain_int64[mask].mean(),
+                    'min_float64': x.plain_float64[mask].min(),
+                    'max_strings': x.strings_with_nulls.max(),
+                    'count_strings': x.strings_with_nulls[mask].count(),
+                    'nunique_strings': x.strings_with_nulls[mask].nunique(),
+                    'std_float64': x.plain_float64[mask].std(),
+                    'var_int64': x.plain_int64.var(),
+                    'pop_var_int64': x.plain_int64.var(ddof=0),
+                    'doubled_sum': x.plain_float64.sum() * 2,
+                }
+            )
+        )
+        .reset_index()
+    )
+    tm.assert_frame_equal(
+        result[expected.columns], expected, check_dtype=False
+    )
+
+
 def test_mutate_after_group_by(t, df):
     gb = t.groupby(t.dup_strings).aggregate(
         avg_plain_float64=t.plain_float64.mean()
@@ -1,9 +1,14 @@
+import fnmatch
 from warnings import catch_warnings
 
+import numpy as np
+import pandas as pd
 import pandas.util.testing as tm  # noqa: E402
 import pytest
+import regex as re
 from pytest import param
 
+import ibis
 from ibis.pandas.execution.strings import sql_like_to_regex
 
 pytestmark = pytest.mark.pandas
@@ -131,3 +136,200 @@ def test_string_ops(t, df, case_func, expected_func):
 def test_sql_like_to_regex(pattern, expected):
     result = sql_like_to_regex(pattern, escape='^')
     assert result == '^{}$'.format(expected)
+
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'no_arrow'])
+def kernels(request, monkeypatch):
+    from ibis.pandas.execution import string_kernels as kernels
+
+    if request.param and not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow string kernels are not available')
+    monkeypatch.setattr(kernels, 'ARROW_KERNELS', request.param)
+    return kernels
+
+
+@pytest.fixture
+def strings():
+    return pd.Series(
+        [
+            'abc',
+            'a.c',
+            'xabcx',
+            'ab_c',
+            '',
+            None,
+            'line\nbreak',
+            '12 ab 345',
+            'ünïcode 42',
+            'a%c',
+        ],
+        name='strings',
+    )
+
+
+def _like_reference(pattern, escape):
+    # translate the LIKE pattern to a shell pattern, whose bracket
+    # expressions match a single literal character
+    translated = []
+    chars = iter(pattern)
+    for char in chars:
+        if char == escape:
+            translated.append('[{}]'.format(next(chars)))
+        elif char == '%':
+            translated.append('*')
+        elif char == '_':
+            translated.append('?')
+        else:
+            translated.append('[{}]'.format(char))
+    shell_pattern = ''.join(translated)
+    return lambda value: isinstance(value, str) and fnmatch.fnmatchcase(
+        value, shell_pattern
+    )
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'escape'),
+    [
+        ('abc', None),
+        ('a.c', None),
+        ('abc%', None),
+        ('%c', None),
+        ('%bc%', None),
+        ('%%', None),
+        ('a_c', None),
+        ('a%c', None),
+        ('a^%c', '^'),
+        ('%^_%', '^'),
+        ('%k', None),
+        ('', None),
+    ],
+)
+def test_like_kernel(kernels, strings, pattern, escape):
+    result = kernels.like(strings, pattern, escape=escape)
+    expected = strings.map(_like_reference(pattern, escape))
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    'pattern', [r'\d+', '(ab)+', 'b$', r'(?<=a)b', r'[[:digit:]]{2}']
+)
+def test_regex_search_kernel(kernels, strings, pattern):
+    result = kernels.regex_search(strings, pattern)
+    compiled = re.compile(pattern)
+    expected = strings.map(
+        lambda value: isinstance(value, str)
+        and compiled.search(value) is not None
+    )
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'index'),
+    [(r'(\d+) (\w+)', 0), (r'(\d+) (\w+)', 2), ('(a)(x)?', 2), ('a', 0)],
+)
+def test_regex_extract_kernel(kernels, strings, pattern, index):
+    result = kernels.regex_extract(strings, pattern, index)
+    compiled = re.compile(pattern)
+
+    def extract(value):
+        match = compiled.match(value) if isinstance(value, str) else None
+        return (match.group(index) or np.nan) if match else np.nan
+
+    tm.assert_series_equal(result, strings.map(extract))
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'replacement'),
+    [(r'\d', '#'), ('a(b)?', r'<\1>'), (r'\s', ''), ('(?<=a)b', 'B')],
+)
+def test_regex_replace_kernel(kernels, strings, pattern, replacement):
+    result = kernels.regex_replace(strings, pattern, replacement)
+    compiled = re.compile(pattern)
+    expected = strings.map(
+        lambda value: compiled.sub(replacement, value)
+        if isinstance(value, str)
+        else np.nan
+    )
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ('value', 'pattern', 'replacement', 'expected'),
+    [
+        ('axb', 'x*', '-', '-a--b-'),
+        ('abc', 'b?', '#', '#a##c#'),
+        ('abc', '$', '!', 'abc!'),
+        ('abc', r'\b', '|', '|abc|'),
+        ('abcb', 'b', '#', 'a#c#'),
+    ],
+)
+def test_regex_replace_kernel_empty_matches(
+    kernels, value, pattern, replacement, expected
+):
+    strings = pd.Series([value, None], name='strings')
+    result = kernels.regex_replace(strings, pattern, replacement)
+    expected = pd.Series([expected, np.nan], name='strings')
+    tm.assert_series_equal(result, expected)
+
+
+@pytest.mark.parametrize(
+    ('pattern', 'replacement'), [('x*', '-'), ('b?', '#'), ('b', '#')]
+)
+def test_regex_replace_kernel_ignores_other_rows(
+    kernels, strings, pattern, replacement
+):
+    # the only string that is not ASCII
+    assert strings[8] == 'ünïcode 42'
+    ascii_strings = strings.drop(8)
+    result = kernels.regex_replace(strings, pattern, replacement)
+    expected = kernels.regex_replace(ascii_strings, pattern, replacement)
+    tm.assert_series_equal(result.drop(8), expected)
+
+
+@pytest.mark.parametrize('pattern', ['b', 'b*'])
+def test_regex_replace_kernel_nulls(kernels, pattern):
+    strings = pd.Series(['abc', None], name='strings')
+    result = kernels.regex_replace(strings, pattern, 'Q')
+    assert result.iloc[0] == re.sub(pattern, 'Q', 'abc')
+    assert result.iloc[1] is None
+
+
+def test_translate_kernel(strings):
+    from ibis.pandas.execution.string_kernels import translate
+
+    from_string = pd.Series(['ab', 'a'] * 5)
+    to_string = pd.Series(['xy', 'z'] * 5)
+    result = translate(strings, from_string, to_string)
+    expected = pd.Series(
+        [
+            value.translate(str.maketrans(x, y))
+            if isinstance(value, str)
+            else np.nan
+            for value, x, y in zip(strings, from_string, to_string)
+        ],
+        name='strings',
+    )
+    tm.assert_series_equal(result, expected)
+
+    result = translate(strings, 'ab', pd.Series(['xy', 'qq'] * 5))
+    assert result.iloc[0] == 'xyc'
+    assert result.iloc[1] == 'q.c'
+    assert np.isnan(result.iloc[5])
+
+
+def test_find_in_set_kernel():
+    from ibis.pandas.execution.string_kernels import find_in_set
+
+    needle = pd.Series(['a', 'b', 'c', None])
+    haystack = [pd.Series(['b', 'b', 'x', 'y']), 'a', 'b']
+    result = find_in_set(needle, haystack, needle.index)
+    expected = pd.Series(
+        [
+            ibis.util.safe_index(
+                [getattr(piece, 'iloc', [piece] * 4)[i] for piece in haystack],
+                value,
+            )
+            for i, value in enumerate(needle)
+        ]
+    )
+    tm.assert_series_equal(result, expected)
@@ -81,3 +81,25 @@ def test_struct_field_series_group_by_value(struct_table):
     # these are floats because we have a NULL value in the input data
     expected = pd.DataFrame([("a", 0.0), ("b", 1.0)], columns=["key", "total"])
     tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('arrow', [True, False], ids=['arrow', 'no_arrow'])
+def test_struct_field_null_struct(monkeypatch, arrow):
+    from ibis.pandas.execution import nested_kernels as kernels
+
+    if arrow and not kernels.ARROW_KERNELS:
+        pytest.skip('pyarrow is not installed')
+    monkeypatch.setattr(kernels, 'ARROW_KERNELS', arrow)
+
+    df = pd.DataFrame({'s': [{'a': 1, 'b': 'x'}, None, {'a': None, 'b': 'y'}]})
+    client = ibis.pandas.connect({'t': df})
+    t = client.table('t', schema={'s': 'struct<a: int64, b: string>'})
+    expr = t[t.s.a, t.s.b]
+    if not arrow:
+        # rows of Python structs can't be NULL
+        with pytest.raises(TypeError):
+            expr.execute()
+        return
+    result = expr.execute()
+    expected = pd.DataFrame({'a': [1.0, None, None], 'b': ['x', None, 'y']})
+    tm.assert_frame_equal(result, expected)
@@ -174,3 +174,123 @@ def test_interval_arithmetic(op, expected):
     result = expr.execute()
     expected = pd.Series(expected(data, data), name='td')
     tm.assert_series_equal(result, expected)
+
+
+@pytest.fixture(scope='module')
+def calendar_client():
+    df = pd.DataFrame(
+        {
+            'ts': pd.to_datetime(
+                [
+                    '2000-01-31 10:00',
+                    '2000-02-29 23:59:59.999',
+                    None,
+                    '2019-12-31',
+                    '2020-05-15 01:02:03',
+                    '1999-03-31',
+                ]
+            ),
+            'n': [1, -1, 2, 14, 0, -13],
+            'nullable': [1.0, None, 2.0, 3.0, None, -1.0],
+        }
+    )
+    return ibis.pandas.connect({'df': df})
+
+
+def offsets(values, unit):
+    months = {'Y': 12, 'Q': 3, 'M': 1}[unit]
+    return [
+        pd.DateOffset(months=int(value) * months)
+        if not pd.isnull(value)
+        else None
+        for value in values
+    ]
+
+
+def shift(timestamps, offsets, sign=1):
+    return pd.Series(
+        [
+            pd.NaT
+            if pd.isnull(timestamp) or offset is None
+            else timestamp + sign * offset
+            for timestamp, offset in zip(timestamps, offsets)
+        ]
+    )
+
+
+@pytest.mark.parametrize('unit', ['Y', 'Q', 'M'])
+@pytest.mark.parametrize('column', ['n', 'nullable'])
+def test_add_calendar_interval_column(calendar_client, unit, column):
+    t = calendar_client.table('df', schema={'nullable': dt.int64})
+    df = calendar_client.dictionary['df']
+    interval = t[column].to_interval(unit=unit)
+    expected = offsets(df[column], unit)
+
+    result = (t.ts + interval).execute()
+    tm.assert_series_equal(result, shift(df.ts, expected), check_names=False)
+
+    result = (t.ts - interval).execute()
+    tm.assert_series_equal(
+        result, shift(df.ts, expected, sign=-1), check_names=False
+    )
+
+    result = (t.ts.date() + interval).execute()
+    tm.assert_series_equal(
+        result,
+        shift(df.ts.dt.normalize(), expected),
+        check_names=False,
+    )
+
+    result = (t[column].cast(dt.Interval(unit)) + t.ts).execute()
+    tm.assert_series_equal(result, shift(df.ts, expected), check_names=False)
+
+
+def test_add_calendar_interval_column_to_scalar(calendar_client):
+    t = calendar_client.table('df')
+    df = calendar_client.dictionary['df']
+    timestamp = pd.Timestamp('2000-01-31')
+    expr = ibis.literal(timestamp) + t.n.to_interval(unit='M')
+    result = expr.execute()
+    expected = shift([timestamp] * len(df), offsets(df.n, 'M'))
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize(
+    'interval',
+    [
+        param(ibis.interval(months=2), id='literal'),
+        param(ibis.literal(5).to_interval(unit='Q'), id='from_integer'),
+    ],
+)
+def test_add_calendar_interval_scalar(calendar_client, interval):
+    t = calendar_client.table('df')
+    df = calendar_client.dictionary['df']
+    offset = ibis.pandas.execute(interval)
+    assert isinstance(offset, pd.DateOffset)
+    result = (t.ts + interval).execute()
+    tm.assert_series_equal(result, df.ts + offset, check_names=False)
+
+
+def test_calendar_interval_arithmetic(calendar_client):
+    t = calendar_client.table('df')
+    df = calendar_client.dictionary['df']
+    months = t.n.to_interval(unit='M')
+    expr = t.ts + (months * 2 + t.n.to_interval(unit='Y'))
+    result = expr.execute()
+    expected = shift(df.ts, offsets(df.n * 14, 'M'))
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+@pytest.mark.parametrize('unit', ['Y', 'M'])
+def test_calendar_interval_column_result(calendar_client, unit):
+    t = calendar_client.table('df')
+    df = calendar_client.dictionary['df']
+    resolution = '{}s'.format(dt.Interval(unit).resolution)
+    interval = t.n.to_interval(unit=unit)
+    expected = pd.Series(
+        [pd.DateOffset(**{resolution: n}) for n in df.n], name='n'
+    )
+
+    tm.assert_series_equal(interval.execute(), expected)
+    result = t[interval.name('interval')].execute()
+    tm.assert_series_equal(result.interval, expected.rename('interval'))
@@ -498,6 +498,129 @@ def test_window_with_mlb():
         )
 
 
+@pytest.mark.parametrize(
+    ('reduction', 'pandas_reduction'),
+    [
+        (methodcaller('sum'), methodcaller('sum')),
+        (methodcaller('mean'), methodcaller('mean')),
+        (methodcaller('count'), methodcaller('count')),
+        (methodcaller('min'), methodcaller('min')),
+        (methodcaller('max'), methodcaller('max')),
+        (methodcaller('var'), methodcaller('var')),
+        (methodcaller('std', how='pop'), methodcaller('std', ddof=0)),
+    ],
+)
+def test_grouped_window_with_mlb(reduction, pandas_reduction):
+    index = pd.date_range('20170501', periods=20, freq='12H')
+    df = pd.DataFrame(
+        {
+            'time': index,
+            'key': list('ab') * 10,
+            'value': [np.nan, 1.0, 2.0, np.nan, 4.0] * 4,
+        }
+    )
+    client = ibis.pandas.connect({'df': df})
+    t = client.table('df')
+    rows_with_mlb = rows_with_max_lookback(3, ibis.interval(days=2))
+    window = ibis.trailing_window(
+        rows_with_mlb, order_by='time', group_by='key'
+    )
+    expr = t.mutate(result=reduction(t.value).over(window))
+    result = expr.execute()
+
+    rolled = (
+        df.set_index('time')
+        .groupby('key')
+        .value.rolling('2d', closed='both', min_periods=1)
+        .apply(lambda s: pandas_reduction(s.iloc[-3:]), raw=False)
+        .reset_index(level='key', drop=True)
+    )
+    expected = df.assign(result=rolled.loc[df.time].values)
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
+def test_windows_share_sorted_frame(t, df, monkeypatch):
+    from ibis.pandas.execution import util
+
+    calls = []
+    compute_sorted_frame = util.compute_sorted_frame
+
+    def counting_compute_sorted_frame(*args, **kwargs):
+        calls.append(None)
+        return compute_sorted_frame(*args, **kwargs)
+
+    monkeypatch.setattr(
+        util, 'compute_sorted_frame', counting_compute_sorted_frame
+    )
+
+    window = ibis.trailing_window(
+        1, group_by=t.dup_strings, order_by=t.plain_int64
+    )
+    other_window = ibis.cumulative_window(order_by=t.plain_int64)
+    expr = t.mutate(
+        sum=t.plain_float64.sum().over(window),
+        mean=t.plain_float64.mean().over(window),
+        lag=t.plain_float64.lag().over(window),
+        cumsum=t.plain_float64.sum().over(other_window),
+    )
+    result = expr.execute()
+    assert len(calls) == 2
+
+    gb = df.sort_values(['dup_strings', 'plain_int64']).groupby('dup_strings')
+    expected = df.assign(
+        sum=gb.plain_float64.rolling(2, min_periods=1)
+        .sum()
+        .reset_index(level=0, drop=True),
+        mean=gb.plain_float64.rolling(2, min_periods=1)
+        .mean()
+        .reset_index(level=0, drop=True),
+        lag=gb.plain_float64.shift(),
+        cumsum=df.sort_values('plain_int64').plain_float64.cumsum(),
+    )
+    tm.assert_frame_equal(result[expected.columns], expected)
+
+
+@pytest.mark.parametrize(('how', 'expected'), [('sum', 4.0), ('mean', 1.0)])
+def test_rolling_sum_after_large_values(how, expected):
+    n = 20000
+    df = pd.DataFrame(
+        {'i': np.arange(n + 5), 'value': np.r_[np.full(n, 1e12), np.ones(5)]}
+    )
+    t = ibis.pandas.connect({'df': df}).table('df')
+    window = ibis.trailing_window(3, order_by='i')
+    expr = t.mutate(result=getattr(t.value, how)().over(window))
+    result = expr.execute().result.tail(2).tolist()
+    assert result == [expected, expected]
+
+
+@pytest.mark.parametrize('how', ['var', 'std'])
+def test_rolling_variance_of_large_values(how):
+    np.random.seed(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            'i': np.arange(2 * n),
+            'key': ['a'] * n + ['b'] * n,
+            'value': np.r_[np.random.rand(n), 1e8 + np.random.rand(n)],
+        }
+    )
+    t = ibis.pandas.connect({'df': df}).table('df')
+    window = ibis.trailing_window(9, order_by='i', group_by='key')
+    expr = t.mutate(result=getattr(t.value, how)().over(window))
+    result = expr.execute().sort_values('i').result.values
+
+    values = df.value.values
+    expected = np.array(
+        [
+            getattr(np, how)(values[max(i - 9, i // n * n) : i + 1], ddof=1)
+            if i % n
+            else np.nan
+            for i in range(2 * n)
+        ]
+    )
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
 def test_window_has_pre_execute_scope():
     signature = ops.Lag, ibis.pandas.PandasClient
     called = [0]
@@ -1,5 +1,7 @@
 import operator
 
+import numpy as np
+import pandas as pd
 import toolz
 
 import ibis
@@ -21,7 +23,54 @@ def compute_sort_key(key, data, scope=None, **kwargs):
         return name, new_column
 
 
-def compute_sorted_frame(df, order_by, group_by=(), **kwargs):
+def _top_k_positions(df, by, ascending, k):
+    """Return the positions of the rows of `df` that can be among the first
+    `k` rows once `df` is stably sorted by the columns in `by`, or
+    :data:`None` if they cannot be found without sorting.
+
+    Every row whose first sort key ranks strictly before the `k`-th smallest
+    (or largest) value is a candidate, along with every row tied with it, so
+    sorting only the candidates yields the same first `k` rows as sorting the
+    whole frame.
+    """
+    key = df[by[0]]
+    if key.dtype.kind not in 'iufmM':
+        return None
+
+    values = pd.Series(key.values)
+    select = values.nsmallest if ascending[0] else values.nlargest
+    positions = select(k, keep='all').index.values
+
+    if len(positions) < k:
+        # nulls sort last regardless of the direction
+        nulls = np.flatnonzero(values.isnull().values)
+        positions = np.concatenate([positions, nulls])
+
+    # sorting is stable so the candidates must keep their original order
+    positions.sort()
+    return positions
+
+
+def compute_sorted_frame(df, order_by, group_by=(), top_k=None, **kwargs):
+    """Sort `df` by `group_by` and then `order_by`.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+    order_by : List[ir.SortExpr]
+    group_by : List[ir.ColumnExpr]
+    top_k : Optional[int]
+        If given, only the first `top_k` rows of the sorted frame are
+        returned, which is computed without sorting the entire frame when
+        possible.
+    kwargs : dict
+
+    Returns
+    -------
+    result : pd.DataFrame
+    grouping_keys : List[str]
+    ordering_keys : List[str]
+    """
     computed_sort_keys = []
     sort_keys = list(toolz.concatv(group_by, order_by))
     ascending = [getattr(key.op(), 'ascending', True) for key in sort_keys]
@@ -37,9 +86,17 @@ def compute_sorted_frame(df, order_by, group_by=(), **kwargs):
             new_columns[computed_sort_key] = temporary_column
 
     result = df.assign(**new_columns)
+    if top_k is not None and top_k < len(result.index):
+        positions = _top_k_positions(
+            result, computed_sort_keys, ascending, top_k
+        )
+        if positions is not None:
+            result = result.iloc[positions]
     result = result.sort_values(
         computed_sort_keys, ascending=ascending, kind='mergesort'
     )
+    if top_k is not None:
+        result = result.iloc[:top_k]
     # TODO: we'll eventually need to return this frame with the temporary
     # columns and drop them in the caller (maybe using post_execute?)
     ngrouping_keys = len(group_by)
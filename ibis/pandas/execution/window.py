@@ -66,42 +66,37 @@ def _post_process_group_by_order_by(series, parent, order_by, group_by):
     return series
 
 
-@execute_node.register(ops.WindowOp, pd.Series, win.Window)
-def execute_window_op(
-    op, data, window, scope=None, aggcontext=None, clients=None, **kwargs
-):
-    operand = op.expr
-    # pre execute "manually" here because otherwise we wouldn't pickup
-    # relevant scope changes from the child operand since we're managing
-    # execution of that by hand
-    operand_op = operand.op()
-    pre_executed_scope = pre_execute(
-        operand_op, *clients, scope=scope, aggcontext=aggcontext, **kwargs
-    )
-    scope = toolz.merge(scope, pre_executed_scope)
-    (root,) = op.root_tables()
-    root_expr = root.to_expr()
-    data = execute(
-        root_expr,
-        scope=scope,
-        clients=clients,
-        aggcontext=aggcontext,
-        **kwargs,
+def _window_key(root, window):
+    """Return a hashable key identifying the frame a window is computed over.
+    """
+    return (
+        root,
+        tuple(key.op() for key in window._group_by),
+        tuple(key.op() for key in window._order_by),
     )
 
-    following = window.following
-    order_by = window._order_by
-
-    if (
-        order_by
-        and following != 0
-        and not isinstance(operand_op, ops.ShiftBase)
-    ):
-        raise com.OperationNotDefinedError(
-            'Window functions affected by following with order_by are not '
-            'implemented'
-        )
 
+def compute_window_frame(
+    data, window, scope=None, clients=None, aggcontext=None, **kwargs
+):
+    """Group and sort `data` as required by `window`.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+    window : ibis.expr.window.Window
+    scope : Mapping
+    clients : List[ibis.client.Client]
+    aggcontext : ibis.pandas.aggcontext.AggregationContext
+    kwargs : dict
+
+    Returns
+    -------
+    source : Union[pd.DataFrame, DataFrameGroupBy]
+    grouping_keys : List[Union[str, pd.Series]]
+    ordering_keys : List[str]
+    post_process : callable
+    """
     group_by = window._group_by
     grouping_keys = [
         key_op.name
@@ -115,8 +110,7 @@ def execute_window_op(
     ]
 
     order_by = window._order_by
-    if not order_by:
-        ordering_keys = ()
+    ordering_keys = ()
 
     if group_by:
         if order_by:
@@ -127,10 +121,12 @@ def execute_window_op(
             ) = util.compute_sorted_frame(
                 data, order_by, group_by=group_by, **kwargs
             )
-            source = sorted_df.groupby(grouping_keys, sort=True)
+            source = sorted_df.groupby(
+                grouping_keys, sort=True, observed=True
+            )
             post_process = _post_process_group_by_order_by
         else:
-            source = data.groupby(grouping_keys, sort=False)
+            source = data.groupby(grouping_keys, sort=False, observed=True)
             post_process = _post_process_group_by
     else:
         if order_by:
@@ -141,6 +137,71 @@ def execute_window_op(
         else:
             source = data
             post_process = _post_process_empty
+    return source, grouping_keys, ordering_keys, post_process
+
+
+@execute_node.register(ops.WindowOp, pd.Series, win.Window)
+def execute_window_op(
+    op,
+    data,
+    window,
+    scope=None,
+    aggcontext=None,
+    clients=None,
+    window_frames=None,
+    **kwargs,
+):
+    operand = op.expr
+    # pre execute "manually" here because otherwise we wouldn't pickup
+    # relevant scope changes from the child operand since we're managing
+    # execution of that by hand
+    operand_op = operand.op()
+    pre_executed_scope = pre_execute(
+        operand_op, *clients, scope=scope, aggcontext=aggcontext, **kwargs
+    )
+    scope = toolz.merge(scope, pre_executed_scope)
+    (root,) = op.root_tables()
+    root_expr = root.to_expr()
+    data = execute(
+        root_expr,
+        scope=scope,
+        clients=clients,
+        aggcontext=aggcontext,
+        window_frames=window_frames,
+        **kwargs,
+    )
+
+    following = window.following
+    order_by = window._order_by
+
+    if (
+        order_by
+        and following != 0
+        and not isinstance(operand_op, ops.ShiftBase)
+    ):
+        raise com.OperationNotDefinedError(
+            'Window functions affected by following with order_by are not '
+            'implemented'
+        )
+
+    # windows over the same data with the same grouping and ordering share
+    # the sorted frame for as long as the caller keeps `window_frames` alive
+    key = _window_key(root, window)
+    cached = None if window_frames is None else window_frames.get(key)
+    if cached is not None and cached[0] is data:
+        _, frame = cached
+    else:
+        frame = compute_window_frame(
+            data,
+            window,
+            scope=scope,
+            clients=clients,
+            aggcontext=aggcontext,
+            **kwargs,
+        )
+        if window_frames is not None:
+            window_frames[key] = data, frame
+    source, grouping_keys, ordering_keys, post_process = frame
 
     new_scope = toolz.merge(
         scope,
@@ -201,6 +262,7 @@ def execute_window_op(
         scope=new_scope,
         aggcontext=aggcontext,
         clients=clients,
+        window_frames=window_frames,
         **kwargs,
     )
     series = post_process(result, data, ordering_keys, grouping_keys)
@@ -0,0 +1,666 @@
+"""Fixed-point columns of decimal values.
+
+Columns of decimal types of at most 18 digits are computed as their values
+scaled by ``10 ** scale``, in pandas ``Int64`` Series of nullable 64-bit
+integers. Casts to such types, and the decimal columns of pandas client
+tables whose values all have at most `scale` digits after the decimal point,
+give scaled columns. Addition, subtraction, multiplication by integers,
+comparisons, negation, absolute values, rounding, casts between decimal
+types and the sum, minimum and maximum of aggregations are computed on the
+scaled integers, rounding half to even like :mod:`decimal`. Operations whose
+result could overflow 64 bits fall back to :class:`decimal.Decimal` objects.
+
+Operations that don't support scaled columns receive them as columns of
+:class:`decimal.Decimal` objects, and the results of
+:func:`ibis.pandas.core.execute_and_reset` are converted to them, with
+exactly `scale` digits after the decimal point, so that the values of an
+expression never change.
+
+See Also
+--------
+ibis.options.pandas.fixed_point_decimals
+"""
+
+from __future__ import absolute_import
+
+import decimal
+
+import numpy as np
+import pandas as pd
+from pandas.core.groupby import SeriesGroupBy
+
+import ibis
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+import ibis.pandas.aggcontext as agg_ctx
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# the largest number of digits of the values of scaled columns
+MAX_PRECISION = 18
+
+# the largest magnitude of a scaled value
+_LIMIT = np.iinfo(np.int64).max
+
+# the largest magnitude of a scaled value that is exact as a float
+_FLOAT_LIMIT = 2 ** 53
+
+try:
+    _INT64 = pd.Int64Dtype()
+except AttributeError:
+    # pandas < 0.24 has no nullable integers
+    _INT64 = None
+
+
+def enabled():
+    """Return whether decimal columns are computed as scaled integers."""
+    return _INT64 is not None and ibis.options.pandas.fixed_point_decimals
+
+
+def is_decimal(dtype):
+    """Return whether `dtype` is a decimal type whose values fit in scaled
+    64-bit integers.
+    """
+    return isinstance(dtype, dt.Decimal) and dtype.precision <= MAX_PRECISION
+
+
+def _is_scaled_series(value):
+    return (
+        _INT64 is not None
+        and isinstance(value, pd.Series)
+        and value.dtype == _INT64
+    )
+
+
+def _is_integer_series(data):
+    return data.dtype.kind in 'iu' or data.dtype == _INT64
+
+
+def is_scaled(expr, value):
+    """Return whether `value` is the scaled integers of the decimal
+    expression `expr`.
+    """
+    if isinstance(value, SeriesGroupBy):
+        value = value.obj
+    return (
+        _is_scaled_series(value)
+        and isinstance(expr.type(), dt.Decimal)
+        and enabled()
+    )
+
+
+def _parts(data):
+    """Return the values of the integer Series `data` as int64, with 0 for
+    NULL, and its NULL mask, or None if it has no NULLs.
+    """
+    if data.dtype != _INT64:
+        return data.values.astype(np.int64, copy=False), None
+    mask = data.isna().values
+    values = data.to_numpy(dtype=np.int64, na_value=0)
+    return values, mask if mask.any() else None
+
+
+def _magnitude(values):
+    if not len(values):
+        return 0
+    return max(abs(int(values.min())), abs(int(values.max())))
+
+
+def _scaled_series(values, mask, index, name):
+    if mask is None:
+        mask = np.zeros(len(values), dtype=np.bool_)
+    return pd.Series(
+        pd.arrays.IntegerArray(values, mask), index=index, name=name
+    )
+
+
+def _map_series(func, value):
+    """Apply `func` to the Series `value`, or to the Series of the
+    SeriesGroupBy `value` and group its result the same way.
+    """
+    if isinstance(value, SeriesGroupBy):
+        result = func(value.obj)
+        return None if result is None else result.groupby(
+            value.grouper.groupings
+        )
+    return func(value)
+
+
+# conversions
+
+
+def _scale_decimal(value, scale):
+    """Scale the :class:`decimal.Decimal` `value`, or return None if it has
+    more than `scale` digits after the decimal point or doesn't fit.
+    """
+    if not value.is_finite():
+        return None
+    scaled = value.scaleb(scale, context=decimal.Context(prec=60))
+    if scaled != scaled.to_integral_value():
+        return None
+    scaled = int(scaled)
+    return scaled if abs(scaled) <= _LIMIT else None
+
+
+def from_decimals(data, scale):
+    """Convert the Series of :class:`decimal.Decimal` objects `data` to
+    scaled integers.
+
+    Returns
+    -------
+    Optional[pd.Series]
+        None if a value of `data` is neither NULL nor a finite number with at
+        most `scale` digits after the decimal point and 18 digits in all
+    """
+    if not len(data.index):
+        return _scaled_series(
+            np.empty(0, dtype=np.int64), None, data.index, data.name
+        )
+    if pa is not None:
+        try:
+            array = pa.array(
+                data.values,
+                type=pa.decimal128(MAX_PRECISION, scale),
+                from_pandas=True,
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+            return None
+        # decimal128 values are 16 byte two's complement integers, whose low
+        # 8 bytes are the whole value when it has at most 18 digits
+        values = np.frombuffer(
+            array.buffers()[1], dtype=np.int64, count=2 * len(array)
+        )[::2].copy()
+        mask = array.is_null().to_numpy(zero_copy_only=False)
+        return _scaled_series(
+            values, mask if mask.any() else None, data.index, data.name
+        )
+
+    values = np.zeros(len(data.index), dtype=np.int64)
+    mask = pd.isnull(data.values)
+    for i, value in enumerate(data.values):
+        if mask[i]:
+            continue
+        if not isinstance(value, (decimal.Decimal, int)):
+            return None
+        scaled = _scale_decimal(decimal.Decimal(value), scale)
+        if scaled is None or abs(scaled) >= 10 ** MAX_PRECISION:
+            return None
+        values[i] = scaled
+    return _scaled_series(
+        values, mask if mask.any() else None, data.index, data.name
+    )
+
+
+def from_integers(data, scale, precision=None):
+    """Scale the integer Series `data`.
+
+    Returns
+    -------
+    Optional[pd.Series]
+        None if a value of `data` has more than ``precision - scale`` digits,
+        or doesn't fit in a scaled 64-bit integer if `precision` is None
+    """
+    if data.dtype.kind == 'u' and len(data.index) and data.max() > _LIMIT:
+        return None
+    values, mask = _parts(data)
+    bound = _LIMIT // 10 ** scale
+    if precision is not None:
+        bound = min(bound, 10 ** (precision - scale) - 1)
+    if _magnitude(values if mask is None else values[~mask]) > bound:
+        return None
+    return _scaled_series(values * 10 ** scale, mask, data.index, data.name)
+
+
+def decode(data, scale):
+    """Convert the scaled integers `data` to :class:`decimal.Decimal`
+    objects with `scale` digits after the decimal point.
+    """
+    values, mask = _parts(data)
+    if pa is not None:
+        # a decimal128 array of the scaled values, sign extended to 16 bytes
+        words = np.empty((len(values), 2), dtype=np.int64)
+        words[:, 0] = values
+        words[:, 1] = values >> 63
+        validity = (
+            None
+            if mask is None
+            else pa.array(~mask, type=pa.bool_()).buffers()[1]
+        )
+        array = pa.Array.from_buffers(
+            pa.decimal128(MAX_PRECISION + 1, scale),
+            len(values),
+            [validity, pa.py_buffer(words)],
+        )
+        result = array.to_pandas().values
+    else:
+        result = np.array(
+            [decimal.Decimal(int(value)).scaleb(-scale) for value in values],
+            dtype=np.object_,
+        )
+        if mask is not None:
+            result[mask] = None
+    return pd.Series(result, index=data.index, name=data.name)
+
+
+def to_decimal(value, scale):
+    """Convert the scaled integer `value`, the result of a reduction, to a
+    :class:`decimal.Decimal`, or None if it is NULL.
+    """
+    if value is pd.NA or value is None:
+        return None
+    return decimal.Decimal(int(value)).scaleb(-scale)
+
+
+# kernels
+
+
+def _round_half_even(values, factor):
+    """Divide the int64 array `values` by `factor`, rounding half to even."""
+    quotient, remainder = np.divmod(values, factor)
+    twice = 2 * remainder
+    return quotient + (
+        (twice > factor) | ((twice == factor) & (quotient % 2 == 1))
+    )
+
+
+def rescale(data, scale, to_scale, precision=None):
+    """Rescale the scaled integers `data` from `scale` to `to_scale` digits
+    after the decimal point.
+
+    Returns
+    -------
+    Optional[pd.Series]
+        None if a value has more than `precision` digits after it is
+        rescaled, or doesn't fit in a 64-bit integer
+    """
+    values, mask = _parts(data)
+    magnitude = _magnitude(values)
+    if to_scale >= scale:
+        factor = 10 ** (to_scale - scale)
+        if magnitude * factor > _LIMIT:
+            return None
+        values = values * factor
+        magnitude *= factor
+    elif scale - to_scale <= MAX_PRECISION:
+        values = _round_half_even(values, 10 ** (scale - to_scale))
+        magnitude = _magnitude(values)
+    else:
+        return None
+    if precision is not None and magnitude >= 10 ** precision:
+        return None
+    return _scaled_series(values, mask, data.index, data.name)
+
+
+def cast(data, from_type, to_type):
+    """Cast `data`, the values of an expression of type `from_type`, to the
+    decimal type `to_type`.
+
+    Returns
+    -------
+    Optional[pd.Series]
+        The scaled integers of the result, or None if it is computed from
+        :class:`decimal.Decimal` objects
+    """
+    if not (enabled() and is_decimal(to_type)):
+        return None
+    precision = to_type.precision
+    scale = to_type.scale
+    if _is_scaled_series(data) and isinstance(from_type, dt.Decimal):
+        return rescale(data, from_type.scale, scale, precision=precision)
+    if isinstance(from_type, dt.Integer) and _is_integer_series(data):
+        return from_integers(data, scale, precision=precision)
+    if isinstance(from_type, dt.Decimal) and data.dtype == np.object_:
+        # values with more digits are rounded twice by the per value cast
+        result = from_decimals(data, scale)
+        if result is not None and _magnitude(_parts(result)[0]) < (
+            10 ** precision
+        ):
+            return result
+    return None
+
+
+def round_half_even(data, scale, places):
+    """Round the scaled integers `data` to `places` digits after the decimal
+    point.
+
+    Returns
+    -------
+    Optional[pd.Series]
+        Scaled integers if `places` is not None, otherwise the rounded
+        values as integers, or as floats if `data` has NULLs. None if the
+        result doesn't fit in a 64-bit integer.
+    """
+    if places is None:
+        rounded = rescale(data, scale, 0)
+        if rounded is None:
+            return None
+        values, mask = _parts(rounded)
+        if mask is None:
+            return pd.Series(values, index=data.index, name=data.name)
+        if _magnitude(values) > _FLOAT_LIMIT:
+            return None
+        return pd.Series(
+            np.where(mask, np.nan, values), index=data.index, name=data.name
+        )
+    places = int(places)
+    if places >= scale:
+        return data
+    rounded = rescale(data, scale, places)
+    return None if rounded is None else rescale(rounded, places, scale)
+
+
+def can_reduce(how, data):
+    """Return whether the grouped reduction `how` of the scaled integers
+    `data` computes scaled integers that fit in 64 bits.
+    """
+    if how in {'count', 'nunique', 'min', 'max'}:
+        return True
+    if how == 'sum':
+        values, _ = _parts(data)
+        return _magnitude(values) * max(len(values), 1) <= _LIMIT
+    return False
+
+
+# argument preparation
+
+
+def _integer(expr, value, scale):
+    """Scale the integer argument `value`, returning its scaled value and
+    the largest magnitude of its values, or None.
+    """
+    if not isinstance(expr.type(), dt.Integer):
+        return None
+    if isinstance(value, (pd.Series, SeriesGroupBy)):
+        if not _is_integer_series(getattr(value, 'obj', value)):
+            return None
+        result = _map_series(lambda data: from_integers(data, scale), value)
+        if result is None:
+            return None
+        series = getattr(result, 'obj', result)
+        return result, _magnitude(_parts(series)[0])
+    if isinstance(value, (int, np.integer)) and not isinstance(
+        value, (bool, np.bool_)
+    ):
+        scaled = int(value) * 10 ** scale
+        return (scaled, abs(scaled)) if abs(scaled) <= _LIMIT else None
+    return None
+
+
+def _decimal(expr, value, scale):
+    """Rescale the decimal argument `value` to `scale`, returning its scaled
+    value and the largest magnitude of its values, or None.
+    """
+    if isinstance(value, (int, np.integer)) and not isinstance(
+        value, (bool, np.bool_)
+    ):
+        # the values of decimal literals can be integers
+        value = decimal.Decimal(int(value))
+    if isinstance(value, decimal.Decimal):
+        scaled = _scale_decimal(value, scale)
+        return None if scaled is None else (scaled, abs(scaled))
+    if not is_scaled(expr, value):
+        return None
+    from_scale = expr.type().scale
+    if from_scale != scale:
+        value = _map_series(
+            lambda data: rescale(data, from_scale, scale), value
+        )
+        if value is None or scale < from_scale:
+            # rounding would change the result
+            return None
+    series = getattr(value, 'obj', value)
+    return value, _magnitude(_parts(series)[0])
+
+
+def _operand(expr, value, scale):
+    if isinstance(expr.type(), dt.Decimal):
+        return _decimal(expr, value, scale)
+    return _integer(expr, value, scale)
+
+
+def _prepare_add(op, exprs, values, aggcontext):
+    scale = op.to_expr().type().scale
+    operands = [_operand(*pair, scale) for pair in zip(exprs, values)]
+    if None in operands or sum(bound for _, bound in operands) > _LIMIT:
+        return None
+    return tuple(value for value, _ in operands)
+
+
+def _prepare_multiply(op, exprs, values, aggcontext):
+    scaled = [is_scaled(expr, value) for expr, value in zip(exprs, values)]
+    if sum(scaled) != 1:
+        return None
+    bounds = []
+    for expr, value, is_decimal_operand in zip(exprs, values, scaled):
+        operand = (
+            _decimal(expr, value, expr.type().scale)
+            if is_decimal_operand
+            else _integer(expr, value, 0)
+        )
+        if operand is None:
+            return None
+        bounds.append(operand[1])
+    left_bound, right_bound = bounds
+    return values if left_bound * right_bound <= _LIMIT else None
+
+
+def _comparable(value):
+    """Convert the scaled Series `value` to int64, or to float64 with NaN for
+    NULL values.
+    """
+    if not isinstance(value, pd.Series):
+        return value
+    values, mask = _parts(value)
+    if mask is None:
+        return pd.Series(values, index=value.index, name=value.name)
+    if _magnitude(values) > _FLOAT_LIMIT:
+        return None
+    return pd.Series(
+        np.where(mask, np.nan, values), index=value.index, name=value.name
+    )
+
+
+def _prepare_comparison(op, exprs, values, aggcontext):
+    scale = max(
+        expr.type().scale
+        for expr in exprs
+        if isinstance(expr.type(), dt.Decimal)
+    )
+    prepared = []
+    for expr, value in zip(exprs, values):
+        operand = _operand(expr, value, scale)
+        if operand is None:
+            return None
+        value = _map_series(_comparable, operand[0])
+        if value is None:
+            return None
+        prepared.append(value)
+    return tuple(prepared)
+
+
+def _prepare_reduction(op, exprs, values, aggcontext):
+    data, mask = values
+    if not isinstance(aggcontext, agg_ctx.Summarize) or mask is not None:
+        return None
+    how = type(op).__name__.lower()
+    return values if can_reduce(how, getattr(data, 'obj', data)) else None
+
+
+def _prepare_round(op, exprs, values, aggcontext):
+    data, places = values
+    if isinstance(places, (pd.Series, SeriesGroupBy)):
+        return None
+    return values
+
+
+def _prepare_cast(op, exprs, values, aggcontext):
+    return values if is_decimal(op.to) else None
+
+
+def _unchanged(op, exprs, values, aggcontext):
+    return values
+
+
+_PREPARE = {
+    ops.TableColumn: _unchanged,
+    ops.IsNull: _unchanged,
+    ops.NotNull: _unchanged,
+    ops.Count: _unchanged,
+    ops.CountDistinct: _unchanged,
+    ops.HLLCardinality: _unchanged,
+    ops.Negate: _unchanged,
+    ops.Abs: _unchanged,
+    ops.Add: _prepare_add,
+    ops.Subtract: _prepare_add,
+    ops.Multiply: _prepare_multiply,
+    ops.Equals: _prepare_comparison,
+    ops.NotEquals: _prepare_comparison,
+    ops.Less: _prepare_comparison,
+    ops.LessEqual: _prepare_comparison,
+    ops.Greater: _prepare_comparison,
+    ops.GreaterEqual: _prepare_comparison,
+    ops.Between: _prepare_comparison,
+    ops.Sum: _prepare_reduction,
+    ops.Min: _prepare_reduction,
+    ops.Max: _prepare_reduction,
+    ops.Round: _prepare_round,
+    ops.Cast: _prepare_cast,
+}
+
+
+def _has_scaled(value):
+    if isinstance(value, SeriesGroupBy):
+        return _is_scaled_series(value.obj)
+    if isinstance(value, list):
+        # the values of a ValueList
+        return any(map(_has_scaled, value))
+    return _is_scaled_series(value)
+
+
+def _decode_argument(expr, value):
+    if isinstance(value, list) and isinstance(expr, ir.ListExpr):
+        return list(map(_decode_argument, expr.op().values, value))
+    if isinstance(expr, ir.Expr) and is_scaled(expr, value):
+        scale = expr.type().scale
+        return _map_series(lambda data: decode(data, scale), value)
+    return value
+
+
+def decode_arguments(op, exprs, values, aggcontext=None):
+    """Prepare the scaled decimal columns among the computed arguments
+    `values` of `op`, rescaling them for the operations computed from scaled
+    integers and converting them to :class:`decimal.Decimal` objects for the
+    others.
+
+    Parameters
+    ----------
+    op : ibis.expr.operations.Node
+    exprs : Sequence[object]
+        The arguments of `op` that were computed
+    values : Tuple[object, ...]
+        The computed value of every argument in `exprs`
+    aggcontext : Optional[ibis.pandas.aggcontext.AggregationContext]
+
+    Returns
+    -------
+    Tuple[object, ...]
+    """
+    if not any(map(_has_scaled, values)) or not enabled():
+        return values
+    prepare = _PREPARE.get(type(op))
+    if prepare is not None:
+        prepared = prepare(op, exprs, values, aggcontext)
+        if prepared is not None:
+            return prepared
+    return tuple(map(_decode_argument, exprs, values))
+
+
+# tables and results
+
+
+def encode_frame(df, schema):
+    """Scale the decimal columns of `df` whose values fit in the scaled
+    integers of their type in `schema`.
+
+    Returns
+    -------
+    pd.DataFrame
+        `df` itself if no column is scaled, otherwise a shallow copy of it
+        that shares its index and other columns
+    """
+    if not enabled():
+        return df
+    scaled = {}
+    for name, dtype in schema.items():
+        if name not in df.columns or not is_decimal(dtype):
+            continue
+        column = df[name]
+        if column.dtype == np.object_:
+            result = from_decimals(column, dtype.scale)
+        elif _is_integer_series(column):
+            # integers are decimals without digits after the decimal point
+            result = from_integers(column, dtype.scale)
+            if result is None and column.dtype == _INT64:
+                # nullable integers would be taken for scaled ones
+                result = column.astype(np.object_)
+        else:
+            result = None
+        if result is not None:
+            scaled[name] = result
+
+    if not scaled:
+        return df
+    result = df.copy(deep=False)
+    for name, column in scaled.items():
+        result[name] = column
+    return result
+
+
+def _decode_frame(df, schema):
+    scaled = [
+        (name, dtype.scale)
+        for name, dtype in schema.items()
+        if isinstance(dtype, dt.Decimal)
+        and name in df.columns
+        and _is_scaled_series(df[name])
+    ]
+    if not scaled:
+        return df
+    df = df.copy(deep=False)
+    for name, scale in scaled:
+        df[name] = decode(df[name], scale)
+    return df
+
+
+def decode_frames(frames, schema):
+    """Decode the scaled decimal columns of the DataFrames `frames`, which
+    have the same `schema`, unless a column is scaled in all of them.
+    """
+    if not enabled():
+        return frames
+    mixed = {
+        name: dtype
+        for name, dtype in schema.items()
+        if isinstance(dtype, dt.Decimal)
+        and len({_is_scaled_series(frame[name]) for frame in frames}) > 1
+    }
+    if not mixed:
+        return frames
+    return [_decode_frame(frame, mixed) for frame in frames]
+
+
+def decode_result(expr, result):
+    """Convert the scaled decimal columns of the `result` of `expr` to
+    :class:`decimal.Decimal` objects.
+    """
+    if not enabled():
+        return result
+    if isinstance(result, pd.DataFrame):
+        return _decode_frame(result, expr.schema())
+    if isinstance(expr, ir.DecimalColumn) and is_scaled(expr, result):
+        return decode(result, expr.type().scale)
+    return result
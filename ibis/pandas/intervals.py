@@ -0,0 +1,203 @@
+"""Month counts for columns of calendar intervals.
+
+Intervals of years, quarters and months don't have a fixed length, so they
+can't be stored as ``timedelta64`` values like the intervals of other units.
+Columns of such intervals are computed as numbers of months, and timestamps
+and dates are moved by them with ``datetime64[M]`` arithmetic, keeping their
+day of the month except past the end of a month, where they are moved to its
+last day, as with :class:`pandas.DateOffset`.
+
+Operations that don't support month counts receive them as columns of
+:class:`pandas.DateOffset` objects, and the results of
+:func:`ibis.pandas.core.execute_and_reset` are converted to them, so month
+counts never change the result of an expression.
+"""
+
+from __future__ import absolute_import
+
+import numpy as np
+import pandas as pd
+
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+
+# the number of months of every calendar interval unit
+CALENDAR_UNITS = {'Y': 12, 'Q': 3, 'M': 1}
+
+# operations that compute the same result from month counts
+_MONTHS_OPS = frozenset(
+    {
+        ops.TimestampAdd,
+        ops.TimestampSub,
+        ops.DateAdd,
+        ops.DateSub,
+        ops.IntervalAdd,
+        ops.IntervalSubtract,
+        ops.IntervalMultiply,
+        ops.IntervalFloorDivide,
+    }
+)
+
+
+def is_calendar(dtype):
+    """Return whether `dtype` is an interval type of a calendar unit."""
+    return isinstance(dtype, dt.Interval) and dtype.unit in CALENDAR_UNITS
+
+
+def is_months(expr, value):
+    """Return whether `value` is the month counts of the calendar interval
+    expression `expr`.
+    """
+    return (
+        isinstance(value, pd.Series)
+        and value.dtype != np.object_
+        and is_calendar(expr.type())
+    )
+
+
+def from_integers(data, unit):
+    """Compute the month counts of the intervals of `data` `unit`s."""
+    return data * CALENDAR_UNITS[unit]
+
+
+def from_integer(value, unit):
+    """Return the :class:`pandas.DateOffset` of an interval of `value`
+    `unit`s.
+    """
+    return offset(value * CALENDAR_UNITS[unit], unit)
+
+
+def offset(months, unit):
+    """Return the :class:`pandas.DateOffset` of an interval of `months`
+    months, in years if `unit` is ``'Y'`` and they are whole years.
+    """
+    if unit == 'Y' and not months % 12:
+        return pd.DateOffset(years=int(months // 12))
+    return pd.DateOffset(months=int(months))
+
+
+def to_offsets(months, unit):
+    """Convert the month counts `months` to a Series of
+    :class:`pandas.DateOffset` objects, building one for every distinct
+    count.
+    """
+    codes, uniques = pd.factorize(months)
+    offsets = np.empty(len(uniques) + 1, dtype=np.object_)
+    offsets[:-1] = [offset(count, unit) for count in uniques]
+    # NULL counts have code -1
+    offsets[-1] = np.nan
+    return pd.Series(offsets[codes], index=months.index, name=months.name)
+
+
+def add_months(timestamps, months):
+    """Move every timestamp of `timestamps` by the number of months in
+    `months`.
+
+    Parameters
+    ----------
+    timestamps : Union[pd.Series, pd.Timestamp, datetime.date]
+        A Series of timestamps or dates, or a single one
+    months : pd.Series
+        Month counts, which may be NULL
+
+    Returns
+    -------
+    pd.Series
+        Timezone aware timestamps are moved in their local time
+    """
+    if not isinstance(timestamps, pd.Series):
+        timestamps = pd.Series(
+            pd.Timestamp(timestamps), index=months.index, name=months.name
+        )
+    elif not timestamps.index.equals(months.index):
+        timestamps, months = timestamps.align(months)
+    if timestamps.dtype == np.object_:
+        timestamps = pd.to_datetime(timestamps)
+    name = timestamps.name if timestamps.name == months.name else None
+
+    tz = timestamps.dt.tz
+    if tz is not None:
+        timestamps = timestamps.dt.tz_localize(None)
+    values = timestamps.values
+
+    counts = months.values
+    null = pd.isnull(counts)
+    counts = np.where(null, 0, counts).astype(np.int64)
+
+    month_starts = values.astype('datetime64[M]')
+    day_starts = values.astype('datetime64[D]')
+    day = day_starts - month_starts.astype('datetime64[D]')
+    time = values - day_starts
+
+    targets = month_starts + counts.astype('timedelta64[M]')
+    target_starts = targets.astype('datetime64[D]')
+    lengths = (targets + np.timedelta64(1, 'M')).astype(
+        'datetime64[D]'
+    ) - target_starts
+    result = (
+        target_starts + np.minimum(day, lengths - np.timedelta64(1, 'D'))
+    ).astype(values.dtype) + time
+    result[null] = np.datetime64('NaT')
+
+    result = pd.Series(result, index=timestamps.index, name=name)
+    if tz is not None:
+        result = result.dt.tz_localize(tz)
+    return result
+
+
+def _decode_argument(expr, value):
+    if isinstance(value, list) and isinstance(expr, ir.ListExpr):
+        return list(map(_decode_argument, expr.op().values, value))
+    if isinstance(expr, ir.IntervalValue) and is_months(expr, value):
+        return to_offsets(value, expr.type().unit)
+    return value
+
+
+def decode_arguments(op, exprs, values):
+    """Convert the month counts among the computed arguments `values` of
+    `op` to :class:`pandas.DateOffset` objects if it does not support them.
+
+    Parameters
+    ----------
+    op : ibis.expr.operations.Node
+    exprs : Sequence[object]
+        The arguments of `op` that were computed
+    values : Tuple[object, ...]
+        The computed value of every argument in `exprs`
+
+    Returns
+    -------
+    Tuple[object, ...]
+    """
+    if type(op) in _MONTHS_OPS:
+        if not isinstance(op, (ops.IntervalAdd, ops.IntervalSubtract)):
+            return values
+        # the sum of a calendar and another interval is computed from
+        # DateOffsets
+        if all(map(is_calendar, (op.left.type(), op.right.type()))):
+            return values
+    if not any(isinstance(value, (pd.Series, list)) for value in values):
+        return values
+    return tuple(map(_decode_argument, exprs, values))
+
+
+def decode_result(expr, result):
+    """Convert the month counts of the `result` of `expr` to
+    :class:`pandas.DateOffset` objects.
+    """
+    if isinstance(result, pd.DataFrame):
+        months = [
+            (name, dtype.unit)
+            for name, dtype in expr.schema().items()
+            if is_calendar(dtype) and result[name].dtype != np.object_
+        ]
+        if not months:
+            return result
+        result = result.copy(deep=False)
+        for name, unit in months:
+            result[name] = to_offsets(result[name], unit)
+        return result
+    if isinstance(expr, ir.IntervalColumn) and is_months(expr, result):
+        return to_offsets(result, expr.type().unit)
+    return result
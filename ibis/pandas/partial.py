@@ -0,0 +1,351 @@
+"""Reductions computed from the mergeable partial states of parts of their
+input.
+
+A reduction that supports it is split into four steps:
+
+* update: :attr:`PartialReduction.partials` are reductions, executed like any
+  other, that compute the state of a part of the rows of every group. The
+  state of no rows, their result over an empty part, is the initial state.
+* merge: :meth:`PartialReduction.merge` combines the states of the parts of
+  every group, in any order and grouping.
+* finalize: :meth:`PartialReduction.finalize` computes the value of the
+  reduction from the merged state of every group.
+
+This lets reductions be computed over batches of rows, or over partitions of
+the rows in parallel.
+"""
+
+from __future__ import absolute_import
+
+import functools
+
+import numpy as np
+import pandas as pd
+import toolz
+from multipledispatch import Dispatcher
+from pandas.core.groupby import SeriesGroupBy
+
+import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
+import ibis.expr.rules as rlz
+import ibis.util
+from ibis.expr.signature import Argument as Arg
+from ibis.pandas.dispatch import execute_node
+
+
+class PartialReduction:
+    """How to compute a reduction from the states of parts of its input.
+
+    Attributes
+    ----------
+    partials : List[ir.ScalarExpr]
+        The named reductions that compute the state of a part of the rows of
+        every group.
+    """
+
+    __slots__ = ('partials',)
+
+    def __init__(self, *partials):
+        self.partials = [
+            partial.name('partial_{}'.format(ibis.util.guid()))
+            for partial in partials
+        ]
+
+    @property
+    def names(self):
+        return [partial.get_name() for partial in self.partials]
+
+    def merge(self, states, grouped):
+        """Merge the states of each group.
+
+        Parameters
+        ----------
+        states : pd.DataFrame
+            The states of every part, indexed by group
+        grouped : Callable[[pd.Series], pd.core.groupby.SeriesGroupBy]
+            Group a column of `states` by the groups of its index
+
+        Returns
+        -------
+        Dict[str, pd.Series]
+            The merged state of every group
+        """
+        raise NotImplementedError
+
+    def finalize(self, states):
+        """Compute the value of the reduction of every group from its merged
+        state in `states`.
+        """
+        raise NotImplementedError
+
+
+class CombinedReduction(PartialReduction):
+    """A reduction whose results over parts of its input are combined by
+    another reduction, for instance the sum of sums.
+    """
+
+    __slots__ = ('how',)
+
+    def __init__(self, reduction, how):
+        super().__init__(reduction)
+        self.how = how
+
+    def merge(self, states, grouped):
+        (name,) = self.names
+        return {name: grouped(states[name]).agg(self.how)}
+
+    def finalize(self, states):
+        (name,) = self.names
+        return states[name]
+
+
+class MeanReduction(PartialReduction):
+    """The mean, from the sum and count of the values of every part."""
+
+    __slots__ = ()
+
+    def __init__(self, op):
+        super().__init__(
+            ops.Sum(op.arg, op.where).to_expr(),
+            ops.Count(op.arg, op.where).to_expr(),
+        )
+
+    def merge(self, states, grouped):
+        return {name: grouped(states[name]).sum() for name in self.names}
+
+    def finalize(self, states):
+        total, count = self.names
+        return states[total] / states[count].where(states[count] > 0)
+
+
+class VarianceReduction(PartialReduction):
+    """The variance or standard deviation, from the count, mean and
+    population variance of the values of every part.
+
+    States are merged with the pairwise update of Chan, Golub and LeVeque,
+    which generalizes Welford's algorithm and is numerically stable.
+    """
+
+    __slots__ = ('ddof', 'sqrt')
+
+    def __init__(self, op):
+        super().__init__(
+            ops.Count(op.arg, op.where).to_expr(),
+            ops.Mean(op.arg, op.where).to_expr(),
+            ops.Variance(op.arg, 'pop', op.where).to_expr(),
+        )
+        self.ddof = 0 if op.how == 'pop' else 1
+        self.sqrt = isinstance(op, ops.StandardDev)
+
+    def merge(self, states, grouped):
+        count_name, mean_name, var_name = self.names
+        count = states[count_name]
+        nonempty = count > 0
+        mean = states[mean_name].where(nonempty, 0.0)
+
+        total = grouped(count).sum()
+        new_mean = grouped(count * mean).sum() / total.where(total > 0)
+        delta = mean - new_mean.reindex(states.index).values
+        squares = states[var_name] * count + count * delta ** 2
+        new_var = grouped(squares.where(nonempty, 0.0)).sum() / total.where(
+            total > 0
+        )
+        return {count_name: total, mean_name: new_mean, var_name: new_var}
+
+    def finalize(self, states):
+        count_name, _, var_name = self.names
+        count = states[count_name]
+        dof = (count - self.ddof).where(count > self.ddof)
+        result = states[var_name] * count / dof
+        return np.sqrt(result) if self.sqrt else result
+
+
+class DistinctValues(ops.Reduction):
+    """The set of distinct non-null values of a column.
+
+    This is the state of a distinct count computed from parts of its input.
+    """
+
+    arg = Arg(rlz.column(rlz.any))
+    where = Arg(rlz.boolean, default=None)
+
+    def output_type(self):
+        return dt.Array(self.arg.type()).scalar_type()
+
+
+def _distinct_values(values):
+    return frozenset(values.dropna().unique())
+
+
+def _union(sets):
+    return frozenset().union(*sets)
+
+
+@execute_node.register(DistinctValues, pd.Series, (pd.Series, type(None)))
+def execute_distinct_values_series_mask(
+    op, data, mask, aggcontext=None, **kwargs
+):
+    operand = data[mask] if mask is not None else data
+    return aggcontext.agg(operand, _distinct_values)
+
+
+@execute_node.register(DistinctValues, SeriesGroupBy, type(None))
+def execute_distinct_values_series_groupby(
+    op, data, _, aggcontext=None, **kwargs
+):
+    return aggcontext.agg(data, _distinct_values)
+
+
+@execute_node.register(DistinctValues, SeriesGroupBy, SeriesGroupBy)
+def execute_distinct_values_series_groupby_mask(
+    op, data, mask, aggcontext=None, **kwargs
+):
+    mask = mask.obj
+    return aggcontext.agg(
+        data, lambda values: _distinct_values(values[mask[values.index]])
+    )
+
+
+class DistinctCountReduction(PartialReduction):
+    """The exact number of distinct values, from the set of distinct values of
+    every part.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, op):
+        super().__init__(DistinctValues(op.arg, op.where).to_expr())
+
+    def merge(self, states, grouped):
+        (name,) = self.names
+        return {name: grouped(states[name]).agg(_union)}
+
+    def finalize(self, states):
+        (name,) = self.names
+        return states[name].map(len).astype(np.int64)
+
+
+class MergeableReduction(PartialReduction):
+    """A user-defined reduction whose states are merged and finalized by
+    user-defined functions.
+
+    See Also
+    --------
+    ibis.pandas.udf.udf.reduction
+    """
+
+    __slots__ = ('combine', 'finish')
+
+    def __init__(self, partial, combine, finish):
+        super().__init__(partial)
+        self.combine = combine
+        self.finish = finish
+
+    def merge(self, states, grouped):
+        (name,) = self.names
+        return {
+            name: grouped(states[name]).agg(
+                functools.partial(functools.reduce, self.combine)
+            )
+        }
+
+    def finalize(self, states):
+        (name,) = self.names
+        return states[name].map(self.finish)
+
+
+partial_reduction = Dispatcher(
+    'partial_reduction',
+    doc="""\
+Return the :class:`~ibis.pandas.partial.PartialReduction` that computes a
+reduction from the states of parts of its input, or None if it cannot be
+computed that way.
+
+Parameters
+----------
+op : ibis.expr.operations.Node
+
+Returns
+-------
+Optional[ibis.pandas.partial.PartialReduction]
+""",
+)
+
+
+@partial_reduction.register(ops.Node)
+def partial_reduction_node(op):
+    return None
+
+
+@partial_reduction.register((ops.Sum, ops.Count))
+def partial_reduction_sum(op):
+    return CombinedReduction(op.to_expr(), 'sum')
+
+
+@partial_reduction.register(ops.Min)
+def partial_reduction_min(op):
+    return CombinedReduction(op.to_expr(), 'min')
+
+
+@partial_reduction.register(ops.Max)
+def partial_reduction_max(op):
+    return CombinedReduction(op.to_expr(), 'max')
+
+
+@partial_reduction.register((ops.Any, ops.NotAll))
+def partial_reduction_any(op):
+    return CombinedReduction(op.to_expr(), 'any')
+
+
+@partial_reduction.register((ops.All, ops.NotAny))
+def partial_reduction_all(op):
+    return CombinedReduction(op.to_expr(), 'all')
+
+
+@partial_reduction.register(ops.Mean)
+def partial_reduction_mean(op):
+    return MeanReduction(op)
+
+
+@partial_reduction.register(ops.VarianceBase)
+def partial_reduction_variance(op):
+    return VarianceReduction(op)
+
+
+@partial_reduction.register((ops.CountDistinct, ops.HLLCardinality))
+def partial_reduction_count_distinct(op):
+    # the pandas backend computes approximate distinct counts exactly
+    return DistinctCountReduction(op)
+
+
+def merge_states(states, nkeys, partials):
+    """Merge the `states` of every group.
+
+    Parameters
+    ----------
+    states : pd.DataFrame
+        The states of parts of the input of every reduction, in the columns
+        named by the :class:`PartialReduction` objects in `partials`
+    nkeys : int
+        The number of levels of the index of `states` that are group keys.
+        If zero, every row of `states` belongs to the same group.
+    partials : Iterable[PartialReduction]
+
+    Returns
+    -------
+    pd.DataFrame
+        One merged state per group, indexed by group keys, or by zero if there
+        are none
+    """
+    if nkeys:
+        level = list(range(nkeys))
+    else:
+        states.index = np.zeros(len(states.index), dtype=np.int64)
+        level = 0
+
+    def grouped(column):
+        return column.groupby(level=level, observed=True)
+
+    return pd.DataFrame(
+        toolz.merge(*(partial.merge(states, grouped) for partial in partials))
+    )
@@ -0,0 +1,129 @@
+"""Hash partitioning of rows and execution of partitions in worker processes.
+
+Worker processes are forked, so they share the memory of the calling process
+copy-on-write and partitions are never serialized on their way to a worker.
+Only the result of every partition is sent back to the calling process.
+
+Forking a process while other threads run can leave locks that those threads
+held locked forever in the child. Partitions of executions that have an
+:class:`~ibis.pandas.threads.ExecutionPool` are computed by its threads
+instead.
+"""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import itertools
+import multiprocessing
+import threading
+
+import numpy as np
+import pandas as pd
+
+from ibis.pandas.threads import current_pool, parallel_map
+
+# functions to run in forked workers, which inherit this mapping
+_tasks = {}
+_task_ids = itertools.count()
+_tasks_lock = threading.Lock()
+
+_in_worker = False
+
+
+def _mark_worker():
+    global _in_worker
+    _in_worker = True
+
+
+def _run_task(task_id, partition):
+    return _tasks[task_id](partition)
+
+
+def in_worker_process():
+    """Return whether we're running inside a worker process.
+
+    Operations executed by a worker are not partitioned again.
+    """
+    return _in_worker
+
+
+def fork_context():
+    """Return the fork multiprocessing context, or None if the platform does
+    not support it.
+    """
+    try:
+        return multiprocessing.get_context('fork')
+    except ValueError:
+        return None
+
+
+def hash_partitions(keys, npartitions):
+    """Split the rows of `keys` into `npartitions` partitions such that rows
+    with equal keys are in the same partition.
+
+    Parameters
+    ----------
+    keys : List[pd.Series]
+        The keys of every row
+    npartitions : int
+
+    Returns
+    -------
+    List[np.ndarray]
+        The positions of the rows of every partition, in increasing order
+    """
+    hashes = pd.util.hash_pandas_object(
+        pd.concat(keys, axis=1, ignore_index=True), index=False
+    ).values
+    codes = (hashes % np.uint64(npartitions)).astype(np.intp)
+    order = np.argsort(codes, kind='mergesort')
+    offsets = np.searchsorted(codes[order], np.arange(npartitions + 1))
+    return [
+        order[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])
+    ]
+
+
+def map_partitions(func, npartitions, num_processes):
+    """Compute ``func(i)`` for every partition ``i`` in worker processes.
+
+    `func` is not serialized: workers are forked after it is registered, so
+    it can close over any object, such as the data to partition.
+
+    If the calling execution has an
+    :class:`~ibis.pandas.threads.ExecutionPool`, partitions are computed by
+    its threads instead, and if the platform cannot fork, by the calling
+    thread.
+
+    Parameters
+    ----------
+    func : Callable[[int], object]
+        Compute the result of a partition. Its results must be picklable.
+    npartitions : int
+    num_processes : int
+
+    Returns
+    -------
+    List[object]
+        The result of every partition, in order
+    """
+    context = fork_context()
+    if context is None or current_pool() is not None:
+        return parallel_map(func, range(npartitions))
+
+    with _tasks_lock:
+        task_id = next(_task_ids)
+        _tasks[task_id] = func
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=min(num_processes, npartitions),
+            mp_context=context,
+            initializer=_mark_worker,
+        ) as executor:
+            return list(
+                executor.map(
+                    _run_task, itertools.repeat(task_id), range(npartitions)
+                )
+            )
+    finally:
+        with _tasks_lock:
+            del _tasks[task_id]
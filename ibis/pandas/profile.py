@@ -0,0 +1,441 @@
+"""Per-operation profiling of pandas backend execution.
+
+Examples
+--------
+>>> import ibis
+>>> import pandas as pd
+>>> con = ibis.pandas.connect({'df': pd.DataFrame({'a': [1, 2, 3]})})
+>>> t = con.table('df')
+>>> with ibis.pandas.profile() as profile:
+...     result = (t.a + 1).sum().execute()
+>>> sorted({record.operation for record in profile.records})
+['Add', 'Literal', 'PandasTable', 'Sum', 'TableColumn']
+"""
+
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import json
+import threading
+import time
+
+import pandas as pd
+import toolz
+from pandas.core.groupby import GroupBy
+
+import ibis.expr.operations as ops
+from ibis.pandas.dispatch import execute_literal, execute_node
+
+_executing = threading.local()
+
+
+def _active():
+    profiles = getattr(_executing, 'profiles', None)
+    if profiles is None:
+        profiles = _executing.profiles = []
+    return profiles
+
+
+def current_profile():
+    """Return the innermost :class:`Profile` active in this thread, or None
+    if execution is not being profiled.
+    """
+    profiles = getattr(_executing, 'profiles', None)
+    return profiles[-1] if profiles else None
+
+
+@contextlib.contextmanager
+def profile():
+    """Profile every operation that the pandas backend executes in this
+    context, in this thread and in the threads that execute operations on its
+    behalf.
+
+    Yields
+    ------
+    Profile
+    """
+    result = Profile()
+    profiles = _active()
+    profiles.append(result)
+    try:
+        yield result
+    finally:
+        profiles.remove(result)
+
+
+def execution_state():
+    """Return the active profiles and the operations being executed in this
+    thread, for the threads that execute operations on their behalf.
+    """
+    return (
+        tuple(getattr(_executing, 'profiles', None) or ()),
+        tuple(getattr(_executing, 'stack', None) or ()),
+    )
+
+
+@contextlib.contextmanager
+def restore_execution_state(state):
+    """Profile the operations executed in this context with the profiles of
+    `state`, as returned by :func:`execution_state`, as nested in its
+    operations.
+    """
+    profiles, stack = state
+    previous = (
+        getattr(_executing, 'profiles', None),
+        getattr(_executing, 'stack', None),
+    )
+    _executing.profiles = list(profiles)
+    _executing.stack = list(stack)
+    try:
+        yield
+    finally:
+        _executing.profiles, _executing.stack = previous
+
+
+def _rows(value):
+    if isinstance(value, GroupBy):
+        value = value.obj
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return len(value.index)
+    return None
+
+
+def _nbytes(value):
+    if isinstance(value, GroupBy):
+        value = value.obj
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=False))
+    return None
+
+
+def _label(op):
+    name = getattr(op, 'name', None)
+    if isinstance(name, str):
+        return '{}[{}]'.format(type(op).__name__, name)
+    return type(op).__name__
+
+
+class NodeProfile:
+    """The profile of one execution of an operation.
+
+    Attributes
+    ----------
+    id : int
+        The position of the record in :attr:`Profile.records`
+    parent : Optional[int]
+        The id of the operation whose execution executed this one, if any
+    op : ibis.expr.operations.Node
+    operation : str
+        The name of the type of `op`
+    label : str
+        `operation`, followed by the name of `op` if it has one
+    rule : Optional[str]
+        The name of the ``execute_node`` rule that was dispatched to, or None
+        if the result was served from scope
+    signature : Tuple[str, ...]
+        The names of the types of the arguments that the rule was dispatched
+        on
+    seconds : float
+        The wall time spent computing the result
+    rows_in : Optional[int]
+        The total number of rows of the pandas arguments
+    rows_out : Optional[int]
+        The number of rows of the result, if it is a pandas object
+    nbytes : Optional[int]
+        The number of bytes of the result, or of the data it groups, if it is
+        a pandas object, without the objects its values refer to
+    from_scope : bool
+        Whether the result was already in scope
+    """
+
+    __slots__ = (
+        'id',
+        'parent',
+        'op',
+        'operation',
+        'label',
+        'rule',
+        'signature',
+        'seconds',
+        'rows_in',
+        'rows_out',
+        'nbytes',
+        'from_scope',
+    )
+
+    def __init__(self, id, parent, op):
+        self.id = id
+        self.parent = parent
+        self.op = op
+        self.operation = type(op).__name__
+        self.label = _label(op)
+        self.rule = None
+        self.signature = ()
+        self.seconds = 0.0
+        self.rows_in = None
+        self.rows_out = None
+        self.nbytes = None
+        self.from_scope = False
+
+    def to_dict(self):
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != 'op'
+        }
+
+    def __repr__(self):
+        return '{}({}, {:.6f}s)'.format(
+            type(self).__name__, self.label, self.seconds
+        )
+
+
+class Profile:
+    """The profiles of the operations executed while profiling.
+
+    Attributes
+    ----------
+    records : List[NodeProfile]
+        One record per execution of an operation, and per operation served
+        from scope, in the order they started
+    roots : List[ibis.expr.types.Expr]
+        The expressions that were executed
+    memo_hits : int
+        The number of times the result of an operation was reused by another
+        operation instead of being recomputed, as counted by
+        :class:`~ibis.pandas.core.ExecutionMemo`
+    """
+
+    def __init__(self):
+        self.records = []
+        self.roots = []
+        self.memo_hits = 0
+        self._lock = threading.Lock()
+
+    def _new_record(self, op):
+        stack = getattr(_executing, 'stack', None)
+        parent = stack[-1].id if stack else None
+        with self._lock:
+            record = NodeProfile(len(self.records), parent, op)
+            self.records.append(record)
+        return record
+
+    def add_root(self, expr):
+        """Record that `expr` is executed, unless it is executed on behalf of
+        another operation.
+        """
+        if not getattr(_executing, 'stack', None):
+            with self._lock:
+                self.roots.append(expr)
+
+    def add_memo_hits(self, hits):
+        """Record that `hits` results were reused from the memo of an
+        execution.
+        """
+        with self._lock:
+            self.memo_hits += hits
+
+    def served_from_scope(self, op):
+        """Record that the result of `op` was found in scope."""
+        self._new_record(op).from_scope = True
+
+    def execute(self, node, args, compute):
+        """Call ``compute()`` to execute `node` with its computed `args`, and
+        record its profile.
+        """
+        record = self._new_record(node)
+        if isinstance(node, ops.Literal):
+            rule = execute_literal
+        else:
+            rule = execute_node.dispatch(type(node), *map(type, args))
+        record.rule = getattr(rule, '__name__', None)
+        record.signature = tuple(type(arg).__name__ for arg in args)
+        rows = [rows for rows in map(_rows, args) if rows is not None]
+        record.rows_in = sum(rows) if rows else None
+
+        stack = getattr(_executing, 'stack', None)
+        if stack is None:
+            stack = _executing.stack = []
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            result = compute()
+        finally:
+            record.seconds = time.perf_counter() - start
+            stack.pop()
+        record.rows_out = _rows(result)
+        record.nbytes = _nbytes(result)
+        return result
+
+    def to_frame(self):
+        """Return the records as a DataFrame, one row per record."""
+        return pd.DataFrame.from_records(
+            [record.to_dict() for record in self.records],
+            columns=[name for name in NodeProfile.__slots__ if name != 'op'],
+        )
+
+    def to_json(self, **kwargs):
+        """Serialize the records to JSON, passing `kwargs` to
+        :func:`json.dumps`.
+        """
+        return json.dumps(
+            [record.to_dict() for record in self.records], **kwargs
+        )
+
+    def stats(self):
+        """Aggregate the records of every executed operation.
+
+        Returns
+        -------
+        pd.DataFrame
+            Indexed by operation label and rule, with the number of calls,
+            the total and per call wall time and the total rows out and bytes
+            produced. The total time ``seconds`` includes that of the
+            executions nested in the operation, and ``own_seconds`` does
+            not.
+        """
+        frame = self.to_frame()
+        frame = frame.loc[~frame.from_scope]
+        nested = frame.groupby('parent').seconds.sum()
+        # nested executions that ran concurrently can add up to more than
+        # the wall time of the operation that ran them
+        frame = frame.assign(
+            own_seconds=(
+                frame.seconds - frame.id.map(nested).fillna(0.0)
+            ).clip(lower=0.0)
+        )
+        stats = frame.groupby(['label', 'rule'], sort=False).agg(
+            calls=('id', 'size'),
+            seconds=('seconds', 'sum'),
+            own_seconds=('own_seconds', 'sum'),
+            rows_out=('rows_out', 'sum'),
+            nbytes=('nbytes', 'sum'),
+        )
+        stats['per_call'] = stats.seconds / stats.calls
+        return stats.sort_values('seconds', ascending=False)
+
+    def report(self, limit=None):
+        """Format :meth:`stats` like :mod:`pstats`, slowest operations
+        first, with their own time as ``tottime`` and their time including
+        nested executions as ``cumtime``.
+
+        Parameters
+        ----------
+        limit : Optional[int]
+            The largest number of operations to show
+
+        Returns
+        -------
+        str
+        """
+        stats = self.stats()
+        if limit is not None:
+            stats = stats.head(limit)
+        total = sum(
+            record.seconds
+            for record in self.records
+            if record.parent is None and not record.from_scope
+        )
+        lines = [
+            '{:d} operations executed in {:.6f} seconds, '
+            '{:d} results reused from the memo'.format(
+                int(stats.calls.sum()), total, self.memo_hits
+            ),
+            '',
+            '{:>8} {:>12} {:>12} {:>12} {:>10} {:>12}  {}'.format(
+                'calls',
+                'tottime',
+                'cumtime',
+                'percall',
+                'rows',
+                'bytes',
+                'operation',
+            ),
+        ]
+        for (label, rule), row in stats.iterrows():
+            lines.append(
+                '{:>8d} {:>12.6f} {:>12.6f} {:>12.6f} {:>10d} {:>12d}  '
+                '{} ({})'.format(
+                    int(row['calls']),
+                    row['own_seconds'],
+                    row['seconds'],
+                    row['per_call'],
+                    int(row['rows_out']),
+                    int(row['nbytes']),
+                    label,
+                    rule,
+                )
+            )
+        return '\n'.join(lines)
+
+    def tree(self):
+        """Format the operations of every executed expression as a tree, with
+        the arguments of an operation indented below it. Operations that ran
+        nested executions, such as aggregations, are followed by the
+        operations they executed. An operation that is the argument of
+        several operations is only expanded the first time it is shown.
+
+        Returns
+        -------
+        str
+        """
+        by_op = collections.defaultdict(list)
+        children = collections.defaultdict(list)
+        for record in self.records:
+            by_op[record.parent, record.op].append(record)
+            children[record.parent].append(record)
+
+        lines = []
+        shown = set()
+
+        def visit(op, parent, depth):
+            if (parent, op) in shown:
+                lines.append(
+                    '{}{}  shown above'.format('  ' * depth, _label(op))
+                )
+                return
+            shown.add((parent, op))
+            records = by_op[parent, op]
+            if any(record.from_scope for record in records):
+                stats = 'from scope'
+            else:
+                stats = '{:.6f}s rows={} bytes={}'.format(
+                    sum(record.seconds for record in records),
+                    records[-1].rows_out,
+                    records[-1].nbytes,
+                )
+            lines.append('{}{}  {}'.format('  ' * depth, _label(op), stats))
+            for record in records:
+                nested = toolz.unique(
+                    child.op for child in children[record.id]
+                )
+                for child in _ordered_roots(list(nested)):
+                    visit(child, record.id, depth + 2)
+            args = toolz.unique(
+                arg.op() for arg in op.flat_args() if hasattr(arg, 'op')
+            )
+            for arg in args:
+                if (parent, arg) in by_op:
+                    visit(arg, parent, depth + 1)
+
+        for expr in self.roots:
+            if (None, expr.op()) in by_op:
+                shown.clear()
+                visit(expr.op(), None, 0)
+        return '\n'.join(lines)
+
+
+def _ordered_roots(nodes):
+    """Return the operations in `nodes` that are not an argument of another
+    operation in `nodes`.
+    """
+    args = {
+        arg.op()
+        for node in nodes
+        for arg in node.flat_args()
+        if hasattr(arg, 'op')
+    }
+    return [node for node in nodes if node not in args]
@@ -0,0 +1,383 @@
+"""Memory-bounded execution of expressions over batches of rows.
+
+An expression whose every row is computed from one row of a single physical
+table, such as a projection or a filter of that table, or a join of it with
+other tables, is executed once for every batch of rows of that table.
+
+Aggregations and reductions over such expressions are computed by merging the
+partial results of every batch, so that only one batch and the partial results
+of the groups seen so far are in memory at any time.
+"""
+
+from __future__ import absolute_import
+
+import numpy as np
+import pandas as pd
+import toolz
+
+import ibis.expr.operations as ops
+import ibis.expr.types as ir
+from ibis.pandas.core import (
+    execute,
+    is_elementwise,
+    required_columns,
+    reset_result,
+)
+from ibis.pandas.dispatch import execute_table_chunks
+from ibis.pandas.partial import merge_states, partial_reduction
+
+
+def _is_reduction(op):
+    # Any and All are reductions but not instances of ops.Reduction
+    return isinstance(op, ops.Reduction) or getattr(op, '_reduction', False)
+
+
+def _reductions(expr):
+    """Return the reductions that `expr` is computed from, or None if `expr`
+    uses the columns of a table other than through a reduction.
+    """
+    reductions = []
+    stack = [expr.op()]
+    seen = set()
+    while stack:
+        op = stack.pop()
+        if op in seen:
+            continue
+        seen.add(op)
+        if _is_reduction(op):
+            reductions.append(op)
+        elif isinstance(op, (ops.TableColumn, ops.TableNode)):
+            return None
+        else:
+            stack.extend(
+                arg.op() for arg in op.flat_args() if isinstance(arg, ir.Expr)
+            )
+    return reductions
+
+
+def _reduction_table(op):
+    """Return the table whose columns the reduction `op` is computed from, or
+    None if there isn't exactly one.
+    """
+    tables = set()
+    stack = [op]
+    while stack:
+        node = stack.pop()
+        for arg in node.flat_args():
+            if isinstance(arg, ir.TableExpr):
+                tables.add(arg.op())
+            elif isinstance(arg, ir.Expr):
+                arg_op = arg.op()
+                if isinstance(arg_op, ops.TableColumn):
+                    tables.add(arg_op.table.op())
+                else:
+                    stack.append(arg_op)
+    if len(tables) != 1:
+        return None
+    (table,) = tables
+    return table
+
+
+def _depends_on(op, table):
+    """Return whether the operation `op` uses the table operation `table`."""
+    stack = [op]
+    seen = set()
+    while stack:
+        node = stack.pop()
+        if node.equals(table):
+            return True
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.extend(
+            arg.op() for arg in node.flat_args() if isinstance(arg, ir.Expr)
+        )
+    return False
+
+
+def _streamed_table(op):
+    """Find the physical table that every row of the table operation `op` is
+    computed from, one row at a time.
+
+    Returns
+    -------
+    Optional[Tuple[ops.PhysicalTable, List[ir.TableExpr]]]
+        The physical table and the tables joined to it, which are computed
+        in their entirety, or None if `op` is not computed row by row from a
+        physical table that can be read in batches
+    """
+    joined = []
+    root = op
+    while not isinstance(root, ops.PhysicalTable):
+        if isinstance(root, ops.Selection):
+            if root.sort_keys or not all(
+                map(
+                    is_elementwise,
+                    toolz.concatv(root.selections, root.predicates),
+                )
+            ):
+                return None
+            root = root.table.op()
+        elif type(root) in {ops.InnerJoin, ops.LeftJoin, ops.CrossJoin}:
+            # rows of the left table are joined independently of each other
+            joined.append(root.right)
+            root = root.left.op()
+        else:
+            return None
+
+    client = getattr(root, 'source', None)
+    if execute_table_chunks.dispatch(
+        type(root), type(client), type(None), int
+    ) is None or any(_depends_on(table.op(), root) for table in joined):
+        return None
+    return root, joined
+
+
+def _execute_chunks(expr, table, joined, chunksize, params=None, **kwargs):
+    """Execute `expr` for every batch of rows of the physical table `table`.
+
+    The tables `joined` to `table` are computed only once.
+    """
+    scope = {
+        join.op(): execute(join, params=params, **kwargs) for join in joined
+    }
+    columns = required_columns(expr, scope).get(table)
+    client = table.source
+    chunks = execute_table_chunks(table, client, columns, chunksize)
+
+    empty = True
+    for chunk in chunks:
+        empty = False
+        yield execute(
+            expr,
+            params=params,
+            scope=toolz.merge(scope, {table: chunk}),
+            **kwargs,
+        )
+
+    if empty:
+        names = table.schema.names if columns is None else columns
+        chunk = table.schema.apply_to(pd.DataFrame(columns=list(names)))
+        yield execute(
+            expr,
+            params=params,
+            scope=toolz.merge(scope, {table: chunk}),
+            **kwargs,
+        )
+
+
+def _execute_streaming_aggregation(
+    table, reductions, chunksize, by=(), predicates=(), params=None, **kwargs
+):
+    """Compute `reductions` of every group of the rows of the table operation
+    `table` by merging their partial results over batches of rows.
+
+    Returns
+    -------
+    Optional[Dict[ops.Node, Union[pd.Series, object]]]
+        The value of every reduction, indexed by group if there are grouping
+        keys `by`, or None if the reductions cannot be computed that way
+    """
+    streamed = _streamed_table(table)
+    if streamed is None:
+        return None
+    partials = {op: partial_reduction(op) for op in reductions}
+    if any(partial is None for partial in partials.values()):
+        return None
+
+    aggregation = ops.Aggregation(
+        table.to_expr(),
+        list(
+            toolz.concat(partial.partials for partial in partials.values())
+        ),
+        by=list(by),
+        predicates=list(predicates),
+    ).to_expr()
+
+    keys = [key.get_name() for key in by]
+    states = None
+    for chunk_states in _execute_chunks(
+        aggregation, *streamed, chunksize, params=params, **kwargs
+    ):
+        if keys:
+            chunk_states = chunk_states.set_index(keys)
+        if states is not None:
+            chunk_states = pd.concat([states, chunk_states])
+        states = merge_states(
+            chunk_states, len(keys), partials.values()
+        )
+
+    result = {op: partial.finalize(states) for op, partial in partials.items()}
+    if not keys:
+        result = toolz.valmap(lambda values: values.iloc[0], result)
+    return result
+
+
+def _evaluate(expr, values, params=None, **kwargs):
+    """Compute `expr` from the `values` of its reductions."""
+    op = expr.op()
+    if op in values:
+        return values[op]
+    return execute(expr, params=params, scope=values, **kwargs)
+
+
+def _execute_aggregation(op, chunksize, params=None, **kwargs):
+    """Compute the aggregation `op` over batches of rows of its table, or
+    return None if it cannot be computed that way.
+    """
+    if op.sort_keys or not all(
+        map(is_elementwise, toolz.concatv(op.by, op.predicates))
+    ):
+        return None
+
+    exprs = list(toolz.concatv(op.metrics, op.having))
+    expr_reductions = list(map(_reductions, exprs))
+    if not all(expr_reductions):
+        # the metrics use columns outside of a reduction, or none at all
+        return None
+
+    values = _execute_streaming_aggregation(
+        op.table.op(),
+        list(toolz.unique(toolz.concat(expr_reductions))),
+        chunksize,
+        by=op.by,
+        predicates=op.predicates,
+        params=params,
+        **kwargs,
+    )
+    if values is None:
+        return None
+
+    names = [metric.get_name() for metric in op.metrics]
+    metrics = [
+        _evaluate(metric, values, params=params, **kwargs)
+        for metric in op.metrics
+    ]
+    if not op.by:
+        return pd.DataFrame([metrics], columns=names)
+
+    index = next(iter(values.values())).index
+    result = pd.DataFrame(
+        {
+            name: pd.Series(metric, index=index)
+            for name, metric in zip(names, metrics)
+        },
+        index=index,
+    )
+    for having in op.having:
+        mask = _evaluate(having, values, params=params, **kwargs)
+        result = result.loc[np.asarray(mask, dtype=bool)]
+    return result.reset_index()
+
+
+def _execute_reductions(expr, chunksize, params=None, **kwargs):
+    """Compute the aggregations and reductions in `expr` that can be computed
+    over batches of rows.
+
+    Returns
+    -------
+    Dict[ops.Node, object]
+        The value of every aggregation and reduction that was computed
+    """
+    aggregations = []
+    reductions = {}
+    stack = [expr.op()]
+    seen = set()
+    while stack:
+        op = stack.pop()
+        if op in seen:
+            continue
+        seen.add(op)
+        if isinstance(op, ops.Aggregation):
+            # the reductions of an aggregation are computed per group
+            aggregations.append(op)
+            stack.append(op.table.op())
+            continue
+        if isinstance(op, ops.WindowOp):
+            continue
+        if _is_reduction(op):
+            table = _reduction_table(op)
+            if table is not None:
+                reductions.setdefault(table, []).append(op)
+                continue
+        stack.extend(
+            arg.op() for arg in op.flat_args() if isinstance(arg, ir.Expr)
+        )
+
+    scope = {}
+    for op in aggregations:
+        result = _execute_aggregation(op, chunksize, params=params, **kwargs)
+        if result is not None:
+            scope[op] = result
+    for table, ops_ in reductions.items():
+        values = _execute_streaming_aggregation(
+            table, ops_, chunksize, params=params, **kwargs
+        )
+        if values is not None:
+            scope.update(values)
+    return scope
+
+
+def execute_streaming(expr, chunksize, params=None, **kwargs):
+    """Execute `expr` over batches of at most `chunksize` rows of the physical
+    table it is computed from.
+
+    Parameters
+    ----------
+    expr : ibis.expr.types.Expr
+    chunksize : int
+        The largest number of rows of a physical table to keep in memory
+    params : Optional[Mapping[ibis.expr.types.Expr, object]]
+
+    Returns
+    -------
+    results : Iterator[Union[pandas.Series, pandas.DataFrame, object]]
+        A result for every batch of rows if `expr` is computed row by row
+        from a single physical table. Otherwise, the result of `expr` in its
+        entirety, computed from the partial results of the aggregations and
+        reductions that can be computed over batches of rows.
+
+    Notes
+    -----
+    Expressions that are computed neither row by row nor from aggregations
+    that can be merged, such as sorts, window functions or joins of two
+    aggregations, are computed in memory.
+    """
+    if chunksize < 1:
+        raise ValueError(
+            'chunksize must be a positive integer, got {!r}'.format(chunksize)
+        )
+
+    if isinstance(expr, ir.TableExpr):
+        table = expr.op()
+    elif isinstance(expr, ir.ColumnExpr) and is_elementwise(expr):
+        table = _reduction_table(expr.op())
+    else:
+        table = None
+
+    streamed = None if table is None else _streamed_table(table)
+    if streamed is not None:
+        yield from _execute_chunks(
+            expr, *streamed, chunksize, params=params, **kwargs
+        )
+    else:
+        scope = _execute_reductions(expr, chunksize, params=params, **kwargs)
+        yield execute(expr, params=params, scope=scope, **kwargs)
+
+
+def execute_chunked(expr, chunksize, params=None, **kwargs):
+    """Execute `expr` with :func:`execute_streaming` and combine the results
+    of every batch of rows.
+
+    Returns
+    -------
+    result : Union[
+        pandas.Series, pandas.DataFrame, ibis.pandas.core.simple_types
+    ]
+    """
+    results = list(execute_streaming(expr, chunksize, params=params, **kwargs))
+    if len(results) == 1:
+        (result,) = results
+    else:
+        result = pd.concat(results, ignore_index=True)
+    return reset_result(expr, result)
@@ -5,7 +5,7 @@ import pytest
 from pytest import param
 
 import ibis
-from ibis.pandas.client import PandasTable  # noqa: E402
+from ibis.pandas.client import JoinIndexCache, PandasTable  # noqa: E402
 
 pytestmark = pytest.mark.pandas
 
@@ -49,6 +49,30 @@ def test_create_table(client):
     assert client.exists_table('testingschema')
 
 
+def test_join_index_cache_eviction():
+    class Index:
+        nbytes = 40
+
+    cache = JoinIndexCache()
+    frames = [pd.DataFrame({'a': [1]}) for _ in range(3)]
+    with ibis.config.option_context('pandas.join_index_cache_size', 100):
+        cache.put('t0', ['a'], frames[0], Index())
+        cache.put('t1', ['a'], frames[1], Index())
+
+        # touching t0 makes t1 the least recently used index
+        assert cache.get('t0', ['a'], frames[0]) is not None
+        cache.put('t2', ['a'], frames[2], Index())
+
+        assert cache.nbytes == 80
+        assert cache.get('t1', ['a'], frames[1]) is None
+        assert cache.get('t0', ['a'], frames[0]) is not None
+        assert cache.get('t2', ['a'], frames[2]) is not None
+
+        # an index of another frame is stale
+        assert cache.get('t2', ['a'], frames[0]) is None
+        assert len(cache) == 1
+
+
 def test_literal(client):
     lit = ibis.literal(1)
     result = client.execute(lit)
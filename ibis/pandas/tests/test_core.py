@@ -1,5 +1,9 @@
+import sys
+import threading
 from typing import Any
 
+import multipledispatch
+import numpy as np
 import pandas as pd
 import pandas.util.testing as tm
 import pytest
@@ -9,9 +13,17 @@ import ibis
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+from ibis.pandas import threads
 from ibis.pandas.client import PandasClient
-from ibis.pandas.core import is_computable_input
-from ibis.pandas.dispatch import execute_node, post_execute, pre_execute
+from ibis.pandas.core import is_computable_input, schedule
+from ibis.pandas.dispatch import (
+    Dispatcher,
+    execute_node,
+    post_execute,
+    pre_execute,
+)
+from ibis.pandas.partition import hash_partitions
+from ibis.pandas.udf import udf
 
 pytestmark = pytest.mark.pandas
 
@@ -127,6 +139,25 @@ def test_post_execute_called_on_joins(dataframe, core_client, ibis_table):
     assert count[0] == 1
 
 
+def test_post_execute_called_on_sorted_limits(ibis_table):
+    ops_seen = []
+
+    @post_execute.register(ops.Limit, pd.DataFrame)
+    def tmp_limit_exe(op, data, **kwargs):
+        ops_seen.append(type(op))
+        return data
+
+    @post_execute.register(ops.Selection, pd.DataFrame)
+    def tmp_selection_exe(op, data, **kwargs):
+        ops_seen.append(type(op))
+        return data
+
+    expr = ibis_table.sort_by('plain_int64').limit(2)
+    result = expr.execute()
+    assert result.plain_int64.tolist() == [1, 2]
+    assert ops_seen == [ops.Selection, ops.Limit]
+
+
 def test_is_computable_input():
     class MyObject:
         def __init__(self, value: float) -> None:
@@ -180,3 +211,272 @@ def test_is_computable_input():
     del dt.infer.funcs[(MyObject,)]
     dt.infer.reorder()
     dt.infer._cache.clear()
+
+
+def test_shared_subexpression_computed_once(dataframe, ibis_table):
+    count = [0]
+
+    @post_execute.register(ops.Multiply, pd.Series)
+    def tmp_multiply_post_execute(op, data, **kwargs):
+        count[0] += 1
+        return data
+
+    doubled = ibis_table.plain_int64 * 2
+    expr = doubled + doubled.log()
+    try:
+        result = expr.execute()
+    finally:
+        del post_execute.funcs[ops.Multiply, pd.Series]
+        post_execute.reorder()
+        post_execute._cache.clear()
+
+    doubled_data = dataframe.plain_int64 * 2
+    expected = doubled_data + np.log(doubled_data)
+    tm.assert_series_equal(result, expected)
+    assert count[0] == 1
+
+
+def test_execution_memo_hits_are_logged(ibis_table):
+    messages = []
+    doubled = ibis_table.plain_int64 * 2
+    expr = (doubled + doubled).sum()
+    with ibis.config.option_context('verbose', True):
+        with ibis.config.option_context('verbose_log', messages.append):
+            expr.execute()
+    assert any('1 memo hit(s)' in message for message in messages)
+
+
+def test_deep_expression_executes_without_recursing(dataframe, ibis_table):
+    depth = 2000
+    expr = ibis_table.plain_int64
+    for _ in range(depth):
+        expr = expr + 1
+
+    # hashing an expression is recursive, so compute (and cache) the hash
+    # before measuring the depth of execution
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(10 * depth)
+    try:
+        hash(expr.op())
+    finally:
+        sys.setrecursionlimit(limit)
+
+    result = expr.execute()
+    expected = dataframe.plain_int64 + depth
+    tm.assert_series_equal(result, expected)
+
+
+def test_schedule_shares_and_releases_intermediates(ibis_table):
+    doubled = ibis_table.plain_int64 * 2
+    expr = doubled + doubled.log()
+    order, refcounts = schedule(expr, {})
+    ops_in_order = [e.op() for e in order]
+
+    assert len(ops_in_order) == len(set(ops_in_order))
+    assert ops_in_order.index(doubled.op()) < ops_in_order.index(expr.op())
+    assert refcounts[doubled.op()] == 2
+    assert expr.op() not in refcounts
+
+
+def test_execute_with_threads_matches_serial(ibis_table):
+    t = ibis_table
+    doubled = t.plain_int64 * 2
+    expr = t.group_by(t.dup_strings).aggregate(
+        total=t.plain_int64.sum(),
+        biggest=doubled.max(),
+        count=t.plain_strings.count(),
+        mixed=(doubled + t.plain_int64.log()).mean(),
+    )
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.num_threads', 4):
+        result = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_with_processes_matches_serial():
+    np.random.seed(0)
+    n = 1000
+    df = pd.DataFrame(
+        {
+            'key': np.random.randint(0, 50, n),
+            'other': np.random.choice(list('abc'), n),
+            'value': np.random.randn(n),
+        }
+    )
+    t = ibis.pandas.connect({'df': df}).table('df')
+
+    @udf.reduction(input_type=[dt.double], output_type=dt.double)
+    def value_range(series):
+        return series.max() - series.min()
+
+    expr = (
+        t[t.value > -1]
+        .group_by([t.key, (t.other + 'x').name('other_x')])
+        .having(t.count() > 1)
+        .aggregate(
+            total=t.value.sum(), range=value_range(t.value), count=t.count()
+        )
+    )
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.num_processes', 3):
+        with ibis.config.option_context('pandas.partition_min_rows', 0):
+            result = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_partitioned_aggregation_with_threads(ibis_table, monkeypatch):
+    from ibis.pandas import partition
+
+    def fail(*args, **kwargs):
+        raise AssertionError('forked a process with worker threads running')
+
+    t = ibis_table
+    expr = t.group_by('dup_strings').aggregate(
+        total=t.plain_int64.sum(), count=t.count()
+    )
+    expected = expr.execute()
+    monkeypatch.setattr(
+        partition.concurrent.futures, 'ProcessPoolExecutor', fail
+    )
+    with ibis.config.option_context(
+        'pandas.num_threads', 4
+    ), ibis.config.option_context(
+        'pandas.num_processes', 4
+    ), ibis.config.option_context(
+        'pandas.partition_min_rows', 0
+    ):
+        result = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_hash_partitions():
+    keys = [pd.Series(list('abcabcd')), pd.Series([1, 2, 3, 1, 2, 3, 1])]
+    partitions = hash_partitions(keys, 3)
+    assert sorted(np.concatenate(partitions).tolist()) == list(range(7))
+
+    partition_of = {
+        row: i for i, positions in enumerate(partitions) for row in positions
+    }
+    assert partition_of[0] == partition_of[3]
+    assert partition_of[1] == partition_of[4]
+
+
+@pytest.mark.parametrize(
+    'types',
+    [
+        (ops.Add, pd.Series, pd.Series),
+        (ops.Add, pd.Series, int),
+        (ops.Add, np.int64, bool),
+        (ops.Sum, pd.core.groupby.SeriesGroupBy, type(None)),
+        (ops.Literal, object),
+        (ops.Node, str, str),
+    ],
+)
+def test_dispatch_matches_multipledispatch(types):
+    expected = multipledispatch.Dispatcher.dispatch(execute_node, *types)
+    assert execute_node.dispatch(*types) is expected
+
+
+def test_dispatch_cache_is_bounded():
+    func = Dispatcher('func', cache_size=2)
+    func.add((object,), lambda value: 'object')
+    func.add((int,), lambda value: 'int')
+
+    assert func(True) == 'int'
+    assert func(1.0) == 'object'
+    assert func('a') == 'object'
+    assert list(func._cache) == [(float,), (str,)]
+
+
+@pytest.fixture
+def waiting_udfs():
+    """UDFs that each wait for another call to start, so that they can only
+    finish if two of them run at the same time.
+    """
+    barrier = threading.Barrier(2, timeout=10)
+    thread_ids = set()
+
+    def wait():
+        thread_ids.add(threading.get_ident())
+        barrier.wait()
+
+    @udf.reduction(input_type=[dt.int64], output_type=dt.int64)
+    def waiting_sum(series):
+        wait()
+        return series.sum()
+
+    @udf.elementwise(input_type=[dt.int64], output_type=dt.int64)
+    def waiting_double(series):
+        wait()
+        return series * 2
+
+    return waiting_sum, waiting_double, thread_ids
+
+
+@pytest.mark.parametrize('num_threads', [2, 4])
+def test_aggregation_metrics_run_concurrently(
+    ibis_table, dataframe, waiting_udfs, num_threads
+):
+    waiting_sum, _, thread_ids = waiting_udfs
+    t = ibis_table
+    expr = t.aggregate(
+        total=waiting_sum(t.plain_int64),
+        doubled=waiting_sum(t.plain_int64 * 2),
+    )
+    with ibis.config.option_context('pandas.num_threads', num_threads):
+        result = expr.execute()
+    total = dataframe.plain_int64.sum()
+    assert result.total.tolist() == [total]
+    assert result.doubled.tolist() == [total * 2]
+    assert len(thread_ids) == 2
+
+
+def test_projections_run_concurrently(ibis_table, dataframe, waiting_udfs):
+    _, waiting_double, thread_ids = waiting_udfs
+    t = ibis_table
+    expr = t.mutate(
+        a=waiting_double(t.plain_int64), b=waiting_double(t.plain_int64 + 1)
+    )
+    with ibis.config.option_context('pandas.num_threads', 2):
+        result = expr.execute()
+    assert result.a.tolist() == (dataframe.plain_int64 * 2).tolist()
+    assert result.b.tolist() == ((dataframe.plain_int64 + 1) * 2).tolist()
+    assert len(thread_ids) == 2
+
+
+def test_join_sides_run_concurrently(ibis_table, waiting_udfs):
+    _, waiting_double, thread_ids = waiting_udfs
+    left = ibis_table
+    right = left[
+        left.plain_strings.name('key'), left.plain_int64.name('value')
+    ]
+    joined = left.join(right, left.plain_strings == right.key)
+    projected = joined[left.plain_strings, left.plain_int64, right.value]
+    expr = projected.filter(
+        [
+            waiting_double(projected.plain_int64) > 2,
+            waiting_double(projected.value) < 6,
+        ]
+    )[['plain_strings']]
+    with ibis.config.option_context('pandas.num_threads', 2):
+        result = expr.execute()
+    assert result.plain_strings.tolist() == ['b']
+    assert len(thread_ids) == 2
+
+
+def test_nested_executions_share_one_pool(ibis_table, monkeypatch):
+    pools = []
+    execution_pool = threads.ExecutionPool
+
+    def counting_pool(num_threads):
+        pools.append(num_threads)
+        return execution_pool(num_threads)
+
+    monkeypatch.setattr(threads, 'ExecutionPool', counting_pool)
+    t = ibis_table
+    expr = t.group_by('dup_strings').aggregate(
+        total=t.plain_int64.sum(), biggest=(t.plain_int64 * 2).max()
+    )
+    with ibis.config.option_context('pandas.num_threads', 3):
+        expr.execute()
+    assert pools == [3]
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+import pytest
+
+import ibis
+import ibis.expr.datatypes as dt
+from ibis.pandas.encoding import is_encoded
+
+pytestmark = pytest.mark.pandas
+
+
+@pytest.fixture(scope='module')
+def df():
+    np.random.seed(0)
+    n = 100
+    return pd.DataFrame(
+        {
+            'key': np.random.choice(['b', 'a', 'c', None], n),
+            'other': np.random.choice(['c', 'd'], n),
+            'unique': ['u{:d}'.format(i) for i in range(n)],
+            'value': np.random.randn(n),
+        }
+    )
+
+
+@pytest.fixture(scope='module')
+def lookup():
+    return pd.DataFrame({'key': ['c', 'a', 'z'], 'id': [3, 1, 26]})
+
+
+@pytest.fixture
+def client(df, lookup):
+    return ibis.pandas.connect({'df': df, 'lookup': lookup})
+
+
+@pytest.fixture
+def encoded():
+    with ibis.config.option_context('pandas.dictionary_encoding_ratio', 0.5):
+        yield
+
+
+def test_table_data_encodes_low_cardinality_strings(client, df, encoded):
+    t = client.table('df')
+    data = client.table_data('df', t.schema())
+    assert is_encoded(data.key)
+    assert is_encoded(data.other)
+    assert not is_encoded(data.unique)
+    assert data.index is df.index
+    assert list(data.key.cat.categories) == ['a', 'b', 'c']
+    assert client.table_data('df', t.schema()) is data
+
+    # the data of the client is left unchanged
+    assert df.key.dtype == np.object_
+
+
+def test_table_data_without_encoding(client, df):
+    t = client.table('df')
+    assert client.table_data('df', t.schema()) is df
+
+
+@pytest.mark.parametrize(
+    'make_expr',
+    [
+        lambda t: t[t.key == 'a'],
+        lambda t: t[(t.key != 'b') & t.key.notnull()][['key', 'value']],
+        lambda t: t[t.key.isin(['a', 'c'])].key,
+        lambda t: t[t.key == t.other],
+        lambda t: t.key.upper(),
+        lambda t: t.group_by('key').aggregate(
+            total=t.value.sum(), most=t.other.max(), count=t.count()
+        ),
+        lambda t: t.group_by(['other', 'key']).aggregate(
+            distinct=t.unique.nunique()
+        ),
+        lambda t: t.group_by('key')
+        .having(t.value.sum() > 0)
+        .aggregate(mean=t.value.mean()),
+        lambda t: t.mutate(
+            rank=t.value.rank().over(ibis.window(group_by=t.other))
+        ),
+        lambda t: t.sort_by(['key', 'value']),
+    ],
+)
+def test_encoding_does_not_change_results(client, make_expr):
+    expr = make_expr(client.table('df'))
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.dictionary_encoding_ratio', 0.5):
+        result = expr.execute()
+    if isinstance(expected, pd.DataFrame):
+        tm.assert_frame_equal(result, expected)
+        assert not any(map(is_encoded, map(result.get, result.columns)))
+    else:
+        tm.assert_series_equal(result, expected)
+        assert not is_encoded(result)
+
+
+@pytest.mark.parametrize('ratio', [0.0, 1.0])
+def test_encoding_keeps_missing_values(ratio):
+    df = pd.DataFrame({'key': ['b', None, 'a', 'a'], 'group': 'g'})
+    t = ibis.pandas.connect({'df': df}).table('df')
+    expr = t.group_by('group').aggregate(keys=t.key.group_concat())
+    with ibis.config.option_context(
+        'pandas.dictionary_encoding_ratio', ratio
+    ):
+        assert expr.execute()['keys'].tolist() == ['b,None,a,a']
+        assert t.key.execute().tolist() == ['b', None, 'a', 'a']
+
+
+def test_strings_with_nan_are_not_encoded():
+    df = pd.DataFrame({'key': ['b', np.nan, 'a', 'a']})
+    client = ibis.pandas.connect({'df': df})
+    t = client.table('df')
+    with ibis.config.option_context('pandas.dictionary_encoding_ratio', 1.0):
+        assert not is_encoded(client.table_data('df', t.schema()).key)
+
+
+@pytest.mark.parametrize('ratio', [0.0, 1.0])
+@pytest.mark.parametrize('num_processes', [1, 2])
+def test_categorical_keys_keep_unobserved_groups(ratio, num_processes):
+    df = pd.DataFrame(
+        {
+            'c': pd.Categorical(['a', 'a', 'b'], categories=['a', 'b', 'z']),
+            's': ['x', 'y', 'x'],
+            'v': [1, 2, 3],
+        }
+    )
+    t = ibis.pandas.connect({'df': df}).table('df')
+    with ibis.config.option_context(
+        'pandas.dictionary_encoding_ratio', ratio
+    ), ibis.config.option_context(
+        'pandas.num_processes', num_processes
+    ), ibis.config.option_context(
+        'pandas.partition_min_rows', 0
+    ):
+        result = t.group_by('c').aggregate(n=t.count(), total=t.v.sum())
+        assert result.execute().to_dict('list') == {
+            'c': ['a', 'b', 'z'],
+            'n': [2, 1, 0],
+            'total': [3, 3, 0],
+        }
+
+        filtered = t[t.s == 'x']
+        result = filtered.group_by(['c', 's']).aggregate(
+            total=filtered.v.sum()
+        )
+        assert result.execute().to_dict('list') == {
+            'c': ['a', 'b', 'z'],
+            's': ['x', 'x', 'x'],
+            'total': [1, 3, 0],
+        }
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+def test_join_unifies_categories(client, encoded, how):
+    t = client.table('df')
+    lookup = client.table('lookup')
+    expr = t.join(lookup, t.key == lookup.key, how=how)[t, lookup.id]
+    result = expr.execute()
+    with ibis.config.option_context('pandas.dictionary_encoding_ratio', 0.0):
+        expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_category_schema_hint(client, df):
+    t = client.table('df', schema={'other': dt.category})
+    assert is_encoded(client.table_data('df', t.schema()).other)
+
+    result = t.group_by('other').aggregate(count=t.count()).execute()
+    assert is_encoded(result.other)
+    assert result.other.tolist() == ['c', 'd']
+    expected = df.other.value_counts().sort_index()
+    assert result['count'].tolist() == expected.tolist()
+
+
+def test_schema_apply_to_keeps_encoded_strings():
+    df = pd.DataFrame({'a': pd.Categorical(['x', 'y', 'x'])})
+    schema = ibis.schema([('a', dt.string)])
+    result = schema.apply_to(df.copy())
+    assert is_encoded(result.a)
+    assert result.a.tolist() == ['x', 'y', 'x']
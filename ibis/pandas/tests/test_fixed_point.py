@@ -0,0 +1,290 @@
+import decimal
+
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+import pytest
+
+import ibis
+import ibis.expr.datatypes as dt
+from ibis.pandas import fixed_point
+
+pytestmark = pytest.mark.pandas
+
+D = decimal.Decimal
+
+
+@pytest.fixture(scope='module')
+def df():
+    np.random.seed(0)
+    n = 100
+    cents = np.random.randint(-100000, 100000, n)
+    amounts = [D(int(value)).scaleb(-2) for value in cents]
+    return pd.DataFrame(
+        {
+            'key': np.random.choice(['a', 'b', 'c'], n),
+            'amount': amounts,
+            'nullable': [
+                None if i % 7 == 0 else value
+                for i, value in enumerate(amounts)
+            ],
+            'quantity': np.random.randint(-50, 50, n),
+            # more digits than the scale of its type
+            'unscaled': [D('0.125')] * n,
+        }
+    )
+
+
+@pytest.fixture(scope='module')
+def schema():
+    return ibis.schema(
+        [
+            ('key', dt.string),
+            ('amount', dt.Decimal(12, 2)),
+            ('nullable', dt.Decimal(12, 2)),
+            ('quantity', dt.int64),
+            ('unscaled', dt.Decimal(12, 2)),
+        ]
+    )
+
+
+@pytest.fixture(scope='module')
+def lookup():
+    return pd.DataFrame(
+        {'amount': [D('0.125'), D('12.34'), D('-5.00')], 'id': [1, 2, 3]}
+    )
+
+
+@pytest.fixture
+def client(df, lookup):
+    return ibis.pandas.connect({'df': df, 'lookup': lookup})
+
+
+@pytest.fixture
+def t(client, schema):
+    return client.table('df', schema=schema)
+
+
+@pytest.fixture(params=[True, False], ids=['arrow', 'no_arrow'])
+def arrow(request, monkeypatch):
+    if request.param and fixed_point.pa is None:
+        pytest.skip('pyarrow is not installed')
+    if not request.param:
+        monkeypatch.setattr(fixed_point, 'pa', None)
+    return request.param
+
+
+def test_table_data_scales_decimal_columns(client, t, df):
+    data = client.table_data('df', t.schema())
+    assert fixed_point.is_scaled(t.amount, data.amount)
+    assert fixed_point.is_scaled(t.nullable, data.nullable)
+    assert data.nullable.isna().sum() == df.nullable.isnull().sum()
+    assert data.amount.tolist() == [int(x.scaleb(2)) for x in df.amount]
+    assert not fixed_point.is_scaled(t.unscaled, data.unscaled)
+    assert data.index is df.index
+    assert client.table_data('df', t.schema()) is data
+
+    # the data of the client is left unchanged
+    assert df.amount.dtype == np.object_
+
+
+def test_table_data_without_fixed_point(client, t, df):
+    with ibis.config.option_context('pandas.fixed_point_decimals', False):
+        assert client.table_data('df', t.schema()) is df
+
+
+def test_convert(arrow):
+    data = pd.Series([D('1.25'), None, D('-0.05'), D('0')], name='x')
+    scaled = fixed_point.from_decimals(data, 2)
+    assert scaled.dtype == pd.Int64Dtype()
+    assert scaled.isna().tolist() == [False, True, False, False]
+
+    result = fixed_point.decode(scaled, 2)
+    assert result.name == 'x'
+    assert result[1] is None
+    values = result[[0, 2, 3]].tolist()
+    assert values == [D('1.25'), D('-0.05'), D('0.00')]
+    assert all(value.as_tuple().exponent == -2 for value in values)
+
+    assert fixed_point.from_decimals(data, 1) is None
+    # pandas takes NaN for NULL
+    assert fixed_point.from_decimals(pd.Series([D('NaN')]), 2).isna().all()
+    assert fixed_point.from_decimals(pd.Series([D('Infinity')]), 2) is None
+    assert fixed_point.from_decimals(pd.Series([D(10) ** 18]), 0) is None
+
+
+@pytest.mark.parametrize(
+    ('places', 'expected'),
+    [
+        (2, ['0.120', '-0.120', '2.680', '-2.680', '1.000']),
+        (1, ['0.100', '-0.100', '2.700', '-2.700', '1.000']),
+        (0, ['0.000', '0.000', '3.000', '-3.000', '1.000']),
+        (-1, ['0.000', '0.000', '0.000', '0.000', '0.000']),
+    ],
+)
+def test_round_half_even(places, expected):
+    values = pd.Series([D('0.125'), D('-0.125'), D('2.675'), D('-2.675')])
+    values = values.append(pd.Series([D('1.005')]), ignore_index=True)
+    scaled = fixed_point.from_decimals(values, 3)
+    rounded = fixed_point.round_half_even(scaled, 3, places)
+    result = fixed_point.decode(rounded, 3)
+    assert result.tolist() == list(map(D, expected))
+    assert result.tolist() == [
+        value.quantize(D(1).scaleb(-places)) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    'make_expr',
+    [
+        lambda t: t.amount,
+        lambda t: t.amount + t.quantity,
+        lambda t: t.amount - 3,
+        lambda t: 1 - t.nullable,
+        lambda t: t.nullable + t.amount,
+        lambda t: t.amount * t.quantity,
+        lambda t: 3 * t.nullable,
+        lambda t: t.amount.abs(),
+        lambda t: t.amount.round(1),
+        lambda t: t.amount.round(-1),
+        lambda t: t.amount.round(),
+        lambda t: t.amount > 0,
+        lambda t: t.nullable <= t.amount,
+        lambda t: t.amount.between(-5, 5),
+        lambda t: t.nullable.isnull(),
+        lambda t: t.amount.cast('decimal(10, 1)'),
+        lambda t: t.amount.cast('decimal(14, 4)'),
+        lambda t: t.quantity.cast('decimal(6, 3)'),
+        lambda t: t.unscaled.cast('decimal(10, 3)'),
+        lambda t: t.amount.cast('double'),
+        lambda t: t.amount.sum(),
+        lambda t: t.nullable.max(),
+        lambda t: t.amount.min(),
+        lambda t: t.amount.sum(where=t.quantity > 0),
+        lambda t: t.amount.mean(),
+        lambda t: t[t.amount > t.nullable],
+        lambda t: t.sort_by(['amount', 'key']).limit(10),
+        lambda t: t.group_by('key').aggregate(
+            total=t.amount.sum(),
+            most=t.nullable.max(),
+            count=t.nullable.count(),
+            mean=t.amount.mean(),
+        ),
+        lambda t: t.group_by('key').aggregate(
+            total=(t.amount * 2 - t.quantity).sum(),
+            positive=t.amount.sum(where=t.amount > 0),
+        ),
+        lambda t: t.group_by('amount').aggregate(count=t.count()),
+        lambda t: t.mutate(
+            total=t.amount.sum().over(ibis.window(group_by=t.key))
+        ),
+    ],
+)
+def test_fixed_point_does_not_change_results(t, make_expr):
+    expr = make_expr(t)
+    result = expr.execute()
+    with ibis.config.option_context('pandas.fixed_point_decimals', False):
+        expected = expr.execute()
+    if isinstance(expected, pd.DataFrame):
+        tm.assert_frame_equal(result, expected, check_dtype=False)
+    elif isinstance(expected, pd.Series):
+        tm.assert_series_equal(result, expected, check_dtype=False)
+    else:
+        assert result == expected
+
+
+def _decimals(values):
+    return [None if value is None else D(value) for value in values]
+
+
+@pytest.mark.parametrize(
+    ('make_expr', 'expected'),
+    [
+        (lambda t: -t.x, ['-1.25', None, '0.05']),
+        (lambda t: t.x.round(-1), ['0.00', None, '0.00']),
+        (lambda t: t.x.round(1), ['1.20', None, '-0.00']),
+        (lambda t: t.x.cast('decimal(6, 3)'), ['1.250', None, '-0.050']),
+        (lambda t: t.x.cast('decimal(6, 1)'), ['1.2', None, '-0.0']),
+        (lambda t: t.x * 2 + t.x, ['3.75', None, '-0.15']),
+    ],
+)
+def test_scaled_nulls(make_expr, expected):
+    df = pd.DataFrame({'x': [D('1.25'), None, D('-0.05')]})
+    t = ibis.pandas.connect({'df': df}).table(
+        'df', schema={'x': dt.Decimal(6, 2)}
+    )
+    result = make_expr(t).execute()
+    expected = _decimals(expected)
+    assert result.tolist() == expected
+    assert [
+        value.as_tuple().exponent for value in result if value is not None
+    ] == [value.as_tuple().exponent for value in expected if value is not None]
+
+
+def test_scaled_comparisons_with_nulls():
+    df = pd.DataFrame({'x': [D('1.50'), None, D('-0.05')]})
+    t = ibis.pandas.connect({'df': df}).table(
+        'df', schema={'x': dt.Decimal(6, 2)}
+    )
+    literal = ibis.literal(D('1.5'), type='decimal(6, 2)')
+    assert (t.x == literal).execute().tolist() == [True, False, False]
+    assert (t.x != literal).execute().tolist() == [False, True, True]
+    assert (t.x < 1).execute().tolist() == [False, False, True]
+    assert t.x.round().execute().fillna(-1).tolist() == [2, -1, 0]
+
+
+def test_scaled_reductions(t, df):
+    assert t.amount.sum().execute() == df.amount.sum()
+    assert t.nullable.max().execute() == df.nullable.dropna().max()
+    result = t.group_by('key').aggregate(total=t.nullable.sum()).execute()
+    expected = df.groupby('key').nullable.apply(lambda x: x.dropna().sum())
+    assert result.total.tolist() == expected.tolist()
+    assert all(isinstance(value, D) for value in result.total)
+    assert all(value.as_tuple().exponent == -2 for value in result.total)
+
+
+def test_cast_rounds_half_even(t, df):
+    expr = t.amount.cast('decimal(12, 3)').cast('decimal(12, 2)')
+    assert expr.execute().tolist() == df.amount.tolist()
+
+    expr = (t.amount.cast('decimal(12, 3)') + ibis.literal(5)).cast(
+        'decimal(12, 2)'
+    )
+    result = expr.execute()
+    assert result.tolist() == [x + 5 for x in df.amount]
+
+
+def test_cast_to_decimal_out_of_precision():
+    # values that don't fit in the precision are cast one by one
+    t = ibis.pandas.connect({'df': pd.DataFrame({'x': [1, 1000]})}).table(
+        'df'
+    )
+    result = t.x.cast('decimal(4, 2)').execute()
+    assert result.tolist() == [D('1.00'), D('1000.00')]
+
+
+def test_overflowing_sum_is_exact():
+    big = D(10) ** 17 * 9
+    df = pd.DataFrame({'x': [big] * 20})
+    client = ibis.pandas.connect({'df': df})
+    t = client.table('df', schema={'x': dt.Decimal(18, 0)})
+    assert fixed_point.is_scaled(t.x, client.table_data('df', t.schema()).x)
+    assert t.x.sum().execute() == big * 20
+    assert (t.x + t.x).execute().tolist() == [big * 2] * 20
+
+
+@pytest.mark.parametrize('how', ['inner', 'left'])
+def test_join_scaled_and_unscaled_keys(client, t, how):
+    lookup = client.table(
+        'lookup', schema={'amount': dt.Decimal(12, 2), 'id': dt.int64}
+    )
+    data = client.table_data('lookup', lookup.schema())
+    assert not fixed_point.is_scaled(lookup.amount, data.amount)
+
+    expr = t.join(lookup, t.amount == lookup.amount, how=how)[
+        t.key, lookup.id
+    ]
+    result = expr.execute()
+    with ibis.config.option_context('pandas.fixed_point_decimals', False):
+        expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
@@ -0,0 +1,145 @@
+import concurrent.futures
+import json
+import threading
+
+import pandas as pd
+import pytest
+
+import ibis
+from ibis.pandas.profile import current_profile
+
+pytestmark = pytest.mark.pandas
+
+
+@pytest.fixture
+def t():
+    df = pd.DataFrame(
+        {'key': list('abcab'), 'value': [1.0, 2.0, 3.0, 4.0, 5.0]}
+    )
+    return ibis.pandas.connect({'df': df}).table('df')
+
+
+@pytest.fixture
+def expr(t):
+    return t[t.value > 1].group_by('key').aggregate(
+        total=(t.value * 2).sum()
+    )
+
+
+def test_profile_records_operations(expr):
+    with ibis.pandas.profile() as profile:
+        expected = expr.execute()
+    assert current_profile() is None
+    assert profile.roots == [expr]
+
+    records = {record.operation: record for record in profile.records}
+    aggregation = records['Aggregation']
+    assert aggregation.parent is None
+    assert aggregation.rule == 'execute_aggregation_dataframe'
+    assert aggregation.signature == ('DataFrame',)
+    assert aggregation.rows_in == 5
+    assert aggregation.rows_out == len(expected)
+    assert aggregation.nbytes > 0
+    assert aggregation.seconds > 0
+
+    # the metrics are executed by the aggregation
+    assert records['Sum'].parent == aggregation.id
+    assert any(
+        record.from_scope and record.operation == 'PandasTable'
+        for record in profile.records
+    )
+
+
+def test_profile_reports(expr):
+    with ibis.pandas.profile() as profile:
+        expr.execute()
+
+    records = json.loads(profile.to_json())
+    assert len(records) == len(profile.records)
+    assert {'rule', 'seconds', 'rows_out', 'nbytes'} <= set(records[0])
+
+    report = profile.report(limit=2)
+    assert 'operations executed in' in report
+    assert len(report.splitlines()) == 5
+
+    stats = profile.stats()
+    aggregation = stats.loc[('Aggregation', 'execute_aggregation_dataframe')]
+    assert aggregation.calls == 1
+
+    tree = profile.tree().splitlines()
+    assert tree[0].startswith('Aggregation')
+    assert any(line.strip().startswith('Sum') for line in tree)
+
+
+def test_profile_with_threads(expr):
+    with ibis.config.option_context('pandas.num_threads', 4):
+        with ibis.pandas.profile() as profile:
+            expr.execute()
+    operations = {record.operation for record in profile.records}
+    assert 'Aggregation' in operations
+    assert 'Sum' in operations
+
+
+def test_profile_tree_shows_arguments_once(t):
+    expr = t.mutate(doubled=t.value * 2)
+    with ibis.pandas.profile() as profile:
+        expr.execute()
+    tree = profile.tree().splitlines()
+    assert tree[0].startswith('Selection')
+    tables = [line for line in tree if line.strip().startswith('PandasTable')]
+    # once as an argument of the selection, once in the nested execution
+    # of its projection
+    assert len(tables) == 2
+    assert len({len(line) - len(line.lstrip()) for line in tables}) == 2
+
+
+def test_profile_separates_own_time(expr):
+    with ibis.pandas.profile() as profile:
+        expr.execute()
+    (record,) = [
+        record
+        for record in profile.records
+        if record.operation == 'Aggregation'
+    ]
+    nested = sum(
+        child.seconds
+        for child in profile.records
+        if child.parent == record.id and not child.from_scope
+    )
+    stats = profile.stats()
+    aggregation = stats.loc[('Aggregation', 'execute_aggregation_dataframe')]
+    assert aggregation.seconds == record.seconds
+    assert aggregation.own_seconds == pytest.approx(record.seconds - nested)
+    assert (stats.own_seconds <= stats.seconds).all()
+    assert profile.report().splitlines()[2].split()[1:3] == [
+        'tottime',
+        'cumtime',
+    ]
+
+
+def test_profile_only_records_its_own_thread(t, expr):
+    started = threading.Event()
+    stop = threading.Event()
+
+    def profile_in_thread():
+        with ibis.pandas.profile() as profile:
+            started.set()
+            stop.wait(10)
+        return profile
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(profile_in_thread)
+        started.wait(10)
+        assert current_profile() is None
+        expr.execute()
+        stop.set()
+        assert future.result().records == []
+
+
+def test_profile_reports_memo_hits(t):
+    doubled = t.value * 2
+    expr = (doubled + doubled).sum()
+    with ibis.pandas.profile() as profile:
+        expr.execute()
+    assert profile.memo_hits == 1
+    assert '1 results reused from the memo' in profile.report()
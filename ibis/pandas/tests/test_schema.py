@@ -206,4 +206,40 @@ def test_apply_to_schema_with_timezone():
     tm.assert_frame_equal(expected, result)
 
 
+def test_apply_to_schema_keeps_conforming_columns():
+    df = pd.DataFrame(
+        {
+            'a': np.arange(3),
+            'b': ['x', None, 'z'],
+            'c': pd.Categorical(['x', 'y', 'x']),
+            'd': [True, None, False],
+            'e': np.random.randn(3),
+        }
+    )
+    schema = ibis.schema(
+        [
+            ('a', dt.int64),
+            ('b', dt.string),
+            ('c', dt.string),
+            ('d', dt.boolean),
+            ('e', dt.float64),
+        ]
+    )
+    columns = {name: df[name] for name in df.columns}
+    result = schema.apply_to(df)
+    assert result is df
+    for name, column in columns.items():
+        assert result[name] is column
+
+
+def test_apply_to_schema_converts_columns():
+    df = pd.DataFrame({'a': np.arange(3), 'b': [1.5, 2.0, np.nan]})
+    schema = ibis.schema([('a', dt.int32), ('b', dt.float64)])
+    b = df.b
+    result = schema.apply_to(df)
+    assert result.a.dtype == np.int32
+    assert result.a.tolist() == [0, 1, 2]
+    assert np.shares_memory(result.b.values, b.values)
+
+
 # TODO(kszucs): test_Schema_to_pandas
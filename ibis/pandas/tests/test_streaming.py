@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+import pandas.util.testing as tm
+import pytest
+
+import ibis
+from ibis.pandas.streaming import execute_streaming
+
+pytestmark = pytest.mark.pandas
+
+
+@pytest.fixture(scope='module')
+def df():
+    np.random.seed(0)
+    n = 1000
+    return pd.DataFrame(
+        {
+            'key': np.random.choice(list('abcd'), n),
+            'value': np.random.randn(n),
+            'count': np.random.randint(0, 10, n),
+            'time': pd.date_range(
+                '2019-01-01', periods=n, freq='H', tz='US/Eastern'
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope='module')
+def client(df):
+    return ibis.pandas.connect(
+        {'df': df, 'keys': pd.DataFrame({'key': list('abc'), 'id': [1, 2, 3]})}
+    )
+
+
+@pytest.fixture(scope='module')
+def t(client):
+    return client.table('df')
+
+
+def test_execute_streaming_row_chunks(t, df):
+    expr = t[t.value > 0][['key', 'time']]
+    chunks = list(execute_streaming(expr, 100))
+    assert len(chunks) == 10
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+    result = expr.execute(chunksize=100)
+    expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_streaming_column(t):
+    expr = (t.value * 2).name('double')
+    result = expr.execute(chunksize=300)
+    expected = expr.execute()
+    tm.assert_series_equal(result, expected)
+
+
+def test_execute_streaming_join(client, t):
+    keys = client.table('keys')
+    expr = t.left_join(keys, 'key')[t, keys.id]
+    assert len(list(execute_streaming(expr, 250))) == 4
+
+    result = expr.execute(chunksize=250)
+    expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('chunksize', [33, 99, 1000, 5000])
+def test_execute_streaming_grouped_aggregation(t, chunksize):
+    expr = t.group_by('key').aggregate(
+        mean=t.value.mean(),
+        var=t.value.var(),
+        std=t.value.std(how='pop'),
+        count=t.count(),
+        total=t['count'].sum(),
+        low=t.value.min(),
+        any_high=(t.value > 2).any(),
+        range=t.value.max() - t.value.min(),
+    )
+    assert len(list(execute_streaming(expr, chunksize))) == 1
+
+    result = expr.execute(chunksize=chunksize).sort_values('key')
+    expected = expr.execute().sort_values('key')
+    tm.assert_frame_equal(
+        result.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_execute_streaming_distinct_count(t, df):
+    expr = t.group_by('key').aggregate(
+        distinct=t['count'].nunique(),
+        positive=t['count'].nunique(where=t.value > 0),
+    )
+    result = expr.execute(chunksize=50).sort_values('key')
+    expected = expr.execute().sort_values('key')
+    tm.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+    expr = t.key.approx_nunique()
+    assert expr.execute(chunksize=50) == df.key.nunique()
+
+
+def test_execute_streaming_having(t):
+    expr = (
+        t.group_by('key')
+        .having(t.value.mean() > 0)
+        .aggregate(count=t.count())
+    )
+    result = expr.execute(chunksize=64).sort_values('key')
+    expected = expr.execute().sort_values('key')
+    tm.assert_frame_equal(
+        result.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_execute_streaming_scalar_reductions(t, df):
+    expr = t.value.mean() + t['count'].sum() / t.count()
+    result = expr.execute(chunksize=128)
+    expected = df.value.mean() + df['count'].sum() / len(df)
+    assert result == pytest.approx(expected)
+
+
+def test_execute_streaming_falls_back_to_memory(t):
+    expr = t.sort_by('value').limit(5)
+    result = expr.execute(chunksize=10)
+    expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_streaming_empty(t):
+    expr = t[t.value > 100].value.sum()
+    assert expr.execute(chunksize=10) == expr.execute()
+
+
+def test_execute_streaming_invalid_chunksize(t):
+    with pytest.raises(ValueError):
+        t.execute(chunksize=0)
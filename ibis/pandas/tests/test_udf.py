@@ -311,3 +311,94 @@ def test_array_return_type_reduction_window(con, t, df, qs):
     expected_raw = df.b.quantile(qs).tolist()
     expected = pd.Series([expected_raw] * len(df))
     tm.assert_series_equal(result, expected)
+
+
+@udf.reduction(input_type=[dt.double], output_type=dt.double, segmented=True)
+def segmented_sum(series, *, offsets):
+    return np.add.reduceat(series.values, offsets[:-1])
+
+
+def test_udaf_groupby_null_keys():
+    df = pd.DataFrame(
+        {
+            'a': np.arange(7, dtype=float),
+            'b': np.arange(7, dtype=float) ** 2,
+            'key': ['d', None, 'e', 'f', None, 'd', 'f'],
+        }
+    )
+    con = ibis.pandas.connect({'df': df})
+    t = con.table('df')
+    expr = t.groupby(t.key).aggregate(my_corr=my_corr(t.a, t.b))
+    result = expr.execute()
+
+    expected = (
+        df.groupby('key')
+        .apply(lambda x: x.a.corr(x.b))
+        .rename('my_corr')
+        .reset_index()
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_segmented_udaf(t, df):
+    result = segmented_sum(t.c).execute()
+    assert result == df.c.sum()
+
+
+def test_segmented_udaf_groupby(t, df):
+    expr = t.groupby(t.key).aggregate(total=segmented_sum(t.c))
+    result = expr.execute()
+    expected = df.groupby('key').c.sum().rename('total').reset_index()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_segmented_udaf_window(t, df):
+    window = ibis.trailing_window(1, order_by='b', group_by='key')
+    expr = t.mutate(rolled=segmented_sum(t.c).over(window))
+    result = expr.execute().sort_values(['key', 'b'])
+    expected = df.sort_values(['key', 'b']).assign(
+        rolled=lambda df: df.groupby('key')
+        .c.rolling(2, min_periods=1)
+        .sum()
+        .reset_index(level=0, drop=True)
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+@udf.reduction(
+    input_type=[dt.double],
+    output_type=dt.double,
+    merge=lambda left, right: (left[0] + right[0], left[1] + right[1]),
+    finalize=lambda state: state[0] / state[1],
+)
+def mergeable_mean(series):
+    return series.sum(), series.count()
+
+
+def test_mergeable_udaf(t, df):
+    result = mergeable_mean(t.c).execute()
+    assert result == df.c.mean()
+
+    expr = t.groupby(t.key).aggregate(mean=mergeable_mean(t.c))
+    result = expr.execute()
+    expected = df.groupby('key').c.mean().rename('mean').reset_index()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_mergeable_udaf_chunked(con, t, df):
+    expr = t.groupby(t.key).aggregate(mean=mergeable_mean(t.c))
+    result = con.execute(expr, chunksize=1).sort_values('key')
+    expected = df.groupby('key').c.mean().rename('mean').reset_index()
+    tm.assert_frame_equal(result.reset_index(drop=True), expected)
+
+    result = con.execute(mergeable_mean(t.c), chunksize=2)
+    assert result == pytest.approx(df.c.mean())
+
+
+def test_udaf_finalize_without_merge():
+    with pytest.raises(ValueError):
+        udf.reduction(
+            input_type=[dt.double],
+            output_type=dt.double,
+            finalize=lambda state: state,
+        )
@@ -0,0 +1,208 @@
+"""A thread pool shared by every branch of the execution of an expression.
+
+When ``ibis.options.pandas.num_threads`` is greater than one, the outermost
+call to :func:`~ibis.pandas.core.execute` starts a pool, and every execution
+nested in it, such as those of the metrics of an aggregation or of the
+projections of a selection, submits its work to the same pool.
+
+A thread that waits for a task that no thread has started yet runs it itself
+instead of blocking, so nested executions never wait for a free thread, and
+the calling thread of every execution is one of its ``num_threads`` threads.
+"""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import contextlib
+import threading
+
+import ibis
+import ibis.pandas.profile as profile
+
+_state = threading.local()
+
+
+def current_pool():
+    """Return the :class:`ExecutionPool` of the execution running in this
+    thread, or None if its operations run serially.
+    """
+    return getattr(_state, 'pool', None)
+
+
+@contextlib.contextmanager
+def execution_pool():
+    """Start a pool of ``ibis.options.pandas.num_threads`` threads for the
+    executions in this context, unless they are nested in an execution that
+    has one already.
+
+    Yields
+    ------
+    Optional[ExecutionPool]
+    """
+    pool = current_pool()
+    num_threads = ibis.options.pandas.num_threads
+    if pool is not None or num_threads <= 1:
+        yield pool
+        return
+
+    pool = _state.pool = ExecutionPool(num_threads)
+    try:
+        yield pool
+    finally:
+        _state.pool = None
+        pool.shutdown()
+
+
+class Task:
+    """A call submitted to an :class:`ExecutionPool`.
+
+    Attributes
+    ----------
+    future : concurrent.futures.Future
+    """
+
+    __slots__ = 'future', '_call'
+
+    def __init__(self, future, call):
+        self.future = future
+        self._call = call
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+    def cancel(self):
+        return self.future.cancel()
+
+    def run_unstarted(self):
+        """Run the task in the calling thread if no thread has started it.
+
+        Returns
+        -------
+        bool
+            Whether the task ran
+        """
+        if not self.future.cancel():
+            return False
+        future = concurrent.futures.Future()
+        try:
+            result = self._call()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        self.future = future
+        return True
+
+
+class ExecutionPool:
+    """The threads that execute the operations of an expression.
+
+    The threads that wait for tasks run them too, so the pool starts one
+    thread fewer than ``num_threads``.
+    """
+
+    __slots__ = ('_executor',)
+
+    def __init__(self, num_threads):
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=num_threads - 1
+        )
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def submit(self, function, *args):
+        """Submit ``function(*args)``, to run in the pool or in the thread
+        that waits for it.
+
+        Returns
+        -------
+        Task
+        """
+        state = profile.execution_state()
+
+        def call():
+            previous = current_pool()
+            _state.pool = self
+            try:
+                with profile.restore_execution_state(state):
+                    return function(*args)
+            finally:
+                _state.pool = previous
+
+        return Task(self._executor.submit(call), call)
+
+    def wait(self, tasks):
+        """Wait until at least one of `tasks` is done, running a task that no
+        thread has started in the calling thread rather than waiting.
+
+        Parameters
+        ----------
+        tasks : Iterable[Task]
+
+        Returns
+        -------
+        List[Task]
+            The tasks that are done
+        """
+        tasks = list(tasks)
+        done = [task for task in tasks if task.done()]
+        if done:
+            return done
+        for task in tasks:
+            if task.run_unstarted():
+                return [task]
+        concurrent.futures.wait(
+            [task.future for task in tasks],
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        return [task for task in tasks if task.done()]
+
+    def map(self, function, items):
+        """Compute ``function(item)`` for every item of `items`, the first one
+        in the calling thread.
+
+        Returns
+        -------
+        List[object]
+            The results, in the order of `items`
+        """
+        items = list(items)
+        if not items:
+            return []
+        tasks = [self.submit(function, item) for item in items[1:]]
+        try:
+            results = [function(items[0])]
+            pending = set(tasks)
+            while pending:
+                pending.difference_update(self.wait(pending))
+            results.extend(task.result() for task in tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return results
+
+
+def parallel_map(function, items):
+    """Compute ``function(item)`` for every item of `items`, concurrently if
+    the calling execution has an :class:`ExecutionPool`.
+
+    Parameters
+    ----------
+    function : Callable[[object], object]
+    items : Iterable[object]
+
+    Returns
+    -------
+    List[object]
+        The results, in the order of `items`
+    """
+    items = list(items)
+    pool = current_pool()
+    if pool is None or len(items) < 2:
+        return list(map(function, items))
+    return pool.map(function, items)
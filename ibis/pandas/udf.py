@@ -18,6 +18,7 @@ from pandas.core.groupby import SeriesGroupBy
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.signature as sig
+import ibis.pandas.aggcontext as agg_ctx
 from ibis.pandas.core import (
     date_types,
     time_types,
@@ -25,6 +26,7 @@ from ibis.pandas.core import (
     timestamp_types,
 )
 from ibis.pandas.dispatch import execute_node
+from ibis.pandas.partial import MergeableReduction, partial_reduction
 
 
 @functools.singledispatch
@@ -89,7 +91,7 @@ def arguments_from_signature(signature, *args, **kwargs):
     new_kwargs = {
         k: meta_kwargs[k]
         for k in remaining_parameters
-        if k in signature.parameters
+        if k in meta_kwargs
         if signature.parameters[k].kind
         in {
             Parameter.KEYWORD_ONLY,
@@ -294,6 +296,155 @@ def valid_function_signature(input_type, func):
     return funcsig
 
 
+def group_offsets(grouped):
+    """Compute a permutation that makes every group of `grouped` contiguous.
+
+    Parameters
+    ----------
+    grouped : SeriesGroupBy
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, pd.Index]
+        The positions that sort the grouped data by group, the offsets of each
+        group in the sorted data (group ``i`` occupies
+        ``offsets[i]:offsets[i + 1]``) and the group keys.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> s = pd.Series([1, 2, 3, 4])
+    >>> order, offsets, keys = group_offsets(s.groupby(list('baba')))
+    >>> order.tolist()
+    [1, 3, 0, 2]
+    >>> offsets.tolist()
+    [0, 2, 4]
+    >>> keys.tolist()
+    ['a', 'b']
+    """
+    grouper = grouped.grouper
+    codes, _, ngroups = grouper.group_info
+    codes = np.asarray(codes)
+
+    # rows with a NULL key have a code of -1 and sort first; skip them
+    order = np.argsort(codes, kind='mergesort')
+    counts = np.bincount(codes[codes >= 0], minlength=ngroups)
+    offsets = np.empty(ngroups + 1, dtype=np.int64)
+    offsets[0] = len(codes) - counts.sum()
+    np.cumsum(counts, out=offsets[1:])
+    offsets[1:] += offsets[0]
+    return order, offsets, grouper.result_index
+
+
+def aggregate_grouped(func, funcsig, args, segmented=False, **kwargs):
+    """Apply the reduction `func` to every group of `args` without iterating
+    over the groups with pandas.
+
+    The grouping keys are factorized once and every grouped argument is
+    reordered so that each group is a contiguous slice.
+
+    Parameters
+    ----------
+    func : callable
+        The user-defined reduction
+    funcsig : inspect.Signature
+        The signature of `func`
+    args : Tuple[Union[SeriesGroupBy, object], ...]
+        The arguments to the reduction. At least one must be a
+        ``SeriesGroupBy`` and all of them must share the same grouping.
+    segmented : bool
+        Whether `func` accepts the reordered data of all groups together with
+        an ``offsets`` keyword argument and returns one value per group
+    kwargs : Dict[str, object]
+
+    Returns
+    -------
+    pd.Series
+        One value per group, indexed by the grouping keys
+    """
+    grouped = [isinstance(arg, SeriesGroupBy) for arg in args]
+    first = args[grouped.index(True)]
+    order, offsets, index = group_offsets(first)
+    arguments = [
+        arg.obj.take(order) if is_grouped else arg
+        for arg, is_grouped in zip(args, grouped)
+    ]
+    _, func_kwargs = arguments_from_signature(funcsig, *args, **kwargs)
+
+    if segmented:
+        values = func(*arguments, offsets=offsets, **func_kwargs)
+    else:
+        values = [
+            func(
+                *(
+                    arg.iloc[start:stop] if is_grouped else arg
+                    for arg, is_grouped in zip(arguments, grouped)
+                ),
+                **func_kwargs,
+            )
+            for start, stop in zip(offsets[:-1], offsets[1:])
+        ]
+    return pd.Series(values, index=index, name=first.obj.name)
+
+
+def segmented_function(func):
+    """Adapt a segmented reduction to be called with a single group of data.
+
+    Parameters
+    ----------
+    func : callable
+        A reduction that takes an ``offsets`` keyword argument and returns
+        one value per group
+
+    Returns
+    -------
+    callable
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        nrows = next(
+            (len(arg) for arg in args if isinstance(arg, pd.Series)), 1
+        )
+        offsets = np.array([0, nrows], dtype=np.int64)
+        return func(*args, offsets=offsets, **kwargs)[0]
+
+    return wrapper
+
+
+def finalized_function(func, finalize, segmented=False):
+    """Compose a reduction that computes a state with the function that
+    computes its result from that state.
+
+    Parameters
+    ----------
+    func : callable
+        A reduction that returns a state, or one state per group if
+        `segmented`
+    finalize : callable
+        Compute the result of the reduction from a state
+    segmented : bool
+        Whether `func` is a segmented reduction
+
+    Returns
+    -------
+    callable
+    """
+    if segmented:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return [finalize(state) for state in func(*args, **kwargs)]
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return finalize(func(*args, **kwargs))
+
+    return wrapper
+
+
 class udf:
     @staticmethod
     def elementwise(input_type, output_type):
@@ -401,7 +552,9 @@ class udf:
         return wrapper
 
     @staticmethod
-    def reduction(input_type, output_type):
+    def reduction(
+        input_type, output_type, segmented=False, merge=None, finalize=None
+    ):
         """Define a user-defined reduction function that takes N pandas Series
         or scalar values as inputs and produces one row of output.
 
@@ -413,6 +566,21 @@ class udf:
             function. Variadic arguments are not yet supported.
         output_type : ibis.expr.datatypes.DataType
             The return type of the function.
+        segmented : bool
+            If True the function computes all groups of a grouped aggregation
+            in a single call. It receives the data of every group laid out
+            contiguously, plus a keyword-only ``offsets`` array such that
+            group ``i`` occupies ``offsets[i]:offsets[i + 1]``, and must return
+            an array-like with one value per group.
+        merge : Optional[Callable[[object, object], object]]
+            If given, the function computes the *state* of a part of the rows
+            of a group, and ``merge(left, right)`` combines the states of two
+            parts. This lets the reduction be computed over batches or
+            partitions of its input, see :mod:`ibis.pandas.partial`.
+        finalize : Optional[Callable[[object], object]]
+            Compute the value of the reduction from the state of all the rows
+            of a group. Defaults to returning the state. Only used if `merge`
+            is given.
 
         Examples
         --------
@@ -422,12 +590,33 @@ class udf:
         >>> @udf.reduction(input_type=[dt.string], output_type=dt.int64)
         ... def my_string_length_agg(series, **kwargs):
         ...     return (series.str.len() * 2).sum()
+        >>> import numpy as np
+        >>> @udf.reduction(
+        ...     input_type=[dt.double], output_type=dt.double, segmented=True
+        ... )
+        ... def my_sum(series, *, offsets):
+        ...     return np.add.reduceat(series.values, offsets[:-1])
+        >>> @udf.reduction(
+        ...     input_type=[dt.double],
+        ...     output_type=dt.double,
+        ...     merge=lambda left, right: (
+        ...         left[0] + right[0], left[1] + right[1]
+        ...     ),
+        ...     finalize=lambda state: state[0] / state[1],
+        ... )
+        ... def my_mean(series):
+        ...     return series.sum(), series.count()
         """
+        if merge is None and finalize is not None:
+            raise ValueError('finalize requires a merge function')
         return udf._grouped(
             input_type,
             output_type,
             base_class=ops.Reduction,
             output_type_method=operator.attrgetter('scalar_type'),
+            segmented=segmented,
+            merge=merge,
+            finalize=finalize,
         )
 
     @staticmethod
@@ -461,7 +650,15 @@ class udf:
         )
 
     @staticmethod
-    def _grouped(input_type, output_type, base_class, output_type_method):
+    def _grouped(
+        input_type,
+        output_type,
+        base_class,
+        output_type_method,
+        segmented=False,
+        merge=None,
+        finalize=None,
+    ):
         """Define a user-defined function that is applied per group.
 
         Parameters
@@ -477,6 +674,14 @@ class udf:
         output_type_method : Callable
             A callable that determines the method to call to get the expression
             type of the UDF
+        segmented : bool
+            Whether the function computes every group in a single call, see
+            :meth:`udf.reduction`
+        merge : Optional[Callable[[object, object], object]]
+            Merge the states that the function computes, see
+            :meth:`udf.reduction`
+        finalize : Optional[Callable[[object], object]]
+            Compute the result from a merged state, see :meth:`udf.reduction`
 
         See Also
         --------
@@ -486,11 +691,11 @@ class udf:
         input_type = list(map(dt.dtype, input_type))
         output_type = dt.dtype(output_type)
 
-        def wrapper(func):
-            funcsig = valid_function_signature(input_type, func)
+        def grouped_node(name, func, funcsig):
+            call = segmented_function(func) if segmented else func
 
             UDAFNode = type(
-                func.__name__,
+                name,
                 (base_class,),
                 {
                     'signature': sig.TypeSignature.from_dtypes(input_type),
@@ -506,7 +711,7 @@ class udf:
                 args, kwargs = arguments_from_signature(
                     funcsig, *args, **kwargs
                 )
-                return func(*args, **kwargs)
+                return call(*args, **kwargs)
 
             # An execution rule for a grouped aggregation node. This
             # includes aggregates applied over a window.
@@ -532,25 +737,51 @@ class udf:
                 # repeating it until all groups are exhausted.
                 aggcontext = kwargs.pop('aggcontext', None)
                 assert aggcontext is not None, 'aggcontext is None'
+                if isinstance(aggcontext, agg_ctx.Summarize):
+                    return aggregate_grouped(
+                        func, funcsig, args, segmented=segmented, **kwargs
+                    )
+
                 iters = (
                     (data for _, data in arg)
                     if isinstance(arg, SeriesGroupBy)
                     else itertools.repeat(arg)
                     for arg in args[1:]
                 )
-                funcsig = signature(func)
 
                 def aggregator(first, *rest, **kwargs):
                     # map(next, *rest) gets the inputs for the next group
-                    # TODO: might be inefficient to do this on every call
                     args, kwargs = arguments_from_signature(
                         funcsig, first, *map(next, rest), **kwargs
                     )
-                    return func(*args, **kwargs)
+                    return call(*args, **kwargs)
 
                 result = aggcontext.agg(args[0], aggregator, *iters, **kwargs)
                 return result
 
+            return UDAFNode
+
+        def wrapper(func):
+            funcsig = valid_function_signature(input_type, func)
+            if merge is None:
+                UDAFNode = grouped_node(func.__name__, func, funcsig)
+            else:
+                finish = toolz.identity if finalize is None else finalize
+                PartialNode = grouped_node(
+                    '{}_partial'.format(func.__name__), func, funcsig
+                )
+                UDAFNode = grouped_node(
+                    func.__name__,
+                    finalized_function(func, finish, segmented=segmented),
+                    funcsig,
+                )
+
+                @partial_reduction.register(UDAFNode)
+                def partial_reduction_udaf(op):
+                    return MergeableReduction(
+                        PartialNode(*op.args).to_expr(), merge, finish
+                    )
+
             @functools.wraps(func)
             def wrapped(*args):
                 return UDAFNode(*args).to_expr()